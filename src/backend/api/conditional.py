@@ -0,0 +1,75 @@
+"""
+Conditional GET support (ETag / If-None-Match / Last-Modified / If-Modified-Since).
+Validators are derived from a resource's updated_at, so they can be computed
+from a cached copy without loading the row.
+"""
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from src.backend.core.utils import as_utc
+
+
+def weak_etag(updated_at: datetime, parts: Optional[Iterable[str]] = None) -> str:
+    """
+    Build a weak ETag from a version timestamp.
+
+    Args:
+        updated_at: When the resource last changed
+        parts: Extra version components, e.g. one per related asset, for
+            representations that embed other rows
+
+    Returns:
+        str: The ETag, e.g. W/"5f3c2a1b9e000"
+    """
+    stamp = f"{int(as_utc(updated_at).timestamp() * 1_000_000):x}"
+    if parts is not None:
+        digest = hashlib.sha1("\n".join(sorted(parts)).encode()).hexdigest()[:16]
+        stamp = f"{stamp}-{digest}"
+    return f'W/"{stamp}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" are equivalent for If-None-Match
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(request: Request, etag: str, updated_at: datetime) -> bool:
+    """Check whether the client's cached copy is still current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-Modified-Since is ignored when If-None-Match is present
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one second resolution
+    return as_utc(updated_at).replace(microsecond=0) <= as_utc(since)
+
+
+def set_validators(response: Response, etag: str, updated_at: datetime) -> None:
+    """Attach validators; clients and proxies must revalidate before reuse."""
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = format_datetime(as_utc(updated_at), usegmt=True)
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def not_modified(etag: str, updated_at: datetime) -> Response:
+    """Build a bodiless 304 response carrying the current validators."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, updated_at)
+    return response
@@ -0,0 +1,174 @@
+"""
+Idempotency-Key support for non-idempotent endpoints.
+
+The first request carrying a key runs normally and its response is stored in
+Redis for IDEMPOTENCY_TTL seconds; repeats get the stored response back
+instead of creating (and queueing) the work again. A short Redis lock
+serializes concurrent requests with the same key, so a retry that races the
+original waits for it and then replays its response.
+
+Like the other Redis features this is best effort: without Redis, or while it
+is unreachable, requests simply run.
+"""
+
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
+
+from fastapi import Depends, Header, HTTPException, Response, status
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import LockError, RedisError
+
+from src.backend.core.config import settings
+from src.backend.core.metrics import IDEMPOTENT_REPLAYS
+from src.backend.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_PREFIX = "idempotency:"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+
+class StoredResponse(BaseModel):
+    fingerprint: str  # Hash of the request the key was first used with
+    status_code: int
+    body: str
+
+    def replay(self) -> Response:
+        return Response(
+            content=self.body,
+            status_code=self.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+
+def record_key(scope: str, key: str) -> str:
+    return f"{IDEMPOTENCY_KEY_PREFIX}{scope}:{key}"
+
+
+class Idempotency:
+    def __init__(
+        self,
+        redis: Optional["Redis[Any]"],
+        key: Optional[str],
+        ttl: int,
+        lock_timeout: float,
+        wait_timeout: float,
+    ) -> None:
+        self.redis = redis
+        self.key = key
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+
+    async def execute(
+        self,
+        scope: str,
+        request: BaseModel,
+        handler: Callable[[], Awaitable[ResultT]],
+        status_code: int = status.HTTP_200_OK,
+    ) -> Union[ResultT, Response]:
+        """
+        Run handler once per Idempotency-Key.
+
+        Args:
+            scope: Name of the operation; keys are only unique per scope
+            request: The parsed request body, to detect a key being reused
+                for a different request
+            handler: Does the work and returns the response model
+            status_code: Status the route responds with, stored for replays
+
+        Returns:
+            Union[ResultT, Response]: The handler's result, or the stored
+                response of an earlier request with the same key
+
+        Raises:
+            HTTPException: 409 if an earlier request with the key is still
+                running after wait_timeout; 422 if the key was first used with
+                a different request
+        """
+        if self.redis is None or self.key is None:
+            return await handler()
+
+        name = record_key(scope, self.key)
+        fingerprint = hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+        lock = self.redis.lock(
+            f"{name}:lock",
+            timeout=self.lock_timeout,
+            blocking_timeout=self.wait_timeout,
+        )
+        try:
+            acquired = await lock.acquire()
+        except RedisError as e:
+            logger.warning(f"Idempotency lock unavailable for {name}: {e}")
+            return await handler()
+        if not acquired:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+            )
+
+        try:
+            stored = await self._load(name)
+            if stored is not None:
+                if stored.fingerprint != fingerprint:
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail="Idempotency-Key was used for a different request",
+                    )
+                IDEMPOTENT_REPLAYS.labels(scope=scope).inc()
+                return stored.replay()
+
+            # Failures raise before anything is stored, so the client may retry
+            result = await handler()
+            await self._save(
+                name,
+                StoredResponse(
+                    fingerprint=fingerprint,
+                    status_code=status_code,
+                    body=result.model_dump_json(),
+                ),
+            )
+            return result
+        finally:
+            try:
+                await lock.release()
+            except (LockError, RedisError) as e:
+                # Expired while the handler ran; nothing left to release
+                logger.warning(f"Idempotency lock release failed for {name}: {e}")
+
+    async def _load(self, name: str) -> Optional[StoredResponse]:
+        assert self.redis is not None
+        try:
+            value = await self.redis.get(name)
+        except RedisError as e:
+            logger.warning(f"Idempotency record read failed for {name}: {e}")
+            return None
+        return StoredResponse.model_validate_json(value) if value else None
+
+    async def _save(self, name: str, stored: StoredResponse) -> None:
+        assert self.redis is not None
+        try:
+            await self.redis.set(name, stored.model_dump_json(), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Idempotency record write failed for {name}: {e}")
+
+
+def get_idempotency(
+    idempotency_key: Optional[str] = Header(
+        None, alias="Idempotency-Key", min_length=1, max_length=255
+    ),
+    redis: Optional["Redis[Any]"] = Depends(get_redis),
+) -> Idempotency:
+    """Dependency for the request's Idempotency-Key handling"""
+    return Idempotency(
+        redis,
+        idempotency_key,
+        ttl=settings.IDEMPOTENCY_TTL,
+        lock_timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT,
+        wait_timeout=settings.IDEMPOTENCY_WAIT_TIMEOUT,
+    )
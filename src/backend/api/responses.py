@@ -0,0 +1,58 @@
+"""
+JSON responses rendered by pydantic-core.
+
+FastAPI's default path validates a route's return value against its
+response_model, converts it with jsonable_encoder and then encodes it with
+json.dumps. Routes that already hold their data can return
+PydanticJSONResponse directly, which skips all of that and serializes to
+bytes in a single pass. As a default response class it also replaces
+json.dumps for content FastAPI has prepared.
+"""
+
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+
+
+@lru_cache(maxsize=None)
+def type_adapter(schema: Any) -> "TypeAdapter[Any]":
+    """Get a TypeAdapter, building its serializer only once per type."""
+    return TypeAdapter(schema)
+
+
+class PydanticJSONResponse(JSONResponse):
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        schema: Any = None,
+    ) -> None:
+        """
+        Args:
+            content: A model, or data matching `schema`, or any JSON-able value
+            schema: Type describing content, e.g. a TypedDict, so it is
+                serialized by a compiled serializer instead of by inspection
+        """
+        # Read by render(), which the base initializer calls
+        self.schema = schema
+        super().__init__(
+            content,
+            status_code,
+            dict(headers) if headers is not None else None,
+            media_type,
+            background,
+        )
+
+    def render(self, content: Any) -> bytes:
+        if self.schema is not None:
+            return type_adapter(self.schema).dump_json(content)
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return pydantic_core.to_json(content)
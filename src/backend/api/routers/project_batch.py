@@ -0,0 +1,314 @@
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from uuid import UUID
+
+from celery import group
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from kombu import Producer
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from sqlalchemy import Table, any_, bindparam, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.backend.api.idempotency import Idempotency, get_idempotency
+from src.backend.core.cache import CachedProjectStatus, ProjectCache, get_project_cache
+from src.backend.core.database import get_db
+from src.backend.core.events import publish_status_events
+from src.backend.core.redis import get_redis
+from src.backend.core.status_listener import StatusListener, get_status_listener
+from src.backend.core.utils import validation_message
+from src.backend.models.project import Project
+from src.backend.repositories.project import PROJECT_READ_COLUMNS
+from src.backend.schemas.project import (
+    ProjectBatchCreate,
+    ProjectBatchItemResult,
+    ProjectBatchResponse,
+    ProjectBatchUpdate,
+    ProjectBatchUpdateItem,
+    ProjectCreate,
+    ProjectRead,
+    ProjectStatus,
+    ProjectStatusEvent,
+    ProjectStatusLookup,
+    ProjectStatusLookupResponse,
+)
+from src.backend.tasks import celery_app
+from src.backend.tasks.project_tasks import process_project
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+logger = logging.getLogger(__name__)
+
+
+def id_is_any(ids: Sequence[UUID]) -> ColumnElement[bool]:
+    """
+    Project.id = ANY(:ids) with the IDs bound as a single array parameter, so
+    the statement text (and its prepared statement) is the same for any count.
+    """
+    ids_param = bindparam(
+        "ids", value=list(ids), type_=ARRAY(PG_UUID(as_uuid=True)), expanding=False
+    )
+    return Project.id == any_(ids_param)
+
+
+def _enqueue_processing(project_ids: Sequence[UUID]) -> str:
+    """Queue process_project for each project as one group over one producer."""
+    job = group(process_project.s(str(project_id)) for project_id in project_ids)
+    # FallbackContext is a context manager the Celery stubs don't declare
+    producer_context = cast(ContextManager[Producer], celery_app.producer_or_acquire())
+    with producer_context as producer:
+        result = job.apply_async(producer=producer)
+    return str(result.id)
+
+
+@router.post(":batch", response_model=ProjectBatchResponse)
+async def create_projects_batch(
+    batch: ProjectBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    cache: ProjectCache = Depends(get_project_cache),
+    idempotency: Idempotency = Depends(get_idempotency),
+    listener: StatusListener = Depends(get_status_listener),
+) -> Union[ProjectBatchResponse, Response]:
+    """
+    Create many projects with a single multi-row INSERT ... RETURNING.
+    Invalid items are reported in their result and do not block the others.
+    With an Idempotency-Key header, a retried batch is neither created nor
+    enqueued twice.
+    """
+    return await idempotency.execute(
+        "create_projects_batch",
+        batch,
+        lambda: _create_batch(batch, db, cache, listener),
+    )
+
+
+async def _create_batch(
+    batch: ProjectBatchCreate,
+    db: AsyncSession,
+    cache: ProjectCache,
+    listener: StatusListener,
+) -> ProjectBatchResponse:
+    results: List[ProjectBatchItemResult] = []
+    rows: List[Dict[str, Any]] = []
+    row_indexes: List[int] = []
+    for index, item in enumerate(batch.items):
+        try:
+            project = ProjectCreate.model_validate(item)
+        except ValidationError as e:
+            results.append(
+                ProjectBatchItemResult(index=index, error=validation_message(e))
+            )
+            continue
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "topic": project.topic,
+                "name": project.name,
+                "notes": project.notes,
+                "status": ProjectStatus.CREATED,
+            }
+        )
+        row_indexes.append(index)
+
+    created: List[ProjectRead] = []
+    if rows:
+        try:
+            result = await db.execute(
+                insert(Project).returning(
+                    *PROJECT_READ_COLUMNS, sort_by_parameter_order=True
+                ),
+                rows,
+            )
+            created = [ProjectRead.model_validate(row) for row in result]
+            await db.commit()
+        except OperationalError as e:
+            logger.error(f"Database error in create_projects_batch: {e}", exc_info=True)
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database connection error",
+            )
+    await cache.set_projects(created)
+    for project_read in created:
+        listener.remember(project_read.id, CachedProjectStatus.of(project_read))
+
+    results.extend(
+        ProjectBatchItemResult(index=index, project=project)
+        for index, project in zip(row_indexes, created)
+    )
+    results.sort(key=lambda r: r.index)
+    response = ProjectBatchResponse(
+        results=results, succeeded=len(created), failed=len(results) - len(created)
+    )
+
+    if batch.enqueue and created:
+        try:
+            # Publishing is blocking broker I/O; keep it off the event loop
+            response.task_group_id = await asyncio.to_thread(
+                _enqueue_processing, [project.id for project in created]
+            )
+        except Exception as e:
+            logger.error(f"Failed to enqueue batch processing: {e}", exc_info=True)
+            response.enqueue_error = "Failed to enqueue processing"
+    return response
+
+
+@router.patch(":batch", response_model=ProjectBatchResponse)
+async def update_projects_batch(
+    batch: ProjectBatchUpdate,
+    db: AsyncSession = Depends(get_db),
+    redis: Optional["Redis[Any]"] = Depends(get_redis),
+    cache: ProjectCache = Depends(get_project_cache),
+    listener: StatusListener = Depends(get_status_listener),
+) -> ProjectBatchResponse:
+    """
+    Update status and/or notes of many projects.
+    Items setting the same fields share one executemany UPDATE; the results are
+    then read back with a single column-only SELECT.
+    """
+    results: Dict[int, ProjectBatchItemResult] = {}
+    item_ids: List[Tuple[int, UUID]] = []
+    updates: Dict[UUID, Dict[str, Any]] = {}  # Later items for an ID win
+    for index, item in enumerate(batch.items):
+        try:
+            parsed = ProjectBatchUpdateItem.model_validate(item)
+        except ValidationError as e:
+            results[index] = ProjectBatchItemResult(
+                index=index, error=validation_message(e)
+            )
+            continue
+        item_ids.append((index, parsed.id))
+        values = parsed.model_dump(exclude_unset=True, exclude={"id"})
+        if values:
+            updates.setdefault(parsed.id, {}).update(values)
+
+    groups: Dict[FrozenSet[str], List[Dict[str, Any]]] = defaultdict(list)
+    for project_id, values in updates.items():
+        params = {f"b_{field}": value for field, value in values.items()}
+        groups[frozenset(values)].append({"b_id": project_id, **params})
+
+    table = cast(Table, Project.__table__)
+    try:
+        for fields, rows in groups.items():
+            await db.execute(
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values({field: bindparam(f"b_{field}") for field in fields}),
+                rows,
+            )
+        current: Dict[UUID, ProjectRead] = {}
+        if item_ids:
+            result = await db.execute(
+                select(*PROJECT_READ_COLUMNS).where(
+                    id_is_any([project_id for _, project_id in item_ids])
+                )
+            )
+            current = {row.id: ProjectRead.model_validate(row) for row in result}
+        await db.commit()
+    except OperationalError as e:
+        logger.error(f"Database error in update_projects_batch: {e}", exc_info=True)
+        await db.rollback()
+        # The updates may still have been committed
+        await cache.invalidate_projects(updates)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
+
+    for index, project_id in item_ids:
+        project = current.get(project_id)
+        results[index] = (
+            ProjectBatchItemResult(index=index, project=project)
+            if project is not None
+            else ProjectBatchItemResult(index=index, error="Project not found")
+        )
+
+    updated = [current[id_] for id_ in updates if id_ in current]
+    await cache.set_projects(updated)
+    for project in updated:
+        listener.remember(project.id, CachedProjectStatus.of(project))
+    await publish_status_events(
+        redis,
+        [
+            ProjectStatusEvent(
+                project_id=project.id,
+                status=project.status,
+                updated_at=project.updated_at,
+            )
+            for project in updated
+            if "status" in updates[project.id]
+        ],
+    )
+
+    ordered = [results[index] for index in sorted(results)]
+    succeeded = sum(1 for r in ordered if r.error is None)
+    return ProjectBatchResponse(
+        results=ordered, succeeded=succeeded, failed=len(ordered) - succeeded
+    )
+
+
+@router.post("/status:lookup", response_model=ProjectStatusLookupResponse)
+async def lookup_statuses(
+    lookup: ProjectStatusLookup,
+    db: AsyncSession = Depends(get_db),
+    cache: ProjectCache = Depends(get_project_cache),
+) -> ProjectStatusLookupResponse:
+    """
+    Get the status of many projects at once.
+    Hits come from one Redis MGET; misses are filled with one column-only query.
+    """
+    project_ids = list(dict.fromkeys(lookup.ids))
+    statuses = {
+        project_id: cached.status
+        for project_id, cached in (await cache.get_statuses(project_ids)).items()
+    }
+    misses = [project_id for project_id in project_ids if project_id not in statuses]
+    if misses:
+        try:
+            result = await db.execute(
+                select(Project.id, Project.status, Project.updated_at).where(
+                    id_is_any(misses)
+                )
+            )
+            fetched = {
+                row.id: CachedProjectStatus(
+                    status=row.status, updated_at=row.updated_at
+                )
+                for row in result
+            }
+            # Don't hold the connection while talking to Redis
+            await db.commit()
+        except OperationalError as e:
+            logger.error(f"Database error in lookup_statuses: {e}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database connection error",
+            )
+        await cache.fill_statuses(fetched)
+        statuses.update(
+            {project_id: entry.status for project_id, entry in fetched.items()}
+        )
+    return ProjectStatusLookupResponse(
+        statuses=statuses,
+        missing=[
+            project_id for project_id in project_ids if project_id not in statuses
+        ],
+    )
@@ -0,0 +1,213 @@
+import asyncio
+import contextlib
+import logging
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.core.database import get_db
+from src.backend.core.events import subscribe_status_events
+from src.backend.core.redis import get_redis
+from src.backend.core.status_listener import (
+    StatusEvents,
+    StatusListener,
+    get_status_listener,
+)
+from src.backend.core.utils import as_utc
+from src.backend.models.project import Project
+from src.backend.schemas.project import ProjectStatusEvent
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+logger = logging.getLogger(__name__)
+
+MAX_SUBSCRIPTIONS = 100
+HEARTBEAT_INTERVAL = 15.0
+
+
+async def _current_statuses(
+    db: AsyncSession, project_ids: Sequence[UUID]
+) -> List[ProjectStatusEvent]:
+    """Snapshot the current status of the subscribed projects."""
+    result = await db.execute(
+        select(Project.id, Project.status, Project.updated_at).where(
+            Project.id.in_(project_ids)
+        )
+    )
+    snapshot = [
+        ProjectStatusEvent(
+            project_id=row.id, status=row.status, updated_at=row.updated_at
+        )
+        for row in result
+    ]
+    # Return the connection to the pool; the stream may stay open for hours
+    await db.close()
+    return snapshot
+
+
+def _subscription(
+    listener: StatusListener,
+    redis: Optional["Redis[Any]"],
+    project_ids: Sequence[UUID],
+) -> Optional[AsyncContextManager[StatusEvents]]:
+    """
+    Get a subscription to the status events of the given projects, from the
+    Postgres status listener while it is connected and from Redis otherwise.
+    Returns None when neither is available.
+    """
+    if listener.connected:
+        return listener.subscribe(project_ids, HEARTBEAT_INTERVAL)
+    if redis is not None:
+        return subscribe_status_events(redis, project_ids, HEARTBEAT_INTERVAL)
+    return None
+
+
+async def _after_snapshot(
+    events: StatusEvents, snapshot: Sequence[ProjectStatusEvent]
+) -> StatusEvents:
+    """
+    Skip events the snapshot already reflects. The subscription starts before
+    the snapshot is taken, so transitions around it may arrive twice.
+    """
+    latest: Dict[UUID, Any] = {
+        event.project_id: as_utc(event.updated_at) for event in snapshot
+    }
+    async for event in events:
+        if event is not None:
+            seen = latest.get(event.project_id)
+            if seen is not None and as_utc(event.updated_at) <= seen:
+                continue
+            latest[event.project_id] = as_utc(event.updated_at)
+        yield event
+
+
+def _dedupe(project_ids: List[UUID]) -> List[UUID]:
+    unique = list(dict.fromkeys(project_ids))
+    if len(unique) > MAX_SUBSCRIPTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {MAX_SUBSCRIPTIONS} projects per subscription",
+        )
+    return unique
+
+
+@router.get("/status/stream")
+async def stream_status(
+    request: Request,
+    ids: List[UUID] = Query(..., min_length=1),
+    db: AsyncSession = Depends(get_db),
+    redis: Optional["Redis[Any]"] = Depends(get_redis),
+    listener: StatusListener = Depends(get_status_listener),
+) -> StreamingResponse:
+    """
+    Server-sent events stream of status transitions for one or many projects.
+    Sends the current status of each project first, then every transition.
+    """
+    project_ids = _dedupe(ids)
+    subscription = _subscription(listener, redis, project_ids)
+    unavailable = HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Status stream unavailable",
+    )
+    if subscription is None:
+        raise unavailable
+    # Subscribe before the snapshot, so no transition falls between the two
+    stack = contextlib.AsyncExitStack()
+    try:
+        events = await stack.enter_async_context(subscription)
+    except RedisError as e:
+        logger.warning(f"Failed to subscribe to status events: {e}")
+        raise unavailable
+    try:
+        snapshot = await _current_statuses(db, project_ids)
+    except OperationalError as e:
+        await stack.aclose()
+        logger.error(f"Database error in stream_status: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
+
+    async def event_source() -> AsyncGenerator[str, None]:
+        async with stack:
+            for current in snapshot:
+                yield f"event: status\ndata: {current.model_dump_json()}\n\n"
+            async for event in _after_snapshot(events, snapshot):
+                if await request.is_disconnected():
+                    break
+                if event is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield f"event: status\ndata: {event.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/status/ws")
+async def status_websocket(
+    websocket: WebSocket,
+    ids: List[UUID] = Query(..., min_length=1),
+    db: AsyncSession = Depends(get_db),
+    redis: Optional["Redis[Any]"] = Depends(get_redis),
+    listener: StatusListener = Depends(get_status_listener),
+) -> None:
+    """WebSocket variant of the status stream; sends one JSON event per message."""
+    project_ids = list(dict.fromkeys(ids))
+    subscription = None
+    if len(project_ids) <= MAX_SUBSCRIPTIONS:
+        subscription = _subscription(listener, redis, project_ids)
+    if subscription is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+
+    async def wait_for_disconnect() -> None:
+        # Clients never send anything; this only returns once they go away
+        with contextlib.suppress(WebSocketDisconnect):
+            while True:
+                await websocket.receive_text()
+
+    disconnected = asyncio.create_task(wait_for_disconnect())
+    try:
+        # Subscribe before the snapshot, so no transition falls between the two
+        async with subscription as events:
+            snapshot = await _current_statuses(db, project_ids)
+            for current in snapshot:
+                await websocket.send_text(current.model_dump_json())
+            async for event in _after_snapshot(events, snapshot):
+                if disconnected.done():
+                    break
+                if event is not None:
+                    await websocket.send_text(event.model_dump_json())
+    except (WebSocketDisconnect, OperationalError, RedisError) as e:
+        logger.info(f"Status websocket closed: {e}")
+    finally:
+        disconnected.cancel()
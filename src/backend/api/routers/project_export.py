@@ -0,0 +1,161 @@
+import csv
+import io
+import logging
+import zlib
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, List, Optional, Sequence, Type
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.core.database import get_db
+from src.backend.models.asset import Asset
+from src.backend.models.project import Project
+from src.backend.repositories.project import PROJECT_READ_COLUMNS, ProjectFilters
+from src.backend.schemas.asset import Asset as AssetRead
+from src.backend.schemas.project import ProjectRead, ProjectStatus
+
+# Registered ahead of the projects router, whose /{project_id} would
+# otherwise match /projects/export
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per server-side cursor round trip, and written per chunk
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ExportResource(str, Enum):
+    PROJECTS = "projects"
+    ASSETS = "assets"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+ASSET_COLUMNS = tuple(getattr(Asset, field) for field in AssetRead.model_fields)
+
+
+def _export_query(resource: ExportResource, filters: ProjectFilters) -> Select[Any]:
+    if resource == ExportResource.ASSETS:
+        query = select(*ASSET_COLUMNS).join(Project, Asset.project_id == Project.id)
+        order_by = (Asset.created_at, Asset.id)
+    else:
+        query = select(*PROJECT_READ_COLUMNS)
+        order_by = (Project.created_at, Project.id)
+    return filters.apply(query).order_by(*order_by)
+
+
+def _format_rows(
+    rows: Sequence[Any], schema: Type[BaseModel], export_format: ExportFormat
+) -> str:
+    """Serialize one batch of rows the way the API serializes single items."""
+    items = [schema.model_validate(row) for row in rows]
+    if export_format == ExportFormat.NDJSON:
+        return "".join(f"{item.model_dump_json()}\n" for item in items)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for item in items:
+        writer.writerow(
+            "" if value is None else value
+            for value in item.model_dump(mode="json").values()
+        )
+    return buffer.getvalue()
+
+
+async def _export_chunks(
+    db: AsyncSession,
+    query: Select[Any],
+    schema: Type[BaseModel],
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the query through a server-side cursor, one encoded chunk per batch,
+    so memory use does not depend on the number of rows.
+    """
+    if export_format == ExportFormat.CSV:
+        header = io.StringIO()
+        csv.writer(header).writerow(schema.model_fields)
+        yield header.getvalue().encode()
+    try:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield _format_rows(rows, schema, export_format).encode()
+    except OperationalError as e:
+        # Headers are already sent; all we can do is cut the stream short
+        logger.error(f"Database error in export_projects: {e}", exc_info=True)
+        raise
+    finally:
+        await db.close()
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _accepts_gzip(request: Request) -> bool:
+    accept_encoding = request.headers.get("accept-encoding", "")
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00")
+    return False
+
+
+@router.get("/export")
+async def export_projects(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    resource: ExportResource = Query(ExportResource.PROJECTS),
+    status_filter: Optional[List[ProjectStatus]] = Query(None, alias="status"),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    topic_prefix: Optional[str] = Query(None, min_length=1),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Export projects, or the assets of matching projects, as NDJSON or CSV.
+    Takes the same filters as the project listing. Rows are streamed in
+    (created_at, id) order, gzip-compressed if the client accepts it.
+    """
+    filters = ProjectFilters(
+        statuses=status_filter or (),
+        created_after=created_after,
+        created_before=created_before,
+        topic_prefix=topic_prefix,
+    )
+    schema: Type[BaseModel]
+    if resource == ExportResource.ASSETS:
+        schema = AssetRead
+    else:
+        schema = ProjectRead
+    chunks = _export_chunks(db, _export_query(resource, filters), schema, export_format)
+    headers = {
+        "Content-Disposition": (
+            f'attachment; filename="{resource.value}.{export_format.value}"'
+        ),
+        "Vary": "Accept-Encoding",
+    }
+    if _accepts_gzip(request):
+        chunks = _gzip(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        chunks, media_type=MEDIA_TYPES[export_format], headers=headers
+    )
@@ -0,0 +1,57 @@
+import io
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.core.database import get_db
+from src.backend.repositories.project_import import (
+    ImportFileError,
+    ImportFormat,
+    ProjectImporter,
+)
+from src.backend.schemas.project import ProjectImportResponse
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+logger = logging.getLogger(__name__)
+
+
+@router.post(":import", response_model=ProjectImportResponse)
+async def import_projects(
+    file: UploadFile = File(...),
+    import_format: Optional[ImportFormat] = Query(
+        None, alias="format", description="csv or jsonl; defaults to the extension"
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> ProjectImportResponse:
+    """
+    Create a project for every valid row of an uploaded CSV or JSONL file.
+    Rows take the ProjectCreate fields (topic, name, notes). Invalid rows are
+    reported with their line number and do not block the others.
+    """
+    import_format = import_format or ImportFormat.from_filename(file.filename)
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Unknown file format; pass format=csv or format=jsonl",
+        )
+    # The upload is spooled to a temporary file, which is read row by row
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return await ProjectImporter(db).run(stream, import_format)
+    except ImportFileError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+    except OperationalError as e:
+        logger.error(f"Database error in import_projects: {e}", exc_info=True)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
+    finally:
+        stream.detach()
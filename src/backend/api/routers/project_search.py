@@ -0,0 +1,71 @@
+import logging
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import OperationalError
+
+from src.backend.api.responses import PydanticJSONResponse
+from src.backend.core.pagination import (
+    InvalidCursorError,
+    decode_rank_cursor,
+    encode_rank_cursor,
+)
+from src.backend.repositories.project import (
+    ProjectRepository,
+    get_read_project_repository,
+)
+from src.backend.schemas.project import ProjectSearchPage, ProjectSearchResult
+
+# Registered ahead of the projects router, whose /{project_id} would
+# otherwise match /projects/search
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[float, UUID]]:
+    if not cursor:
+        return None
+    try:
+        return decode_rank_cursor(cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid cursor",
+        )
+
+
+@router.get("/search", response_model=ProjectSearchPage)
+async def search_projects(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of previous page"),
+    repository: ProjectRepository = Depends(get_read_project_repository),
+) -> Response:
+    """
+    Search projects by topic, name and notes, best match first.
+    Supports web search syntax ("exact phrase", OR, -word) and tolerates typos
+    in the topic. Pass the returned next_cursor back as `cursor` to fetch the
+    next page.
+    """
+    try:
+        rows, has_more = await repository.search(q, limit, _decode_cursor(cursor))
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_rank_cursor(last.rank, last.id)
+        page = ProjectSearchPage(
+            items=[ProjectSearchResult.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+        )
+        return PydanticJSONResponse(page)
+    except OperationalError as e:
+        logger.error(f"Database error in search_projects: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
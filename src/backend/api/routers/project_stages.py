@@ -0,0 +1,180 @@
+import asyncio
+import logging
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from redis.asyncio import Redis
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.api.responses import PydanticJSONResponse
+from src.backend.api.routers.projects import validate_uuid
+from src.backend.core.cache import CachedProjectStatus, ProjectCache, get_project_cache
+from src.backend.core.database import get_db
+from src.backend.core.events import publish_status
+from src.backend.core.redis import get_redis
+from src.backend.core.status_listener import StatusListener, get_status_listener
+from src.backend.models.project import Project
+from src.backend.models.project_stage import ProjectStage
+from src.backend.repositories.project import (
+    PROJECT_READ_COLUMNS,
+    ProjectRepository,
+    get_read_project_repository,
+)
+from src.backend.repositories.project_stage import (
+    ProjectStageRepository,
+    get_read_project_stage_repository,
+)
+from src.backend.schemas.project import ProjectRead, ProjectStatus
+from src.backend.schemas.stage import (
+    PipelineStage,
+    ProjectResumeResponse,
+    ProjectStageRead,
+    StageStatus,
+)
+from src.backend.tasks.project_tasks import process_project
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+logger = logging.getLogger(__name__)
+
+
+@router.get("/{project_id}/stages", response_model=List[ProjectStageRead])
+async def list_project_stages(
+    project_id: str,
+    stages: ProjectStageRepository = Depends(get_read_project_stage_repository),
+    projects: ProjectRepository = Depends(get_read_project_repository),
+) -> Response:
+    """
+    List the pipeline stages of a project in pipeline order, with their
+    status. Empty until the project's pipeline has been started.
+    """
+    try:
+        project_uuid = validate_uuid(project_id)
+        rows = await stages.list(project_uuid)
+        # No stages may mean there is no such project
+        if not rows and await projects.get_asset_counts(project_uuid) is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return PydanticJSONResponse(
+            [ProjectStageRead.model_validate(row) for row in rows],
+            schema=List[ProjectStageRead],
+        )
+    except OperationalError as e:
+        logger.error(f"Database error in list_project_stages: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
+
+
+@router.post(
+    "/{project_id}/resume",
+    response_model=ProjectResumeResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_project(
+    project_id: str,
+    db: AsyncSession = Depends(get_db),
+    redis: Optional["Redis[Any]"] = Depends(get_redis),
+    cache: ProjectCache = Depends(get_project_cache),
+    listener: StatusListener = Depends(get_status_listener),
+) -> ProjectResumeResponse:
+    """
+    Rerun the pipeline of a project that failed. Completed stages are skipped
+    unless their inputs changed, so only the failed stages and what depends
+    on them run again. Returns 409 unless the project is in ERROR, or while
+    stages of its failed run are still running, as they would run twice.
+    """
+    try:
+        project_uuid = validate_uuid(project_id)
+        stage_running = (
+            select(ProjectStage.stage)
+            .where(
+                ProjectStage.project_id == project_uuid,
+                ProjectStage.status == StageStatus.RUNNING,
+            )
+            .exists()
+        )
+        # Claiming the project in one statement keeps concurrent resumes from
+        # both enqueueing it
+        result = await db.execute(
+            update(Project)
+            .where(
+                Project.id == project_uuid,
+                Project.status == ProjectStatus.ERROR,
+                ~stage_running,
+            )
+            .values(status=ProjectStatus.PROCESSING)
+            .returning(*PROJECT_READ_COLUMNS)
+        )
+        row = result.one_or_none()
+        if row is None:
+            current = await db.scalar(
+                select(Project.status).where(Project.id == project_uuid)
+            )
+            if current is None:
+                raise HTTPException(status_code=404, detail="Project not found")
+            if current != ProjectStatus.ERROR:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Only projects in ERROR can be resumed",
+                )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Stages of the failed run are still running",
+            )
+        project_read = ProjectRead.model_validate(row)
+        completed = [
+            PipelineStage(stage.stage)
+            for stage in await ProjectStageRepository(db).list(project_uuid)
+            if stage.status == StageStatus.COMPLETED
+        ]
+        await db.commit()
+        await _announce(project_read, redis, cache, listener)
+
+        try:
+            # Publishing is blocking broker I/O; keep it off the event loop
+            task = await asyncio.to_thread(process_project.delay, str(project_uuid))
+        except Exception as e:
+            logger.error(f"Failed to enqueue resumed project: {e}", exc_info=True)
+            # Leave the project resumable
+            result = await db.execute(
+                update(Project)
+                .where(Project.id == project_uuid)
+                .values(status=ProjectStatus.ERROR)
+                .returning(*PROJECT_READ_COLUMNS)
+            )
+            project_read = ProjectRead.model_validate(result.one())
+            await db.commit()
+            await _announce(project_read, redis, cache, listener)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Failed to enqueue processing",
+            )
+        return ProjectResumeResponse(
+            project_id=project_uuid,
+            task_id=str(task.id),
+            completed_stages=completed,
+        )
+    except OperationalError as e:
+        logger.error(f"Database error in resume_project: {e}", exc_info=True)
+        await db.rollback()
+        # The status change may still have been committed
+        await cache.invalidate(project_uuid)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
+
+
+async def _announce(
+    project: ProjectRead,
+    redis: Optional["Redis[Any]"],
+    cache: ProjectCache,
+    listener: StatusListener,
+) -> None:
+    await cache.set_project(project)
+    # Reads in this process see the write before its notification arrives
+    listener.remember(project.id, CachedProjectStatus.of(project))
+    await publish_status(redis, project.id, project.status, project.updated_at)
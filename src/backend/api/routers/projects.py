@@ -1,26 +1,63 @@
+import asyncio
 import logging
 import uuid
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from redis.asyncio import Redis
+from sqlalchemy import Executable, insert, select, update
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.backend.api.conditional import (
+    is_not_modified,
+    not_modified,
+    set_validators,
+    weak_etag,
+)
+from src.backend.api.idempotency import Idempotency, get_idempotency
+from src.backend.api.responses import PydanticJSONResponse
+from src.backend.core.cache import CachedProjectStatus, ProjectCache, get_project_cache
 from src.backend.core.database import get_db
+from src.backend.core.events import publish_status
+from src.backend.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.backend.core.redis import get_redis
+from src.backend.core.status_listener import StatusListener, get_status_listener
 from src.backend.models.project import Project
+from src.backend.repositories.project import (
+    FULL,
+    PROJECT_READ_COLUMNS,
+    AssetFilters,
+    LoadProfile,
+    ProjectFilters,
+    ProjectRepository,
+    get_read_project_repository,
+)
+from src.backend.schemas.asset import Asset as AssetRead
+from src.backend.schemas.asset import AssetCounts, AssetPage, AssetType
 from src.backend.schemas.project import (
     ProjectCreate,
+    ProjectPage,
+    ProjectPageData,
     ProjectRead,
     ProjectStatus,
     ProjectStatusResponse,
     ProjectUpdate,
+    ProjectView,
+    ProjectViewData,
 )
 from src.backend.tasks.project_tasks import celery_debug_task as test_task
 from src.backend.tasks.project_tasks import redis_interaction_test, test_broker_settings
+from src.backend.tasks.results import await_result
 
-router = APIRouter(prefix="/projects", tags=["projects"])
+router = APIRouter(
+    prefix="/projects",
+    tags=["projects"],
+    default_response_class=PydanticJSONResponse,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +70,13 @@ async def test_redis_broker() -> Dict[str, Any]:
     """
     try:
         result = test_broker_settings.delay()
-        return result.get(timeout=10)  # Wait for results
+        broker_result: Dict[str, Any] = await await_result(result, timeout=10)
+        return broker_result
+    except CeleryTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Timed out waiting for task result",
+        )
     except OperationalError as e:
         logger.error(f"Database error in test_redis_broker: {e}", exc_info=True)
         raise HTTPException(
@@ -50,13 +93,22 @@ async def run_test_tasks() -> Dict[str, str]:
     try:
         redis_test = redis_interaction_test.delay()
         task_test = test_task.delay(2, 2)
+        # Wait for both concurrently, up to 10 seconds
+        redis_result, task_result = await asyncio.gather(
+            await_result(redis_test, timeout=10), await_result(task_test, timeout=10)
+        )
 
         return {
             "redis_interaction_test": redis_test.id,
             "test_task": task_test.id,
-            "redis_result": redis_test.get(timeout=10),  # Wait up to 10 seconds
-            "task_result": str(task_test.get(timeout=10)),
+            "redis_result": redis_result,
+            "task_result": str(task_result),
         }
+    except CeleryTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Timed out waiting for task result",
+        )
     except OperationalError as e:
         logger.error(f"Database error in run_test_tasks: {e}", exc_info=True)
         raise HTTPException(
@@ -67,27 +119,47 @@ async def run_test_tasks() -> Dict[str, str]:
 
 @router.post("/", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
 async def create_project(
-    project: ProjectCreate, db: AsyncSession = Depends(get_db)
-) -> ProjectRead:
-    try:
-        db_project = Project(
-            id=uuid.uuid4(),
-            topic=project.topic,
-            name=project.name,
-            notes=project.notes,
-            status=ProjectStatus.CREATED,
-        )
-        db.add(db_project)
-        await db.commit()
-        await db.refresh(db_project)
-        return ProjectRead.model_validate(db_project)
-    except OperationalError as e:
-        logger.error(f"Database error in create_project: {e}", exc_info=True)
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database connection error",
-        )
+    project: ProjectCreate,
+    db: AsyncSession = Depends(get_db),
+    cache: ProjectCache = Depends(get_project_cache),
+    idempotency: Idempotency = Depends(get_idempotency),
+    listener: StatusListener = Depends(get_status_listener),
+) -> Union[ProjectRead, Response]:
+    """
+    Create a project.
+    Send an Idempotency-Key header to make retries safe: repeats with the same
+    key get the original response instead of a second project.
+    """
+
+    async def create() -> ProjectRead:
+        try:
+            result = await db.execute(
+                insert(Project)
+                .values(
+                    id=uuid.uuid4(),
+                    topic=project.topic,
+                    name=project.name,
+                    notes=project.notes,
+                    status=ProjectStatus.CREATED,
+                )
+                .returning(*PROJECT_READ_COLUMNS)
+            )
+            project_read = ProjectRead.model_validate(result.one())
+            await db.commit()
+            await cache.set_project(project_read)
+            listener.remember(project_read.id, CachedProjectStatus.of(project_read))
+            return project_read
+        except OperationalError as e:
+            logger.error(f"Database error in create_project: {e}", exc_info=True)
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Database connection error",
+            )
+
+    return await idempotency.execute(
+        "create_project", project, create, status.HTTP_201_CREATED
+    )
 
 
 def validate_uuid(id_str: str) -> UUID:
@@ -101,19 +173,62 @@ def validate_uuid(id_str: str) -> UUID:
         )
 
 
+async def _fetch_project(
+    repository: ProjectRepository, project_id: UUID
+) -> ProjectRead:
+    """Load a project's ProjectRead columns, without its assets."""
+    db_project = await repository.get(project_id, FULL)
+    if db_project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return ProjectRead.model_validate(db_project)
+
+
+def _load_profile(fields: Optional[str], include: Optional[str]) -> LoadProfile:
+    try:
+        return LoadProfile.parse(fields, include)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+
+
+FIELDS_QUERY = Query(
+    None,
+    description="Comma-separated fields to return, e.g. id,status,topic",
+)
+INCLUDE_QUERY = Query(None, description="Related data to embed: assets")
+
+
 @router.get("/{project_id}/status", response_model=ProjectStatusResponse)
 async def get_status(
-    project_id: str, db: AsyncSession = Depends(get_db)
-) -> ProjectStatusResponse:
-    """Get project status by ID."""
+    project_id: str,
+    request: Request,
+    response: Response,
+    repository: ProjectRepository = Depends(get_read_project_repository),
+    cache: ProjectCache = Depends(get_project_cache),
+    listener: StatusListener = Depends(get_status_listener),
+) -> Union[ProjectStatusResponse, Response]:
+    """
+    Get project status by ID.
+    Answered from the status listener's memory when possible, then from the
+    cache; a hit is revalidated without Postgres. Supports conditional requests.
+    """
     try:
         # Validate UUID format
         project_uuid = validate_uuid(project_id)
-        result = await db.execute(select(Project).filter(Project.id == project_uuid))
-        db_project = result.scalar_one_or_none()
-        if not db_project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        return ProjectStatusResponse(status=db_project.status)
+        cached = listener.get(project_uuid) or await cache.get_status(project_uuid)
+        if cached is None:
+            project_read = await _fetch_project(repository, project_uuid)
+            await cache.set_project(project_read, only_if_missing=True)
+            cached = CachedProjectStatus.of(project_read)
+            # Kept fresh by notifications from here on
+            listener.remember(project_uuid, cached)
+
+        etag = weak_etag(cached.updated_at)
+        if is_not_modified(request, etag, cached.updated_at):
+            return not_modified(etag, cached.updated_at)
+        set_validators(response, etag, cached.updated_at)
+        return ProjectStatusResponse(status=cached.status)
     except OperationalError as e:
         logger.error(f"Database error in get_status: {e}", exc_info=True)
         raise HTTPException(
@@ -122,19 +237,47 @@ async def get_status(
         )
 
 
-@router.get("/{project_id}", response_model=ProjectRead)
+@router.get("/{project_id}", response_model=ProjectView)
 async def get_project(
-    project_id: str, db: AsyncSession = Depends(get_db)
-) -> ProjectRead:
-    """Get project by ID."""
+    project_id: str,
+    request: Request,
+    fields: Optional[str] = FIELDS_QUERY,
+    include: Optional[str] = INCLUDE_QUERY,
+    repository: ProjectRepository = Depends(get_read_project_repository),
+    cache: ProjectCache = Depends(get_project_cache),
+) -> Response:
+    """
+    Get project by ID, optionally only some `fields` and with `include=assets`.
+    Supports conditional requests; a cache hit is revalidated without Postgres.
+    """
     try:
         # Validate UUID format
         project_uuid = validate_uuid(project_id)
-        result = await db.execute(select(Project).filter(Project.id == project_uuid))
-        db_project = result.scalar_one_or_none()
-        if not db_project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        return ProjectRead.model_validate(db_project)
+        load = _load_profile(fields, include)
+        # The cache holds whole projects without assets
+        source: Union[Project, ProjectRead, None] = None
+        if not load.assets:
+            source = await cache.get_project(project_uuid)
+        if source is None and cache.enabled and not load.assets:
+            source = await _fetch_project(repository, project_uuid)
+            await cache.set_project(source, only_if_missing=True)
+        elif source is None:
+            # updated_at is always needed for the validators
+            source = await repository.get(project_uuid, load.with_fields("updated_at"))
+            if source is None:
+                raise HTTPException(status_code=404, detail="Project not found")
+
+        asset_versions = None
+        if load.assets and isinstance(source, Project):
+            asset_versions = [
+                f"{asset.id}:{asset.updated_at.isoformat()}" for asset in source.assets
+            ]
+        etag = weak_etag(source.updated_at, asset_versions)
+        if is_not_modified(request, etag, source.updated_at):
+            return not_modified(etag, source.updated_at)
+        response = PydanticJSONResponse(load.render(source), schema=ProjectViewData)
+        set_validators(response, etag, source.updated_at)
+        return response
     except OperationalError as e:
         logger.error(f"Database error in get_project: {e}", exc_info=True)
         raise HTTPException(
@@ -143,12 +286,120 @@ async def get_project(
         )
 
 
-@router.get("/", response_model=List[ProjectRead])
-async def list_projects(db: AsyncSession = Depends(get_db)) -> List[ProjectRead]:
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    if not cursor:
+        return None
     try:
-        result = await db.execute(select(Project))
-        projects = result.scalars().all()
-        return [ProjectRead.model_validate(p) for p in projects]
+        return decode_cursor(cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid cursor",
+        )
+
+
+@router.get("/{project_id}/assets", response_model=AssetPage)
+async def list_project_assets(
+    project_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of previous page"),
+    asset_type: Optional[List[AssetType]] = Query(None),
+    approved: Optional[bool] = Query(None),
+    repository: ProjectRepository = Depends(get_read_project_repository),
+) -> Response:
+    """
+    List a project's assets oldest first using keyset pagination on
+    (created_at, id). Pass the returned next_cursor back as `cursor` to fetch
+    the next page.
+    """
+    try:
+        project_uuid = validate_uuid(project_id)
+        filters = AssetFilters(asset_types=asset_type or (), approved=approved)
+        assets, has_more = await repository.list_assets(
+            project_uuid, filters, limit, _decode_cursor(cursor)
+        )
+        # An empty first page may mean there is no such project
+        if not assets and not cursor:
+            if await repository.get_asset_counts(project_uuid) is None:
+                raise HTTPException(status_code=404, detail="Project not found")
+
+        next_cursor = None
+        if has_more:
+            last = assets[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        page = AssetPage(
+            items=[AssetRead.model_validate(asset) for asset in assets],
+            next_cursor=next_cursor,
+        )
+        return PydanticJSONResponse(page)
+    except OperationalError as e:
+        logger.error(f"Database error in list_project_assets: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
+
+
+@router.get("/{project_id}/assets/counts", response_model=AssetCounts)
+async def get_asset_counts(
+    project_id: str,
+    repository: ProjectRepository = Depends(get_read_project_repository),
+) -> AssetCounts:
+    """Get a project's number of assets per asset_type, without reading assets."""
+    try:
+        project_uuid = validate_uuid(project_id)
+        counts = await repository.get_asset_counts(project_uuid)
+        if counts is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return AssetCounts(counts=counts)
+    except OperationalError as e:
+        logger.error(f"Database error in get_asset_counts: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database connection error",
+        )
+
+
+@router.get("/", response_model=ProjectPage)
+async def list_projects(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of previous page"),
+    status_filter: Optional[List[ProjectStatus]] = Query(None, alias="status"),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    topic_prefix: Optional[str] = Query(None, min_length=1),
+    fields: Optional[str] = FIELDS_QUERY,
+    include: Optional[str] = INCLUDE_QUERY,
+    repository: ProjectRepository = Depends(get_read_project_repository),
+) -> Response:
+    """
+    List projects newest first using keyset pagination on (created_at, id).
+    Pass the returned next_cursor back as `cursor` to fetch the next page.
+    """
+    try:
+        load = _load_profile(fields, include)
+        after = _decode_cursor(cursor)
+        filters = ProjectFilters(
+            statuses=status_filter or (),
+            created_after=created_after,
+            created_before=created_before,
+            topic_prefix=topic_prefix,
+        )
+        projects, has_more = await repository.list_page(load, filters, limit, after)
+
+        next_cursor = None
+        if has_more:
+            last = projects[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        page = ProjectPageData(
+            items=[load.render(p) for p in projects], next_cursor=next_cursor
+        )
+        # Serialized straight from the rows, skipping response_model checks
+        return PydanticJSONResponse(page, schema=ProjectPageData)
     except OperationalError as e:
         logger.error(f"Database error in list_projects: {e}", exc_info=True)
         raise HTTPException(
@@ -159,27 +410,52 @@ async def list_projects(db: AsyncSession = Depends(get_db)) -> List[ProjectRead]
 
 @router.patch("/{project_id}", response_model=ProjectRead)
 async def update_project(
-    project_id: str, project_update: ProjectUpdate, db: AsyncSession = Depends(get_db)
+    project_id: str,
+    project_update: ProjectUpdate,
+    db: AsyncSession = Depends(get_db),
+    redis: Optional["Redis[Any]"] = Depends(get_redis),
+    cache: ProjectCache = Depends(get_project_cache),
+    listener: StatusListener = Depends(get_status_listener),
 ) -> ProjectRead:
     """Update project by ID."""
     try:
         # Validate UUID format
         project_uuid = validate_uuid(project_id)
-        result = await db.execute(select(Project).filter(Project.id == project_uuid))
-        db_project = result.scalar_one_or_none()
-        if not db_project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
         update_data = project_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_project, field, value)
-
+        query: Executable
+        if update_data:
+            # Single UPDATE ... RETURNING instead of SELECT, flush and refresh
+            query = (
+                update(Project)
+                .where(Project.id == project_uuid)
+                .values(**update_data)
+                .returning(*PROJECT_READ_COLUMNS)
+            )
+        else:
+            # Nothing to change; don't bump updated_at
+            query = select(*PROJECT_READ_COLUMNS).where(Project.id == project_uuid)
+        result = await db.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            # Don't keep serving a project that is gone
+            await cache.invalidate(project_uuid)
+            raise HTTPException(status_code=404, detail="Project not found")
+        project_read = ProjectRead.model_validate(row)
         await db.commit()
-        await db.refresh(db_project)
-        return ProjectRead.model_validate(db_project)
+
+        await cache.set_project(project_read)
+        # Reads in this process see the write before its notification arrives
+        listener.remember(project_read.id, CachedProjectStatus.of(project_read))
+        if "status" in update_data:
+            await publish_status(
+                redis, project_read.id, project_read.status, project_read.updated_at
+            )
+        return project_read
     except OperationalError as e:
         logger.error(f"Database error in update_project: {e}", exc_info=True)
         await db.rollback()
+        # The update may still have been committed
+        await cache.invalidate(project_uuid)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database connection error",
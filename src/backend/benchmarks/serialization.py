@@ -0,0 +1,98 @@
+"""
+Micro-benchmark for serializing project pages.
+
+Compares FastAPI's default response path (a validated model per row, then
+response_model validation, jsonable_encoder and json.dumps) with the
+PydanticJSONResponse path used by the projects router.
+
+Usage:
+    python -m src.backend.benchmarks.serialization [--repeat N]
+"""
+
+import argparse
+import asyncio
+import timeit
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.backend.api.responses import PydanticJSONResponse
+from src.backend.models.project import Project
+from src.backend.repositories.project import FULL, PROJECT_FIELDS
+from src.backend.schemas.project import (
+    ProjectPage,
+    ProjectPageData,
+    ProjectStatus,
+    ProjectView,
+)
+
+SIZES = (1, 100, 10_000)
+
+PAGE_FIELD = create_response_field(name="response", type_=ProjectPage)
+
+# serialize_response is a coroutine; reuse one loop so its setup isn't timed
+LOOP = asyncio.new_event_loop()
+
+
+def make_projects(count: int) -> List[Project]:
+    now = datetime.now(timezone.utc)
+    return [
+        Project(
+            id=uuid.uuid4(),
+            topic=f"Topic {i}",
+            notes="Some notes" if i % 2 else None,
+            name=None,
+            status=ProjectStatus.COMPLETED,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def default_path(projects: List[Project]) -> bytes:
+    page = ProjectPage(
+        items=[
+            ProjectView(**{name: getattr(p, name) for name in PROJECT_FIELDS})
+            for p in projects
+        ],
+        next_cursor=None,
+    )
+    content = LOOP.run_until_complete(
+        serialize_response(field=PAGE_FIELD, response_content=page, exclude_unset=True)
+    )
+    return JSONResponse(content).body
+
+
+def fast_path(projects: List[Project]) -> bytes:
+    page = ProjectPageData(items=[FULL.render(p) for p in projects], next_cursor=None)
+    return PydanticJSONResponse(page, schema=ProjectPageData).body
+
+
+def per_item_us(
+    func: Callable[[List[Project]], bytes], size: int, repeat: int
+) -> float:
+    projects = make_projects(size)
+    number = max(1, 10_000 // size)
+    best = min(timeit.repeat(lambda: func(projects), number=number, repeat=repeat))
+    return best / number / size * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'items':>7} {'default us/item':>16} {'fast us/item':>13} {'speedup':>8}")
+    for size in SIZES:
+        default = per_item_us(default_path, size, args.repeat)
+        fast = per_item_us(fast_path, size, args.repeat)
+        print(f"{size:>7} {default:>16.2f} {fast:>13.2f} {default / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 # src/backend/celeryconfig.py
 import logging
+import os
+
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables from .env file
@@ -29,6 +31,17 @@ enable_utc = True
 worker_prefetch_multiplier = 1
 worker_max_tasks_per_child = 10
 
+# Asyncio worker mode: one process runs up to CELERY_ASYNC_CONCURRENCY tasks
+# at once on a shared event loop (see tasks/runtime.py). Meant for workers
+# consuming I/O-bound @async_task tasks; prefork stays the default.
+if os.getenv("CELERY_WORKER_MODE") == "asyncio":
+    worker_pool = "src.backend.tasks.runtime:AsyncioTaskPool"
+    worker_concurrency = int(os.getenv("CELERY_ASYNC_CONCURRENCY", "100"))
+
+# Imported by workers at startup; serves their metrics when
+# CELERY_METRICS_PORT is set (see tasks/worker_metrics.py)
+imports = ["src.backend.tasks.worker_metrics"]
+
 # Task routing and queue settings
 task_default_queue = "default"
 task_queues = {
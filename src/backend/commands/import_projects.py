@@ -0,0 +1,61 @@
+"""
+Import project ideas from a CSV or JSONL file.
+
+Every valid row becomes a CREATED project; invalid rows are listed on stderr
+with their line number. Exits with status 1 if any row was rejected.
+
+Usage:
+    python -m src.backend.commands.import_projects FILE [--format csv|jsonl]
+        [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from src.backend.core.database import AsyncSessionLocal, engine
+from src.backend.repositories.project_import import (
+    IMPORT_BATCH_SIZE,
+    ImportFormat,
+    ProjectImporter,
+)
+from src.backend.schemas.project import ProjectImportResponse
+
+
+async def run(
+    path: str, import_format: ImportFormat, batch_size: int
+) -> ProjectImportResponse:
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            async with AsyncSessionLocal() as db:
+                return await ProjectImporter(db, batch_size).run(stream, import_format)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat])
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    import_format = (
+        ImportFormat(args.format)
+        if args.format
+        else ImportFormat.from_filename(args.file)
+    )
+    if import_format is None:
+        parser.error("cannot tell the format from the file name; pass --format")
+    result = asyncio.run(run(args.file, import_format, args.batch_size))
+
+    for reject in result.rejects:
+        print(f"line {reject.line}: {reject.error}", file=sys.stderr)
+    if result.rejected > len(result.rejects):
+        print(f"... {result.rejected - len(result.rejects)} more", file=sys.stderr)
+    print(f"Imported {result.imported} projects, rejected {result.rejected} rows")
+    sys.exit(1 if result.rejected else 0)
+
+
+if __name__ == "__main__":
+    main()
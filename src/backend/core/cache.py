@@ -0,0 +1,213 @@
+"""
+Redis read-through cache for project reads.
+Entries are keyed by project ID and hold the serialized API responses, so a
+hit is answered without touching Postgres. Writers refresh entries
+explicitly, or invalidate them when they cannot tell what was committed; the
+TTL only bounds staleness if a refresh is lost.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Type, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.backend.schemas.project import ProjectRead, ProjectStatusResponse
+
+from .config import settings
+from .metrics import (
+    PROJECT_CACHE_ERRORS,
+    PROJECT_CACHE_EVICTIONS,
+    PROJECT_CACHE_HITS,
+    PROJECT_CACHE_MISSES,
+)
+from .redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+PROJECT_KEY_PREFIX = "cache:project:"
+STATUS_KEY_PREFIX = "cache:project_status:"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def project_key(project_id: UUID | str) -> str:
+    return f"{PROJECT_KEY_PREFIX}{project_id}"
+
+
+def status_key(project_id: UUID | str) -> str:
+    return f"{STATUS_KEY_PREFIX}{project_id}"
+
+
+class CachedProjectStatus(ProjectStatusResponse):
+    """
+    A cached status together with the project's updated_at, which serves as
+    its version stamp for conditional requests.
+    """
+
+    updated_at: datetime
+
+    @classmethod
+    def of(cls, project: ProjectRead) -> "CachedProjectStatus":
+        return cls(status=project.status, updated_at=project.updated_at)
+
+
+def _parse(model: Type[ModelT], value: Optional[str]) -> Optional[ModelT]:
+    if value is None:
+        return None
+    try:
+        return model.model_validate_json(value)
+    except ValidationError:
+        # Written by an older release with a different layout; refill it
+        return None
+
+
+class ProjectCache:
+    """
+    Cache of ProjectRead and ProjectStatusResponse bodies.
+    Every operation is a no-op when Redis is not configured, and Redis errors
+    are logged and treated as misses so the database remains the fallback.
+    """
+
+    def __init__(self, redis: Optional["Redis[Any]"], ttl: int) -> None:
+        self.redis = redis
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    async def _get(self, key: str, kind: str) -> Optional[str]:
+        if self.redis is None:
+            return None
+        try:
+            value: Optional[str] = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Project cache read failed for {key}: {e}")
+            PROJECT_CACHE_ERRORS.labels(operation="get").inc()
+            return None
+        if value is None:
+            PROJECT_CACHE_MISSES.labels(kind=kind).inc()
+        else:
+            PROJECT_CACHE_HITS.labels(kind=kind).inc()
+        return value
+
+    async def get_project(self, project_id: UUID) -> Optional[ProjectRead]:
+        cached = await self._get(project_key(project_id), "project")
+        return _parse(ProjectRead, cached)
+
+    async def get_status(self, project_id: UUID) -> Optional[CachedProjectStatus]:
+        cached = await self._get(status_key(project_id), "status")
+        return _parse(CachedProjectStatus, cached)
+
+    async def get_statuses(
+        self, project_ids: Sequence[UUID]
+    ) -> Dict[UUID, CachedProjectStatus]:
+        """Look up many statuses with one MGET; misses are left out."""
+        if self.redis is None or not project_ids:
+            return {}
+        try:
+            values = await self.redis.mget([status_key(id_) for id_ in project_ids])
+        except RedisError as e:
+            logger.warning(f"Project cache multi-read failed: {e}")
+            PROJECT_CACHE_ERRORS.labels(operation="mget").inc()
+            return {}
+        parsed = {
+            id_: _parse(CachedProjectStatus, value)
+            for id_, value in zip(project_ids, values)
+        }
+        found = {id_: entry for id_, entry in parsed.items() if entry is not None}
+        PROJECT_CACHE_HITS.labels(kind="status").inc(len(found))
+        PROJECT_CACHE_MISSES.labels(kind="status").inc(len(project_ids) - len(found))
+        return found
+
+    async def fill_statuses(self, statuses: Mapping[UUID, CachedProjectStatus]) -> None:
+        """Store statuses read on a miss, without overwriting fresher entries."""
+        if self.redis is None or not statuses:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for project_id, status in statuses.items():
+                    pipe.set(
+                        status_key(project_id),
+                        status.model_dump_json(),
+                        ex=self.ttl,
+                        nx=True,
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Project cache write failed: {e}")
+            PROJECT_CACHE_ERRORS.labels(operation="set").inc()
+
+    async def set_project(
+        self, project: ProjectRead, only_if_missing: bool = False
+    ) -> None:
+        """
+        Store a project and its status.
+
+        Args:
+            project: The current state of the project
+            only_if_missing: Set when filling on a read miss, so a fill racing
+                with a write never overwrites the fresher value the write stored
+        """
+        await self.set_projects([project], only_if_missing)
+
+    async def set_projects(
+        self, projects: Iterable[ProjectRead], only_if_missing: bool = False
+    ) -> None:
+        """Store several projects and their statuses in one pipeline."""
+        if self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for project in projects:
+                    status = CachedProjectStatus.of(project)
+                    pipe.set(
+                        project_key(project.id),
+                        project.model_dump_json(),
+                        ex=self.ttl,
+                        nx=only_if_missing,
+                    )
+                    pipe.set(
+                        status_key(project.id),
+                        status.model_dump_json(),
+                        ex=self.ttl,
+                        nx=only_if_missing,
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Project cache write failed: {e}")
+            PROJECT_CACHE_ERRORS.labels(operation="set").inc()
+
+    async def invalidate(self, project_id: UUID | str) -> None:
+        """Drop all cached entries for a project."""
+        await self.invalidate_projects([project_id])
+
+    async def invalidate_projects(self, project_ids: Iterable[UUID | str]) -> None:
+        """
+        Drop the cached entries of several projects in one pipeline, so the
+        next reads go to the database. Used where a write's outcome is unknown.
+        """
+        if self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for project_id in project_ids:
+                    pipe.delete(project_key(project_id))
+                    pipe.delete(status_key(project_id))
+                deleted = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Project cache invalidation failed: {e}")
+            PROJECT_CACHE_ERRORS.labels(operation="invalidate").inc()
+            return
+        # Results alternate between project and status keys
+        PROJECT_CACHE_EVICTIONS.labels(kind="project").inc(sum(deleted[0::2]))
+        PROJECT_CACHE_EVICTIONS.labels(kind="status").inc(sum(deleted[1::2]))
+
+
+def get_project_cache() -> ProjectCache:
+    """Dependency for getting the project cache"""
+    return ProjectCache(get_redis(), settings.PROJECT_CACHE_TTL)
@@ -11,11 +11,40 @@ class Settings(BaseSettings):
         default="postgresql+asyncpg://tom:@127.0.0.1:5432/content_platform"
     )
     TEST_DATABASE_URL: str = Field(default="")
+    # Engine profile: dev, test, prod or pgbouncer (see core/database.py).
+    # The DB_* settings below override the profile when set.
+    DB_PROFILE: str = "dev"
+    DB_ECHO: Optional[bool] = None
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None  # asyncpg; 0 disables it
+    DB_QUERY_TIMING: bool = False  # Per-statement latency histogram
+    DB_SLOW_QUERY_MS: Optional[float] = None  # Log statements slower than this
+    # Comma-separated read replica URLs; empty sends reads to the primary
+    DATABASE_READ_URL: str = Field(default="")
+    DB_REPLICA_HEALTH_INTERVAL: float = 5  # Seconds between replica checks
+    DB_REPLICA_RETRY_INTERVAL: float = 30  # Seconds a failed replica is skipped
+    READ_YOUR_WRITES_TTL: int = 5  # Seconds reads stay on the primary after a write
     REDIS_URL: Optional[str] = None
     REDIS_PASSWORD: Optional[str] = None
+    PROJECT_CACHE_TTL: int = 300  # Seconds; bounds staleness if a refresh is lost
+    IDEMPOTENCY_TTL: int = 86400  # Seconds a response is replayed for its key
+    IDEMPOTENCY_LOCK_TIMEOUT: int = 30  # Seconds before a crashed holder's lock expires
+    IDEMPOTENCY_WAIT_TIMEOUT: int = 10  # Seconds a repeat waits for the first request
+    # LISTEN for project_status notifications. Needs a direct connection:
+    # defaults to DATABASE_URL, and must be set under the pgbouncer profile
+    STATUS_LISTENER_ENABLED: bool = True
+    STATUS_LISTENER_URL: str = Field(default="")
+    STATUS_MAP_SIZE: int = 100000  # Project statuses kept in memory per process
+    STATUS_MAP_TTL: int = 300  # Seconds a status is kept without a notification
 
     CELERY_BROKER_URL: str = Field(default="redis://redis:6379/0")
     CELERY_RESULT_BACKEND: str = Field(default="redis://redis:6379/0")
+    CELERY_BROKER_HEALTH_TTL: float = 10  # Seconds a broker PING is trusted by tasks
+    CELERY_BROKER_RETRY_INTERVAL: float = 5  # Seconds tasks fail fast after a failure
+    CELERY_METRICS_PORT: Optional[int] = None  # Workers serve /metrics on this port
     CLERK_SECRET_KEY: Optional[str] = None
     HEYGEN_API_KEY: Optional[str] = None
 
@@ -1,18 +1,207 @@
-from typing import AsyncGenerator
+"""
+Database engine and session setup.
+Engines are built by create_engine_from_settings from a named profile
+(DB_PROFILE) that individual DB_* settings can override.
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+Writes go to the primary `engine`. Read-only routes use get_read_db, which
+spreads reads over the DATABASE_READ_URL replicas when any are configured.
+"""
 
-from .config import settings
+import asyncio
+import itertools
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncGenerator, Dict, List, Optional, Type, cast
 
-# Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True,  # Set to False in production
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
+from fastapi import Depends, Request, Response
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+from .config import Settings, settings
+from .metrics import (
+    DB_CONNECTION_AGE,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_PRIMARY_READS,
+    DB_REPLICA_HEALTHY,
+)
+from .query_timing import instrument_queries
+
+logger = logging.getLogger(__name__)
+
+# Raised by asyncpg and SQLAlchemy when a server cannot be reached
+CONNECTION_ERRORS = (DBAPIError, OSError, asyncio.TimeoutError)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited."""
+
+    engine_name = "primary"
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(engine=self.engine_name).observe(
+                time.perf_counter() - start
+            )
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    echo: bool = False
+    pooled: bool = True
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = False
+    connect_args: Dict[str, Any] = field(default_factory=dict)
+
+
+ENGINE_PROFILES: Dict[str, EngineProfile] = {
+    "dev": EngineProfile(),
+    # A fresh connection per checkout, so nothing outlives a test's event loop
+    "test": EngineProfile(pooled=False),
+    "prod": EngineProfile(pool_size=10, max_overflow=20, pool_pre_ping=True),
+    # PgBouncer in transaction mode owns pooling, and a server connection may
+    # serve a different client on every transaction: prepared statements must
+    # neither be cached nor reuse names across connections
+    "pgbouncer": EngineProfile(
+        pooled=False,
+        connect_args={
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        },
+    ),
+}
+
+
+def resolve_profile(config: Settings) -> EngineProfile:
+    """Get the configured profile with the individual DB_* overrides applied."""
+    try:
+        profile = ENGINE_PROFILES[config.DB_PROFILE]
+    except KeyError:
+        raise ValueError(
+            f"Unknown DB_PROFILE {config.DB_PROFILE!r}; "
+            f"expected one of {', '.join(ENGINE_PROFILES)}"
+        )
+    overrides: Dict[str, Any] = {
+        "echo": config.DB_ECHO,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+    }
+    profile = replace(
+        profile, **{key: value for key, value in overrides.items() if value is not None}
+    )
+    if config.DB_STATEMENT_CACHE_SIZE is not None:
+        profile = replace(
+            profile,
+            connect_args={
+                **profile.connect_args,
+                "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            },
+        )
+    return profile
+
+
+def instrument_engine(async_engine: AsyncEngine, name: str) -> None:
+    """Export pool occupancy gauges and a connection age histogram."""
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine.pool, "connect")
+    def on_connect(dbapi_connection: Any, record: Any) -> None:
+        record.info["connected_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine.pool, "checkout")
+    def on_checkout(dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        connected_at = record.info.get("connected_at")
+        if connected_at is not None:
+            DB_CONNECTION_AGE.labels(engine=name).observe(
+                time.monotonic() - connected_at
+            )
+
+    if not isinstance(sync_engine.pool, AsyncAdaptedQueuePool):
+        return  # NullPool holds no connections to report on
+
+    # Read through the engine: dispose() swaps in a new pool
+    def queue_pool() -> AsyncAdaptedQueuePool:
+        return cast(AsyncAdaptedQueuePool, sync_engine.pool)
+
+    DB_POOL_SIZE.labels(engine=name).set_function(lambda: queue_pool().size())
+    DB_POOL_CHECKED_OUT.labels(engine=name).set_function(
+        lambda: queue_pool().checkedout()
+    )
+    # overflow() starts at -pool_size; only connections beyond it count
+    DB_POOL_OVERFLOW.labels(engine=name).set_function(
+        lambda: max(queue_pool().overflow(), 0)
+    )
+
+
+def create_engine_from_settings(
+    config: Settings = settings, url: Optional[str] = None, name: str = "primary"
+) -> AsyncEngine:
+    """
+    Create an async engine for the configured profile.
+
+    Args:
+        config: Settings providing DB_PROFILE and the DB_* overrides
+        url: Database URL; defaults to config.DATABASE_URL
+        name: Engine label for the pool and statement metrics
+    """
+    profile = resolve_profile(config)
+    pool_args: Dict[str, Any]
+    if profile.pooled:
+        pool_class: Type[Pool] = type(
+            "InstrumentedQueuePool", (InstrumentedQueuePool,), {"engine_name": name}
+        )
+        pool_args = {
+            "poolclass": pool_class,
+            "pool_size": profile.pool_size,
+            "max_overflow": profile.max_overflow,
+            "pool_timeout": profile.pool_timeout,
+            "pool_recycle": profile.pool_recycle,
+            "pool_pre_ping": profile.pool_pre_ping,
+        }
+    else:
+        pool_args = {"poolclass": NullPool}
+    async_engine = create_async_engine(
+        url or config.DATABASE_URL,
+        echo=profile.echo,
+        connect_args=profile.connect_args,
+        **pool_args,
+    )
+    instrument_engine(async_engine, name)
+    if config.DB_QUERY_TIMING or config.DB_SLOW_QUERY_MS is not None:
+        instrument_queries(
+            async_engine.sync_engine,
+            name,
+            histogram=config.DB_QUERY_TIMING,
+            slow_threshold=(
+                config.DB_SLOW_QUERY_MS / 1000
+                if config.DB_SLOW_QUERY_MS is not None
+                else None
+            ),
+        )
+    return async_engine
+
+
+engine = create_engine_from_settings()
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -31,3 +220,151 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+class ReplicaSet:
+    """
+    Read replicas used in round-robin order.
+    A replica that fails to connect, or fails a health check, is skipped for
+    retry_interval seconds; a passing health check brings it back early.
+    """
+
+    def __init__(self, engines: Dict[str, AsyncEngine], retry_interval: float) -> None:
+        """
+        Args:
+            engines: Replica engines by name, the name labelling their metrics
+            retry_interval: Seconds a failed replica is skipped
+        """
+        self.names = list(engines)
+        self.engines = list(engines.values())
+        self.retry_interval = retry_interval
+        self._down_until = [0.0] * len(self.engines)
+        self._turn = itertools.count()
+        for name in self.names:
+            DB_REPLICA_HEALTHY.labels(engine=name).set(1)
+
+    def _name(self, replica: AsyncEngine) -> str:
+        return self.names[self.engines.index(replica)]
+
+    def candidates(self) -> List[AsyncEngine]:
+        """Get the healthy replicas, starting with the one whose turn it is."""
+        start = next(self._turn) % len(self.engines)
+        now = time.monotonic()
+        return [
+            self.engines[i % len(self.engines)]
+            for i in range(start, start + len(self.engines))
+            if self._down_until[i % len(self.engines)] <= now
+        ]
+
+    def mark_down(self, replica: AsyncEngine) -> None:
+        self._down_until[self.engines.index(replica)] = (
+            time.monotonic() + self.retry_interval
+        )
+        DB_REPLICA_HEALTHY.labels(engine=self._name(replica)).set(0)
+
+    def mark_up(self, replica: AsyncEngine) -> None:
+        self._down_until[self.engines.index(replica)] = 0.0
+        DB_REPLICA_HEALTHY.labels(engine=self._name(replica)).set(1)
+
+    async def check(self, timeout: float = 2.0) -> None:
+        """Run SELECT 1 against every replica and update its state."""
+
+        async def check_one(replica: AsyncEngine) -> None:
+            try:
+                async with replica.connect() as connection:
+                    await asyncio.wait_for(
+                        connection.execute(text("SELECT 1")), timeout
+                    )
+            except CONNECTION_ERRORS as e:
+                logger.warning(f"Read replica {self._name(replica)} unhealthy: {e}")
+                self.mark_down(replica)
+            else:
+                self.mark_up(replica)
+
+        await asyncio.gather(*(check_one(replica) for replica in self.engines))
+
+    async def run_health_checks(self, interval: float) -> None:
+        """Check the replicas every interval seconds until cancelled."""
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        for replica in self.engines:
+            await replica.dispose()
+
+
+def create_replica_set(config: Settings = settings) -> Optional[ReplicaSet]:
+    """Create engines for the DATABASE_READ_URL replicas, if any."""
+    urls = [url.strip() for url in config.DATABASE_READ_URL.split(",") if url.strip()]
+    if not urls:
+        return None
+    names = [f"replica-{i}" for i in range(len(urls))]
+    return ReplicaSet(
+        {
+            name: create_engine_from_settings(config, url, name)
+            for name, url in zip(names, urls)
+        },
+        retry_interval=config.DB_REPLICA_RETRY_INTERVAL,
+    )
+
+
+replicas = create_replica_set()
+
+# Set on responses to writes; while it is valid the client's reads go to the
+# primary, so it sees its own writes despite replication lag
+PRIMARY_READS_COOKIE = "primary_reads_until"
+
+
+def pin_reads_to_primary(response: Response) -> None:
+    """Send the client's reads to the primary for READ_YOUR_WRITES_TTL seconds."""
+    if replicas is None:
+        return
+    response.set_cookie(
+        PRIMARY_READS_COOKIE,
+        str(int(time.time()) + settings.READ_YOUR_WRITES_TTL),
+        max_age=settings.READ_YOUR_WRITES_TTL,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def reads_pinned_to_primary(request: Request) -> bool:
+    try:
+        until = int(request.cookies.get(PRIMARY_READS_COOKIE, "0"))
+    except ValueError:
+        return False
+    return until > time.time()
+
+
+async def get_read_db(
+    request: Request, primary: AsyncSession = Depends(get_db)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for a session for read-only work.
+    Uses the next healthy replica, or the primary session if there are no
+    replicas, none is reachable, or the client has just written.
+    """
+    # Sessions connect lazily, so an unused primary session costs nothing
+    if replicas is not None:
+        if reads_pinned_to_primary(request):
+            DB_PRIMARY_READS.labels(reason="read_your_writes").inc()
+            yield primary
+            return
+        for replica in replicas.candidates():
+            session = AsyncSessionLocal(bind=replica)
+            try:
+                # Connect now, so an unreachable replica can be skipped
+                await session.connection()
+            except CONNECTION_ERRORS as e:
+                logger.warning(f"Read replica unavailable, trying the next: {e}")
+                await session.close()
+                replicas.mark_down(replica)
+                continue
+            try:
+                yield session
+            finally:
+                await session.close()
+            return
+        DB_PRIMARY_READS.labels(reason="no_replica").inc()
+    yield primary
@@ -0,0 +1,101 @@
+"""
+Project status change events fanned out through Redis pub/sub.
+Writers publish each transition on a per-project channel; any API replica can
+then serve subscribers for any project.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncGenerator, AsyncIterator, Iterable, Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from src.backend.schemas.project import ProjectStatus, ProjectStatusEvent
+
+from .redis import aclose
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL_PREFIX = "project_status:"
+
+
+def status_channel(project_id: UUID | str) -> str:
+    """Get the pub/sub channel carrying status events for a project."""
+    return f"{STATUS_CHANNEL_PREFIX}{project_id}"
+
+
+async def publish_status(
+    redis: Optional["Redis[Any]"],
+    project_id: UUID | str,
+    status: ProjectStatus,
+    updated_at: datetime,
+) -> None:
+    """
+    Publish a status transition.
+    Publishing is best effort: failures are logged and never raised, so a Redis
+    outage cannot fail the database write that caused the transition.
+    """
+    event = ProjectStatusEvent(
+        project_id=UUID(str(project_id)), status=status, updated_at=updated_at
+    )
+    await publish_status_events(redis, [event])
+
+
+async def publish_status_events(
+    redis: Optional["Redis[Any]"], events: Iterable[ProjectStatusEvent]
+) -> None:
+    """Publish several status transitions in one pipeline, best effort."""
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.publish(status_channel(event.project_id), event.model_dump_json())
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to publish status events: {e}")
+
+
+@asynccontextmanager
+async def subscribe_status_events(
+    redis: "Redis[Any]",
+    project_ids: Iterable[UUID],
+    heartbeat_interval: float = 15.0,
+) -> AsyncIterator[AsyncGenerator[Optional[ProjectStatusEvent], None]]:
+    """
+    Subscribe to status events for the given projects.
+
+    The subscription is active once this is entered, so a snapshot taken
+    afterwards cannot miss a transition. The iterator yields each event as it
+    is published, and None whenever heartbeat_interval seconds pass without one
+    so callers can keep idle connections alive.
+    """
+    pubsub = redis.pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(*(status_channel(id_) for id_ in project_ids))
+    messages = _iter_messages(pubsub, heartbeat_interval)
+    try:
+        yield messages
+    finally:
+        await messages.aclose()
+        await pubsub.unsubscribe()
+        await aclose(pubsub)
+
+
+async def _iter_messages(
+    pubsub: PubSub, heartbeat_interval: float
+) -> AsyncGenerator[Optional[ProjectStatusEvent], None]:
+    loop = asyncio.get_running_loop()
+    last_sent = loop.time()
+    while True:
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        if message is not None and message["type"] == "message":
+            yield ProjectStatusEvent.model_validate_json(message["data"])
+            last_sent = loop.time()
+        elif loop.time() - last_sent >= heartbeat_interval:
+            yield None
+            last_sent = loop.time()
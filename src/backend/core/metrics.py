@@ -0,0 +1,109 @@
+"""
+Application-level Prometheus metrics.
+Metrics are registered on the default registry, which the Instrumentator
+already exposes on /metrics. Celery workers serve those they record
+themselves (see tasks/worker_metrics.py).
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+PROJECT_CACHE_HITS = Counter(
+    "project_cache_hits",
+    "Project cache lookups answered from Redis",
+    ["kind"],
+)
+PROJECT_CACHE_MISSES = Counter(
+    "project_cache_misses",
+    "Project cache lookups that fell through to the database",
+    ["kind"],
+)
+PROJECT_CACHE_EVICTIONS = Counter(
+    "project_cache_evictions",
+    "Project cache entries removed by explicit invalidation",
+    ["kind"],
+)
+PROJECT_CACHE_ERRORS = Counter(
+    "project_cache_errors",
+    "Project cache operations that failed because Redis was unavailable",
+    ["operation"],
+)
+PIPELINE_STAGES_SKIPPED = Counter(
+    "pipeline_stages_skipped",
+    "Pipeline stages not run because their checkpoint was still valid",
+    ["stage"],
+)
+IDEMPOTENT_REPLAYS = Counter(
+    "idempotent_replays",
+    "Requests answered with the stored response of an earlier Idempotency-Key",
+    ["scope"],
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Connections the pool keeps open",
+    ["engine"],
+    # Pool gauges are summed over the processes of a multiprocess worker
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Pool connections currently checked out",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pool connection, including connecting",
+    ["engine"],
+    buckets=(
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+        30,
+    ),
+)
+DB_CONNECTION_AGE = Histogram(
+    "db_connection_age_seconds",
+    "Age of database connections when checked out",
+    ["engine"],
+    buckets=(1, 10, 60, 300, 600, 1200, 1800, 3600),
+)
+DB_REPLICA_HEALTHY = Gauge(
+    "db_replica_healthy",
+    "Whether a read replica is currently used for reads (1) or skipped (0)",
+    ["engine"],
+    multiprocess_mode="liveall",
+)
+DB_PRIMARY_READS = Counter(
+    "db_primary_reads",
+    "Reads sent to the primary although replicas are configured",
+    ["reason"],
+)
+SQL_STATEMENT_DURATION = Histogram(
+    "sql_statement_duration_seconds",
+    "Time from sending a statement to its cursor being ready",
+    ["engine", "fingerprint", "origin"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+TASK_PREFLIGHT_DURATION = Histogram(
+    "celery_task_preflight_seconds",
+    "Time a task spent checking the broker before running",
+    ["task", "check"],
+    buckets=(0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5),
+)
@@ -0,0 +1,73 @@
+"""
+Keyset (cursor) pagination helpers.
+Cursors are opaque, URL-safe tokens that encode the sort key of the last row
+of a page, so fetching the next page costs the same regardless of its depth.
+Listings sort on (created_at, id); search results sort on (rank, id).
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+def _encode(key: Any, id_: UUID) -> str:
+    payload = json.dumps([key, str(id_)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Tuple[Any, UUID]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    key, id_ = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    return key, UUID(id_)
+
+
+def encode_cursor(created_at: datetime, id_: UUID) -> str:
+    """Encode a (created_at, id) sort key into an opaque cursor token."""
+    return _encode(created_at.isoformat(), id_)
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor token
+
+    Returns:
+        Tuple[datetime, UUID]: The (created_at, id) sort key of the last row
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        created_at, id_ = _decode(cursor)
+        return datetime.fromisoformat(created_at), id_
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def encode_rank_cursor(rank: float, id_: UUID) -> str:
+    """Encode a (rank, id) sort key of a search result into a cursor token."""
+    return _encode(rank, id_)
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    """
+    Decode a cursor token produced by encode_rank_cursor.
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        rank, id_ = _decode(cursor)
+        if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+            raise TypeError(f"Rank must be a number, not {rank!r}")
+        return float(rank), id_
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
@@ -0,0 +1,130 @@
+"""
+Per-statement SQL timing and slow-query log.
+Every statement is timed from before_cursor_execute to after_cursor_execute
+and recorded in a histogram labelled by engine, statement fingerprint and
+origin: the API route or Celery task that ran it. Statements slower than
+DB_SLOW_QUERY_MS are logged to the sql.slow logger with the same fields as
+structured extras.
+
+Fingerprints hash the statement with its literals, bind markers and list
+lengths normalized away, so a statement shape keeps one label however it is
+called. Nothing is hooked unless DB_QUERY_TIMING or DB_SLOW_QUERY_MS is set.
+Statements run by Celery tasks are exported by the worker's own metrics
+endpoint (see tasks/worker_metrics.py), not by the API's /metrics.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.requests import HTTPConnection
+
+from .metrics import SQL_STATEMENT_DURATION
+
+slow_query_logger = logging.getLogger("sql.slow")
+
+# Route path or task name to attribute statements to
+query_origin: ContextVar[str] = ContextVar("query_origin", default="unknown")
+
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_MARKERS = re.compile(r"\$\d+|%\(\w+\)s|(?<![:\w]):\w+")
+_WHITESPACE = re.compile(r"\s+")
+# The rows of a multi-row VALUES, and IN (?, ?, ?), whatever their length
+_REPEATED_GROUPS = re.compile(r"(\([^()]*\))(?:, \1)+")
+_IN_LISTS = re.compile(r"\bIN \((\?[^,()]*)(?:, \?[^,()]*)*\)", re.IGNORECASE)
+
+_START_TIMES = "query_timing_start"
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> Tuple[str, str]:
+    """
+    Get the fingerprint and normalized text of a statement.
+
+    Returns:
+        Tuple[str, str]: A short hash of the normalized statement, and the
+            normalized statement itself
+    """
+    normalized = _STRINGS.sub("?", statement)
+    normalized = _BIND_MARKERS.sub("?", normalized)
+    normalized = _NUMBERS.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _REPEATED_GROUPS.sub(r"\1, ...", normalized)
+    normalized = _IN_LISTS.sub(r"IN (\1, ...)", normalized)
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def instrument_queries(
+    sync_engine: Engine,
+    name: str,
+    histogram: bool,
+    slow_threshold: Optional[float],
+) -> None:
+    """
+    Time every statement run through an engine.
+
+    Args:
+        sync_engine: The engine, or the sync_engine of an AsyncEngine
+        name: Engine label for the histogram
+        histogram: Whether to record the latency histogram
+        slow_threshold: Seconds after which a statement is logged as slow;
+            None disables the slow-query log
+    """
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        # A stack, as a statement may run inside another's execution
+        conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info[_START_TIMES].pop()
+        fingerprint_id, normalized = fingerprint(statement)
+        origin = query_origin.get()
+        if histogram:
+            SQL_STATEMENT_DURATION.labels(
+                engine=name, fingerprint=fingerprint_id, origin=origin
+            ).observe(elapsed)
+        if slow_threshold is not None and elapsed >= slow_threshold:
+            duration_ms = round(elapsed * 1000, 1)
+            slow_query_logger.warning(
+                f"Slow query {fingerprint_id} took {duration_ms} ms in {origin}: "
+                f"{normalized}",
+                extra={
+                    "engine": name,
+                    "fingerprint": fingerprint_id,
+                    "statement": normalized,
+                    "duration_ms": duration_ms,
+                    "origin": origin,
+                    "executemany": executemany,
+                },
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context: Any) -> None:
+        # after_cursor_execute does not run for a failed statement
+        conn = context.connection
+        if conn is not None and conn.info.get(_START_TIMES):
+            conn.info[_START_TIMES].pop()
+
+
+async def record_query_origin(connection: HTTPConnection) -> None:
+    """App-wide dependency attributing a request's statements to its route."""
+    route = connection.scope.get("route")
+    query_origin.set(getattr(route, "path", None) or "unknown")
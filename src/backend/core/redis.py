@@ -0,0 +1,49 @@
+"""
+Shared asyncio Redis client for the API process.
+Redis is optional: when REDIS_URL is not configured, get_redis() returns None
+and callers fall back to their Redis-less behaviour.
+"""
+
+from typing import Any, Optional, Union
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from .config import settings
+
+_client: Optional["Redis[Any]"] = None
+
+
+def create_redis(url: Optional[str] = None) -> Optional["Redis[Any]"]:
+    """Create a new client, e.g. for code running outside the API event loop."""
+    url = url or settings.REDIS_URL
+    if not url:
+        return None
+    return Redis.from_url(
+        url,
+        password=settings.REDIS_PASSWORD or None,
+        decode_responses=True,
+        socket_connect_timeout=5,
+        health_check_interval=30,
+    )
+
+
+async def aclose(client: Union["Redis[Any]", PubSub]) -> None:
+    """Close a client or pub/sub connection; types-redis predates aclose()."""
+    await client.aclose()  # type: ignore[union-attr]
+
+
+def get_redis() -> Optional["Redis[Any]"]:
+    """Get the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = create_redis()
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the process-wide client and its connection pool."""
+    global _client
+    if _client is not None:
+        await aclose(_client)
+        _client = None
@@ -0,0 +1,253 @@
+"""
+Project status change feed from Postgres LISTEN/NOTIFY.
+A trigger on projects announces every status change on the project_status
+channel. One listener connection per process keeps an in-memory map of
+recent statuses fresh and fans the changes out to subscribers, so status
+reads are answered from memory and change events need no polling.
+
+The map is only trusted while the listener is connected: notifications sent
+while it is down are lost, so it is cleared and subscribers are closed on
+disconnect. Entries also expire, bounding how long a lost notification can
+go unnoticed.
+
+LISTEN needs a session of its own, which PgBouncer in transaction mode does
+not provide: under the pgbouncer profile STATUS_LISTENER_URL must point
+straight at Postgres, or the listener does not start.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+import asyncpg
+from pydantic import ValidationError
+from sqlalchemy.engine import make_url
+
+from src.backend.models.project import STATUS_NOTIFY_CHANNEL
+from src.backend.schemas.project import ProjectStatusEvent
+
+from .cache import CachedProjectStatus
+from .config import Settings, settings
+from .utils import as_utc
+
+logger = logging.getLogger(__name__)
+
+# Ends a subscription when the listener loses its connection
+_CLOSED = object()
+
+QueueItem = Union[ProjectStatusEvent, object]
+StatusEvents = AsyncGenerator[Optional[ProjectStatusEvent], None]
+
+
+def listener_url(config: Settings) -> Optional[str]:
+    """Get the URL to LISTEN on, or None if there is no direct connection."""
+    if config.STATUS_LISTENER_URL:
+        return config.STATUS_LISTENER_URL
+    if config.DB_PROFILE == "pgbouncer":
+        return None
+    return config.DATABASE_URL
+
+
+class StatusListener:
+    def __init__(
+        self,
+        dsn: Optional[str],
+        max_entries: int,
+        ttl: float = 300.0,
+        ping_interval: float = 30.0,
+        retry_interval: float = 5.0,
+        queue_size: int = 100,
+    ) -> None:
+        """
+        Args:
+            dsn: Postgres URL; a SQLAlchemy driver suffix is ignored. None
+                keeps the listener from starting
+            max_entries: Most statuses kept, least recently used dropped first
+            ttl: Seconds a status is kept without being notified or refreshed
+            ping_interval: Seconds between checks that the connection is alive
+            retry_interval: Seconds between reconnection attempts
+            queue_size: Events buffered per subscriber before new ones are dropped
+        """
+        self.dsn = (
+            make_url(dsn)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+            if dsn is not None
+            else None
+        )
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ping_interval = ping_interval
+        self.retry_interval = retry_interval
+        self.queue_size = queue_size
+        self.connected = False
+        # Statuses with the monotonic time they expire at
+        self._statuses: "OrderedDict[UUID, Tuple[CachedProjectStatus, float]]" = (
+            OrderedDict()
+        )
+        self._subscribers: Dict[UUID, Set["asyncio.Queue[QueueItem]"]] = {}
+
+    def get(self, project_id: UUID) -> Optional[CachedProjectStatus]:
+        """Get a project's current status, if it is known and can be trusted."""
+        if not self.connected:
+            return None
+        entry = self._statuses.get(project_id)
+        if entry is None:
+            return None
+        status, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._statuses[project_id]
+            return None
+        self._statuses.move_to_end(project_id)
+        return status
+
+    def remember(self, project_id: UUID, status: CachedProjectStatus) -> None:
+        """
+        Record a status read or written elsewhere, unless a newer one is
+        already known. Writers call this so their own reads see the change
+        before its notification arrives. Only done while connected, so later
+        changes are sure to be seen.
+        """
+        if not self.connected:
+            return
+        known = self._statuses.get(project_id)
+        if known is not None and as_utc(known[0].updated_at) > as_utc(
+            status.updated_at
+        ):
+            return
+        self._statuses[project_id] = (status, time.monotonic() + self.ttl)
+        self._statuses.move_to_end(project_id)
+        while len(self._statuses) > self.max_entries:
+            self._statuses.popitem(last=False)
+
+    def _on_notification(
+        self, connection: object, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            event = ProjectStatusEvent.model_validate_json(payload)
+        except ValidationError as e:
+            logger.warning(f"Ignoring malformed status notification: {e}")
+            return
+        self.remember(
+            event.project_id,
+            CachedProjectStatus(status=event.status, updated_at=event.updated_at),
+        )
+        for queue in self._subscribers.get(event.project_id, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(f"Dropped status event for slow subscriber: {event}")
+
+    def _disconnected(self) -> None:
+        self.connected = False
+        self._statuses.clear()
+        # A subscriber's queue is registered once per project it follows
+        for queue in set().union(*self._subscribers.values()):
+            # Make room so the close marker always gets through
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(_CLOSED)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, project_ids: Iterable[UUID], heartbeat_interval: float = 15.0
+    ) -> AsyncIterator[StatusEvents]:
+        """
+        Subscribe to status events for the given projects.
+
+        The subscription is registered once this is entered, so a snapshot
+        taken afterwards cannot miss a change. The iterator yields each event
+        as it is received, and None whenever heartbeat_interval seconds pass
+        without one. It ends when the listener disconnects, since events may
+        have been missed from then on.
+        """
+        queue: "asyncio.Queue[QueueItem]" = asyncio.Queue(self.queue_size)
+        ids = list(project_ids)
+        for project_id in ids:
+            self._subscribers.setdefault(project_id, set()).add(queue)
+        events = self._iter_queue(queue, heartbeat_interval)
+        try:
+            yield events
+        finally:
+            await events.aclose()
+            for project_id in ids:
+                queues = self._subscribers.get(project_id)
+                if queues is not None:
+                    queues.discard(queue)
+                    if not queues:
+                        del self._subscribers[project_id]
+
+    async def _iter_queue(
+        self, queue: "asyncio.Queue[QueueItem]", heartbeat_interval: float
+    ) -> StatusEvents:
+        while self.connected:
+            try:
+                item = await asyncio.wait_for(queue.get(), heartbeat_interval)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if item is _CLOSED:
+                return
+            assert isinstance(item, ProjectStatusEvent)
+            yield item
+
+    async def run(self) -> None:
+        """Listen for status changes until cancelled, reconnecting as needed."""
+        if self.dsn is None:
+            logger.warning(
+                "Status listener not started: LISTEN needs a direct connection, "
+                "set STATUS_LISTENER_URL when DB_PROFILE is pgbouncer"
+            )
+            return
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Status listener failed to connect: {e}")
+                await asyncio.sleep(self.retry_interval)
+                continue
+            try:
+                await connection.add_listener(
+                    STATUS_NOTIFY_CHANNEL, self._on_notification
+                )
+                self.connected = True
+                logger.info("Status listener connected")
+                while True:
+                    await asyncio.sleep(self.ping_interval)
+                    # Also detects connections that died without closing
+                    await connection.execute("SELECT 1", timeout=self.ping_interval)
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError,
+            ) as e:
+                logger.warning(f"Status listener disconnected: {e}")
+            finally:
+                self._disconnected()
+                if not connection.is_closed():
+                    connection.terminate()
+            await asyncio.sleep(self.retry_interval)
+
+
+status_listener = StatusListener(
+    listener_url(settings), settings.STATUS_MAP_SIZE, settings.STATUS_MAP_TTL
+)
+
+
+def get_status_listener() -> StatusListener:
+    """Dependency for getting the process-wide status listener"""
+    return status_listener
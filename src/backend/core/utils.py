@@ -5,9 +5,11 @@ These functions provide common functionality across different parts of the appli
 
 import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from pydantic import ValidationError
+
 
 def generate_uuid() -> str:
     """Generate a unique UUID string."""
@@ -47,3 +49,16 @@ def is_valid_uuid(val: str) -> bool:
         return True
     except (ValueError, AttributeError):
         return False
+
+
+def as_utc(value: datetime) -> datetime:
+    """Make a datetime from a column without time zone comparable, as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def validation_message(error: ValidationError) -> str:
+    """Summarize a validation error on one line, e.g. for per-item results."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+        for err in error.errors()
+    )
@@ -1,27 +1,59 @@
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Dict
+from typing import AsyncGenerator, Awaitable, Callable, Dict
 
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables from .env file
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 
-from .api.routers import projects
+from .api.routers import (
+    project_batch,
+    project_events,
+    project_export,
+    project_import,
+    project_search,
+    project_stages,
+    projects,
+)
 from .core.config import settings
+from .core.database import pin_reads_to_primary, replicas
+from .core.query_timing import record_query_origin
+from .core.redis import close_redis
+from .core.status_listener import status_listener
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
+    health_checks = None
+    if replicas is not None:
+        health_checks = asyncio.create_task(
+            replicas.run_health_checks(settings.DB_REPLICA_HEALTH_INTERVAL)
+        )
+    status_listening = None
+    if settings.STATUS_LISTENER_ENABLED:
+        status_listening = asyncio.create_task(status_listener.run())
     yield
     # Shutdown
+    if health_checks is not None:
+        health_checks.cancel()
+    if status_listening is not None:
+        status_listening.cancel()
+    if replicas is not None:
+        await replicas.dispose()
+    await close_redis()
 
 
 app = FastAPI(
-    title=settings.PROJECT_NAME, version=settings.API_VERSION, lifespan=lifespan
+    title=settings.PROJECT_NAME,
+    version=settings.API_VERSION,
+    lifespan=lifespan,
+    # Attributes SQL statement timings to the route that ran them
+    dependencies=[Depends(record_query_origin)],
 )
 
 # Configure CORS
@@ -33,11 +65,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+async def read_your_writes(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """After a successful write, keep the client's reads on the primary."""
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        pin_reads_to_primary(response)
+    return response
+
+
+# Only needed when reads can go to a lagging replica
+if replicas is not None:
+    app.middleware("http")(read_your_writes)
+
+
 # Set up Prometheus metrics
 Instrumentator().instrument(app).expose(app)
 
 # Include routers
+# Before projects.router, so /projects/{project_id} does not match "export"
+# or "search"
+app.include_router(project_export.router, prefix="/api/v1", tags=["projects"])
+app.include_router(project_search.router, prefix="/api/v1", tags=["projects"])
 app.include_router(projects.router, prefix="/api/v1", tags=["projects"])
+app.include_router(project_events.router, prefix="/api/v1", tags=["projects"])
+app.include_router(project_batch.router, prefix="/api/v1", tags=["projects"])
+app.include_router(project_import.router, prefix="/api/v1", tags=["projects"])
+app.include_router(project_stages.router, prefix="/api/v1", tags=["projects"])
 
 
 @app.get("/health")
@@ -0,0 +1,40 @@
+"""add project listing indexes
+
+Revision ID: b1c2d3e4f5a6
+Revises: 4e3759c10b61
+Create Date: 2026-10-16 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b1c2d3e4f5a6"
+down_revision: Union[str, None] = "4e3759c10b61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination on (created_at, id), optionally filtered by status
+    op.create_index("ix_projects_created_at_id", "projects", ["created_at", "id"])
+    op.create_index(
+        "ix_projects_status_created_at_id",
+        "projects",
+        ["status", "created_at", "id"],
+    )
+    # Topic prefix filtering (LIKE 'prefix%') independent of collation
+    op.create_index(
+        "ix_projects_topic_pattern",
+        "projects",
+        ["topic"],
+        postgresql_ops={"topic": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_topic_pattern", table_name="projects")
+    op.drop_index("ix_projects_status_created_at_id", table_name="projects")
+    op.drop_index("ix_projects_created_at_id", table_name="projects")
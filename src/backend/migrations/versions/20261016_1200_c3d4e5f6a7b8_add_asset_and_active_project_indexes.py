@@ -0,0 +1,35 @@
+"""add asset and active project indexes
+
+Revision ID: c3d4e5f6a7b8
+Revises: b1c2d3e4f5a6
+Create Date: 2026-10-16 12:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, None] = "b1c2d3e4f5a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Asset loads by project (selectinload, exports) and FK checks on delete
+    op.create_index("ix_assets_project_id", "assets", ["project_id"])
+    # Projects still in the pipeline are few; keep them in a small index
+    op.create_index(
+        "ix_projects_active_created_at_id",
+        "projects",
+        ["created_at", "id"],
+        postgresql_where=sa.text("status IN ('CREATED', 'PROCESSING')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_active_created_at_id", table_name="projects")
+    op.drop_index("ix_assets_project_id", table_name="assets")
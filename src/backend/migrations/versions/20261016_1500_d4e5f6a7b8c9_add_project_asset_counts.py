@@ -0,0 +1,119 @@
+"""add project asset counts
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-16 15:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Paginating a project's assets in creation order; replaces the plain
+    # foreign key index, whose lookups it serves as well
+    op.create_index(
+        "ix_assets_project_id_created_at_id",
+        "assets",
+        ["project_id", "created_at", "id"],
+    )
+    op.drop_index("ix_assets_project_id", table_name="assets")
+
+    # Deleting a project no longer loads its assets to delete them one by one
+    op.drop_constraint("assets_project_id_fkey", "assets", type_="foreignkey")
+    op.create_foreign_key(
+        "assets_project_id_fkey",
+        "assets",
+        "projects",
+        ["project_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+    op.add_column(
+        "projects",
+        sa.Column(
+            "asset_counts",
+            JSONB,
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+    op.execute(
+        """
+        UPDATE projects
+        SET asset_counts = counts.asset_counts
+        FROM (
+            SELECT project_id, jsonb_object_agg(asset_type, total) AS asset_counts
+            FROM (
+                SELECT project_id, asset_type::text, count(*) AS total
+                FROM assets
+                GROUP BY project_id, asset_type
+            ) AS per_type
+            GROUP BY project_id
+        ) AS counts
+        WHERE projects.id = counts.project_id
+        """
+    )
+    # Keeps asset_counts in step with assets (see models/asset.py)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_project_asset_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE'
+                AND OLD.asset_type = NEW.asset_type
+                AND OLD.project_id IS NOT DISTINCT FROM NEW.project_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE projects
+                SET asset_counts = jsonb_set(
+                    asset_counts,
+                    ARRAY[OLD.asset_type::text],
+                    to_jsonb(COALESCE((asset_counts ->> OLD.asset_type::text)::int, 0) - 1)
+                )
+                WHERE id = OLD.project_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE projects
+                SET asset_counts = jsonb_set(
+                    asset_counts,
+                    ARRAY[NEW.asset_type::text],
+                    to_jsonb(COALESCE((asset_counts ->> NEW.asset_type::text)::int, 0) + 1)
+                )
+                WHERE id = NEW.project_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER assets_update_project_asset_counts
+        AFTER INSERT OR DELETE OR UPDATE OF asset_type, project_id ON assets
+        FOR EACH ROW EXECUTE FUNCTION update_project_asset_counts()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER assets_update_project_asset_counts ON assets")
+    op.execute("DROP FUNCTION update_project_asset_counts()")
+    op.drop_column("projects", "asset_counts")
+    op.drop_constraint("assets_project_id_fkey", "assets", type_="foreignkey")
+    op.create_foreign_key(
+        "assets_project_id_fkey", "assets", "projects", ["project_id"], ["id"]
+    )
+    op.create_index("ix_assets_project_id", "assets", ["project_id"])
+    op.drop_index("ix_assets_project_id_created_at_id", table_name="assets")
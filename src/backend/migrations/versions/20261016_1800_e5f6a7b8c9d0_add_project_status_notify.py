@@ -0,0 +1,53 @@
+"""add project status notify
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 18:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NOTIFY project_status on every status change, from any writer
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_project_status() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN
+                RETURN NULL;
+            END IF;
+            PERFORM pg_notify(
+                'project_status',
+                json_build_object(
+                    'project_id', NEW.id,
+                    'status', NEW.status,
+                    'updated_at', NEW.updated_at
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER projects_notify_status
+        AFTER INSERT OR UPDATE OF status ON projects
+        FOR EACH ROW EXECUTE FUNCTION notify_project_status()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER projects_notify_status ON projects")
+    op.execute("DROP FUNCTION notify_project_status()")
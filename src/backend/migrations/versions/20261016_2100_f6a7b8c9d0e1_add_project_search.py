@@ -0,0 +1,58 @@
+"""add project search
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-16 21:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Topic matches rank above name matches, which rank above notes matches
+    op.add_column(
+        "projects",
+        sa.Column(
+            "search_vector",
+            TSVECTOR,
+            sa.Computed(
+                """
+                setweight(to_tsvector('english', coalesce(topic, '')), 'A')
+                || setweight(to_tsvector('english', coalesce(name, '')), 'B')
+                || setweight(to_tsvector('english', coalesce(notes, '')), 'C')
+                """,
+                persisted=True,
+            ),
+        ),
+    )
+    op.create_index(
+        "ix_projects_search_vector",
+        "projects",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_projects_topic_trgm",
+        "projects",
+        ["topic"],
+        postgresql_using="gin",
+        postgresql_ops={"topic": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_topic_trgm", table_name="projects")
+    op.drop_index("ix_projects_search_vector", table_name="projects")
+    op.drop_column("projects", "search_vector")
@@ -0,0 +1,37 @@
+"""add stage checkpoints
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 23:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("project_stages", sa.Column("input_hash", sa.String, nullable=True))
+    op.add_column(
+        "project_stages",
+        sa.Column(
+            "output_asset_ids",
+            ARRAY(UUID(as_uuid=True)),
+            nullable=False,
+            server_default=sa.text("'{}'"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("project_stages", "output_asset_ids")
+    op.drop_column("project_stages", "input_hash")
@@ -0,0 +1,55 @@
+"""skip status notify on import
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-17 00:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def notify_function(skip_check: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION notify_project_status() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN
+                RETURN NULL;
+            END IF;{skip_check}
+            PERFORM pg_notify(
+                'project_status',
+                json_build_object(
+                    'project_id', NEW.id,
+                    'status', NEW.status,
+                    'updated_at', NEW.updated_at
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+
+
+def upgrade() -> None:
+    # Transactions that set app.skip_status_notify, such as the batches of a
+    # bulk import, write projects without a notification per row
+    op.execute(
+        notify_function(
+            """
+            IF current_setting('app.skip_status_notify', true) = 'on' THEN
+                RETURN NULL;
+            END IF;"""
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(notify_function(""))
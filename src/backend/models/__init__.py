@@ -1,5 +1,6 @@
 from .asset import Asset
 from .base import Base
 from .project import Project
+from .project_stage import ProjectStage
 
-__all__ = ["Base", "Project", "Asset"]
+__all__ = ["Base", "Project", "Asset", "ProjectStage"]
@@ -2,22 +2,68 @@ import uuid
 from datetime import datetime, timezone
 from typing import Literal
 
-from sqlalchemy import DateTime
+from sqlalchemy import DDL, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
 
+# Keeps projects.asset_counts, a {asset_type: count} object, in step with the
+# assets table, so counts are read without touching assets
+ASSET_COUNTS_FUNCTION = DDL(
+    """
+    CREATE OR REPLACE FUNCTION update_project_asset_counts() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE'
+            AND OLD.asset_type = NEW.asset_type
+            AND OLD.project_id IS NOT DISTINCT FROM NEW.project_id THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE projects
+            SET asset_counts = jsonb_set(
+                asset_counts,
+                ARRAY[OLD.asset_type::text],
+                to_jsonb(COALESCE((asset_counts ->> OLD.asset_type::text)::int, 0) - 1)
+            )
+            WHERE id = OLD.project_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE projects
+            SET asset_counts = jsonb_set(
+                asset_counts,
+                ARRAY[NEW.asset_type::text],
+                to_jsonb(COALESCE((asset_counts ->> NEW.asset_type::text)::int, 0) + 1)
+            )
+            WHERE id = NEW.project_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+ASSET_COUNTS_TRIGGER = DDL(
+    """
+    CREATE TRIGGER assets_update_project_asset_counts
+    AFTER INSERT OR DELETE OR UPDATE OF asset_type, project_id ON assets
+    FOR EACH ROW EXECUTE FUNCTION update_project_asset_counts()
+    """
+)
+
 
 class Asset(Base):
     __tablename__ = "assets"
+    __table_args__ = (
+        # A project's assets in creation order; also serves the foreign key
+        Index("ix_assets_project_id_created_at_id", "project_id", "created_at", "id"),
+    )
 
     # Required fields without defaults should come first
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
     project_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("projects.id")
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE")
     )
     asset_type: Mapped[Literal["script", "narration", "video", "image", "slide"]] = (
         mapped_column(
@@ -40,3 +86,8 @@ class Asset(Base):
 
     # Relationships at the end
     project = relationship("Project", back_populates="assets")
+
+
+# Created with the table outside of migrations too, e.g. by create_all in tests
+event.listen(Asset.__table__, "after_create", ASSET_COUNTS_FUNCTION)
+event.listen(Asset.__table__, "after_create", ASSET_COUNTS_TRIGGER)
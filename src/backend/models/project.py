@@ -1,11 +1,11 @@
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from sqlalchemy import DateTime
+from sqlalchemy import DDL, Computed, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Index, String, event, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.backend.schemas.project import ProjectStatus
@@ -13,9 +13,87 @@ from src.backend.schemas.project import ProjectStatus
 from .asset import Asset
 from .base import Base
 
+# Status changes are announced on this channel with a ProjectStatusEvent
+# payload, whichever writer made them
+STATUS_NOTIFY_CHANNEL = "project_status"
+# Set to 'on' for a transaction to write projects without announcing them,
+# e.g. bulk imports, which would otherwise send one notification per row
+STATUS_NOTIFY_SKIP_SETTING = "app.skip_status_notify"
+
+STATUS_NOTIFY_FUNCTION = DDL(
+    f"""
+    CREATE OR REPLACE FUNCTION notify_project_status() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN
+            RETURN NULL;
+        END IF;
+        IF current_setting('{STATUS_NOTIFY_SKIP_SETTING}', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+        PERFORM pg_notify(
+            '{STATUS_NOTIFY_CHANNEL}',
+            json_build_object(
+                'project_id', NEW.id,
+                'status', NEW.status,
+                'updated_at', NEW.updated_at
+            )::text
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+STATUS_NOTIFY_TRIGGER = DDL(
+    """
+    CREATE TRIGGER projects_notify_status
+    AFTER INSERT OR UPDATE OF status ON projects
+    FOR EACH ROW EXECUTE FUNCTION notify_project_status()
+    """
+)
+
+
+# Text search configuration of search_vector; queries must use the same one
+SEARCH_CONFIG = "english"
+
+# Topic matches rank above name matches, which rank above notes matches
+SEARCH_VECTOR = f"""
+    setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(topic, '')), 'A')
+    || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'B')
+    || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(notes, '')), 'C')
+"""
+
+TRGM_EXTENSION = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination on (created_at, id), optionally filtered by status
+        Index("ix_projects_created_at_id", "created_at", "id"),
+        Index("ix_projects_status_created_at_id", "status", "created_at", "id"),
+        # Topic prefix filtering (LIKE 'prefix%') independent of collation
+        Index(
+            "ix_projects_topic_pattern",
+            "topic",
+            postgresql_ops={"topic": "text_pattern_ops"},
+        ),
+        # Projects still in the pipeline are few; keep them in a small index
+        Index(
+            "ix_projects_active_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("status IN ('CREATED', 'PROCESSING')"),
+        ),
+        # Full-text search over topic, name and notes
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+        # Fuzzy topic matching (similarity, %) for typos and partial words
+        Index(
+            "ix_projects_topic_trgm",
+            "topic",
+            postgresql_using="gin",
+            postgresql_ops={"topic": "gin_trgm_ops"},
+        ),
+    )
 
     # Required fields without defaults
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
@@ -30,6 +108,16 @@ class Project(Base):
     name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
+    # Assets per asset_type, maintained by a trigger on assets
+    asset_counts: Mapped[Dict[str, int]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    )
+
+    # Generated by Postgres from topic, name and notes; only read by searches
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR, persisted=True), deferred=True
+    )
+
     # Timestamp fields with defaults
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
@@ -41,6 +129,18 @@ class Project(Base):
     )
 
     # Relationships
+    # Loading assets is opt-in: use selectinload(Project.assets) or the paginated
+    # assets endpoint. Deletes cascade in the database, without loading them.
     assets: Mapped[List["Asset"]] = relationship(
-        "Asset", back_populates="project", cascade="all, delete-orphan", lazy="selectin"
+        "Asset",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
+
+
+# Created with the table outside of migrations too, e.g. by create_all in tests
+event.listen(Project.__table__, "before_create", TRGM_EXTENSION)
+event.listen(Project.__table__, "after_create", STATUS_NOTIFY_FUNCTION)
+event.listen(Project.__table__, "after_create", STATUS_NOTIFY_TRIGGER)
@@ -0,0 +1,56 @@
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import DateTime
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import ForeignKey, String, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.backend.schemas.stage import StageStatus
+
+from .base import Base
+
+
+class ProjectStage(Base):
+    """Progress of one pipeline stage of a project."""
+
+    __tablename__ = "project_stages"
+
+    # The primary key also serves the foreign key and per-project reads
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # A PipelineStage value; kept as text so stages can be added without
+    # altering an enum type
+    stage: Mapped[str] = mapped_column(String, primary_key=True)
+
+    status: Mapped[StageStatus] = mapped_column(
+        SQLEnum(StageStatus, name="stage_status"),
+        nullable=False,
+        default=StageStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(default=0)
+    error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    # Checkpoint of the last successful run: a hash of what the stage was
+    # given, and the assets it produced. The stage is skipped while both hold.
+    input_hash: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    output_asset_ids: Mapped[List[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)), nullable=False, server_default=text("'{}'")
+    )
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
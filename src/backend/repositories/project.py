@@ -0,0 +1,272 @@
+"""
+Data access for projects.
+Routes describe what they need as a LoadProfile (which columns, whether to
+load assets) and the repository turns it into loader options, so no read
+pulls more than it uses. Larger asset lists are read a page at a time with
+list_assets. search combines full-text and trigram matching.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import Float, Row, Select, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import websearch_to_tsquery
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, noload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.backend.core.database import get_db, get_read_db
+from src.backend.models.asset import Asset
+from src.backend.models.project import SEARCH_CONFIG, Project
+from src.backend.schemas.asset import Asset as AssetRead
+from src.backend.schemas.asset import AssetType
+from src.backend.schemas.project import ProjectRead, ProjectStatus, ProjectViewData
+
+# Selectable project fields, in ProjectRead order
+PROJECT_FIELDS: Tuple[str, ...] = tuple(ProjectRead.model_fields)
+
+# Columns backing ProjectRead, so writes can RETURNING them in one round trip
+PROJECT_READ_COLUMNS = tuple(getattr(Project, name) for name in PROJECT_FIELDS)
+
+INCLUDABLE = frozenset({"assets"})
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """Which project columns to load, and whether to load its assets."""
+
+    fields: FrozenSet[str] = frozenset(PROJECT_FIELDS)
+    assets: bool = False
+
+    def __post_init__(self) -> None:
+        unknown = self.fields - set(PROJECT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+
+    @classmethod
+    def parse(cls, fields: Optional[str], include: Optional[str]) -> "LoadProfile":
+        """
+        Build a profile from `fields=a,b` and `include=assets` query values.
+
+        Raises:
+            ValueError: If a field or include is unknown
+        """
+        included = _split(include)
+        unknown = included - INCLUDABLE
+        if unknown:
+            raise ValueError(f"Unknown include(s): {', '.join(sorted(unknown))}")
+        return cls(
+            fields=_split(fields) or frozenset(PROJECT_FIELDS),
+            assets="assets" in included,
+        )
+
+    def with_fields(self, *names: str) -> "LoadProfile":
+        """Get a profile that also loads the given columns."""
+        return LoadProfile(fields=self.fields | set(names), assets=self.assets)
+
+    def options(self) -> Tuple[ExecutableOption, ...]:
+        columns = [getattr(Project, name) for name in PROJECT_FIELDS if name in self]
+        return (
+            # raiseload turns an accidental lazy load of a skipped column into
+            # an error instead of a hidden extra query
+            load_only(*columns, raiseload=True),
+            selectinload(Project.assets) if self.assets else noload(Project.assets),
+        )
+
+    def render(self, project: Union[Project, ProjectRead]) -> ProjectViewData:
+        """
+        Build the response for a project loaded with this profile.
+        Columns are already typed by the model, so they are not validated again.
+        """
+        data = ProjectViewData()
+        for name in PROJECT_FIELDS:
+            if name in self.fields:
+                data[name] = getattr(project, name)  # type: ignore[literal-required]
+        if self.assets and isinstance(project, Project):
+            data["assets"] = [AssetRead.model_validate(a) for a in project.assets]
+        return data
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+
+def _split(value: Optional[str]) -> FrozenSet[str]:
+    if not value:
+        return frozenset()
+    return frozenset(part.strip() for part in value.split(",") if part.strip())
+
+
+FULL = LoadProfile()
+WITH_ASSETS = LoadProfile(assets=True)
+
+
+@dataclass(frozen=True)
+class ProjectFilters:
+    """Filters shared by the project listing endpoints."""
+
+    statuses: Sequence[ProjectStatus] = field(default_factory=tuple)
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    topic_prefix: Optional[str] = None
+
+    def apply(self, query: Select[Any]) -> Select[Any]:
+        if self.statuses:
+            query = query.where(Project.status.in_(self.statuses))
+        if self.created_after is not None:
+            query = query.where(Project.created_at >= self.created_after)
+        if self.created_before is not None:
+            query = query.where(Project.created_at < self.created_before)
+        if self.topic_prefix:
+            query = query.where(
+                Project.topic.startswith(self.topic_prefix, autoescape=True)
+            )
+        return query
+
+
+@dataclass(frozen=True)
+class AssetFilters:
+    """Filters for listing a project's assets."""
+
+    asset_types: Sequence[AssetType] = field(default_factory=tuple)
+    approved: Optional[bool] = None
+
+    def apply(self, query: Select[Any]) -> Select[Any]:
+        if self.asset_types:
+            query = query.where(Asset.asset_type.in_(self.asset_types))
+        if self.approved is not None:
+            query = query.where(Asset.approved.is_(self.approved))
+        return query
+
+
+class ProjectRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get(
+        self, project_id: UUID, load: LoadProfile = FULL
+    ) -> Optional[Project]:
+        result = await self.db.execute(
+            select(Project).where(Project.id == project_id).options(*load.options())
+        )
+        return result.scalar_one_or_none()
+
+    async def list_page(
+        self,
+        load: LoadProfile,
+        filters: ProjectFilters,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Tuple[List[Project], bool]:
+        """
+        Get one page of projects, newest first, keyset paginated on
+        (created_at, id).
+
+        Args:
+            load: Columns to load; created_at is always loaded for the cursor
+            filters: Conditions every project must match
+            limit: Page size
+            after: (created_at, id) of the last project of the previous page
+
+        Returns:
+            Tuple[List[Project], bool]: The page and whether another follows
+        """
+        query = filters.apply(
+            select(Project).options(*load.with_fields("created_at").options())
+        )
+        if after is not None:
+            query = query.where(tuple_(Project.created_at, Project.id) < after)
+        # Fetch one extra row to learn whether another page exists
+        query = query.order_by(Project.created_at.desc(), Project.id.desc()).limit(
+            limit + 1
+        )
+        projects = list((await self.db.execute(query)).scalars())
+        return projects[:limit], len(projects) > limit
+
+    async def list_assets(
+        self,
+        project_id: UUID,
+        filters: AssetFilters,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Tuple[List[Asset], bool]:
+        """
+        Get one page of a project's assets, oldest first, keyset paginated on
+        (created_at, id).
+
+        Args:
+            project_id: Project owning the assets
+            filters: Conditions every asset must match
+            limit: Page size
+            after: (created_at, id) of the last asset of the previous page
+
+        Returns:
+            Tuple[List[Asset], bool]: The page and whether another follows
+        """
+        query = filters.apply(select(Asset).where(Asset.project_id == project_id))
+        if after is not None:
+            query = query.where(tuple_(Asset.created_at, Asset.id) > after)
+        query = query.order_by(Asset.created_at, Asset.id).limit(limit + 1)
+        assets = list((await self.db.execute(query)).scalars())
+        return assets[:limit], len(assets) > limit
+
+    async def search(
+        self,
+        text: str,
+        limit: int,
+        after: Optional[Tuple[float, UUID]] = None,
+    ) -> Tuple[List[Row[Any]], bool]:
+        """
+        Get one page of projects matching a search, best match first, keyset
+        paginated on (rank, id).
+
+        A project matches if its topic, name or notes contain the words of
+        `text` (web search syntax: quotes, OR, -word), or if its topic is
+        similar to `text`, which catches typos. Rank adds both scores.
+
+        Args:
+            text: What to search for
+            limit: Page size
+            after: (rank, id) of the last result of the previous page
+
+        Returns:
+            Tuple[List[Row], bool]: Rows of ProjectRead columns plus rank, and
+                whether another page follows
+        """
+        tsquery = websearch_to_tsquery(SEARCH_CONFIG, text)
+        rank = func.ts_rank(
+            Project.search_vector, tsquery, type_=Float
+        ) + func.similarity(Project.topic, text, type_=Float)
+        query = select(*PROJECT_READ_COLUMNS, rank.label("rank")).where(
+            # Each condition is answered by its own GIN index
+            or_(
+                Project.search_vector.bool_op("@@")(tsquery),
+                Project.topic.bool_op("%")(text),
+            )
+        )
+        if after is not None:
+            query = query.where(tuple_(rank, Project.id) < after)
+        query = query.order_by(rank.desc(), Project.id.desc()).limit(limit + 1)
+        rows = list(await self.db.execute(query))
+        return rows[:limit], len(rows) > limit
+
+    async def get_asset_counts(self, project_id: UUID) -> Optional[Dict[str, int]]:
+        """Get a project's assets per asset_type, or None if it does not exist."""
+        result = await self.db.execute(
+            select(Project.asset_counts).where(Project.id == project_id)
+        )
+        return result.scalar_one_or_none()
+
+
+def get_project_repository(db: AsyncSession = Depends(get_db)) -> ProjectRepository:
+    """Dependency for getting the project repository"""
+    return ProjectRepository(db)
+
+
+def get_read_project_repository(
+    db: AsyncSession = Depends(get_read_db),
+) -> ProjectRepository:
+    """Dependency for a project repository reading from a replica if possible"""
+    return ProjectRepository(db)
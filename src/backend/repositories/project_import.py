@@ -0,0 +1,168 @@
+"""
+Bulk import of project ideas from CSV or JSONL files.
+Rows are read as a stream, validated against ProjectCreate one by one and
+loaded a batch at a time with COPY, which costs a fraction of an INSERT per
+row. Invalid rows are reported with their line number and never hold back
+the valid ones. Each batch is committed once loaded.
+
+Reading and validating a batch is blocking, CPU-bound work and runs in a
+thread, so the event loop keeps serving other requests meanwhile. Imported
+projects are not announced on the status channel: the rows are new, so no
+one follows them yet, and a notification per row would flood listeners.
+"""
+
+import asyncio
+import csv
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.core.utils import validation_message
+from src.backend.models.project import STATUS_NOTIFY_SKIP_SETTING, Project
+from src.backend.schemas.project import (
+    ProjectCreate,
+    ProjectImportReject,
+    ProjectImportResponse,
+    ProjectStatus,
+)
+
+IMPORT_BATCH_SIZE = 5000
+# Rejects listed in a response; the rest are only counted
+MAX_REPORTED_REJECTS = 1000
+
+# Written by COPY; asset_counts and search_vector are filled by Postgres
+COPY_COLUMNS = ("id", "topic", "name", "notes", "status", "created_at", "updated_at")
+
+Record = Tuple[uuid.UUID, str, Optional[str], Optional[str], str, datetime, datetime]
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+    @classmethod
+    def from_filename(cls, filename: Optional[str]) -> Optional["ImportFormat"]:
+        """Guess the format from a file extension."""
+        extension = (filename or "").rsplit(".", 1)[-1].lower()
+        if extension == "csv":
+            return cls.CSV
+        if extension in ("jsonl", "ndjson"):
+            return cls.JSONL
+        return None
+
+
+class ImportFileError(ValueError):
+    """Raised when a file cannot be read at all, as opposed to a bad row."""
+
+
+def iter_rows(stream: TextIO, import_format: ImportFormat) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield (line number, row) for every row of a file, without reading it whole.
+    CSV rows are dicts keyed by the header, with empty cells left out; JSONL
+    rows are the raw JSON text, parsed during validation.
+    """
+    if import_format == ImportFormat.CSV:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # Cells beyond the header are collected under the None key
+            yield reader.line_num, {
+                key: value for key, value in row.items() if key and value != ""
+            }
+    else:
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+def validate_row(row: Any) -> ProjectCreate:
+    """
+    Raises:
+        ValidationError: If the row is not a valid ProjectCreate
+    """
+    if isinstance(row, str):
+        return ProjectCreate.model_validate_json(row)
+    return ProjectCreate.model_validate(row)
+
+
+class ProjectImporter:
+    def __init__(self, db: AsyncSession, batch_size: int = IMPORT_BATCH_SIZE) -> None:
+        self.db = db
+        self.batch_size = batch_size
+
+    async def run(
+        self, stream: TextIO, import_format: ImportFormat
+    ) -> ProjectImportResponse:
+        """
+        Import every valid row of a file as a new CREATED project.
+
+        Raises:
+            ImportFileError: If the file is not valid UTF-8 or not valid CSV.
+                Batches loaded before the error stay imported
+        """
+        result = ProjectImportResponse(imported=0, rejected=0, rejects=[])
+        rows = iter_rows(stream, import_format)
+        try:
+            while True:
+                batch = await asyncio.to_thread(self._read_batch, rows, result)
+                if batch:
+                    result.imported += await self._copy(batch)
+                if len(batch) < self.batch_size:
+                    return result
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise ImportFileError(f"Unreadable file: {e}") from e
+
+    def _read_batch(
+        self, rows: Iterator[Tuple[int, Any]], result: ProjectImportResponse
+    ) -> List[Record]:
+        """
+        Read rows until a batch is full or the file ends, recording rejects.
+        Blocking; run in a thread.
+        """
+        batch: List[Record] = []
+        for line, row in rows:
+            try:
+                project = validate_row(row)
+            except ValidationError as e:
+                result.rejected += 1
+                if len(result.rejects) < MAX_REPORTED_REJECTS:
+                    result.rejects.append(
+                        ProjectImportReject(line=line, error=validation_message(e))
+                    )
+                continue
+            batch.append(_record(project))
+            if len(batch) >= self.batch_size:
+                break
+        return batch
+
+    async def _copy(self, records: List[Record]) -> int:
+        # Skip the per-row status notification for this transaction only
+        await self.db.execute(
+            select(func.set_config(STATUS_NOTIFY_SKIP_SETTING, "on", True))
+        )
+        connection = await self.db.connection()
+        # The asyncpg connection under the session's, so COPY joins its transaction
+        driver_connection = (await connection.get_raw_connection()).driver_connection
+        assert driver_connection is not None
+        await driver_connection.copy_records_to_table(
+            Project.__tablename__, records=records, columns=COPY_COLUMNS
+        )
+        await self.db.commit()
+        return len(records)
+
+
+def _record(project: ProjectCreate) -> Record:
+    now = datetime.now(timezone.utc)
+    return (
+        uuid.uuid4(),
+        project.topic,
+        project.name,
+        project.notes,
+        ProjectStatus.CREATED.value,
+        now,
+        now,
+    )
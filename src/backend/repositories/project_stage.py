@@ -0,0 +1,180 @@
+"""
+Data access for the pipeline stages of projects.
+Every stage of a started pipeline has a row, so progress can be shown and a
+failed stage found without asking Celery. A completed stage also keeps a
+checkpoint: the hash of its inputs and the Asset rows it produced, which
+let a rerun skip it. Callers commit.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.core.database import get_read_db
+from src.backend.models.asset import Asset
+from src.backend.models.project_stage import ProjectStage
+from src.backend.schemas.asset import AssetType
+from src.backend.schemas.stage import PipelineStage, StageStatus
+
+# Rows are listed in pipeline order
+STAGE_ORDER = {stage.value: index for index, stage in enumerate(PipelineStage)}
+
+
+class ProjectStageRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def list(self, project_id: UUID) -> List[ProjectStage]:
+        result = await self.db.execute(
+            select(ProjectStage).where(ProjectStage.project_id == project_id)
+        )
+        return sorted(result.scalars(), key=lambda row: STAGE_ORDER[row.stage])
+
+    async def reset(self, project_id: UUID, stages: Iterable[PipelineStage]) -> None:
+        """
+        Mark the given stages PENDING, creating their rows as needed.
+        Completed stages keep their status and checkpoint, and running ones
+        are left to finish.
+        """
+        now = datetime.now(timezone.utc)
+        query = insert(ProjectStage).values(
+            [
+                {
+                    "project_id": project_id,
+                    "stage": stage.value,
+                    "status": StageStatus.PENDING,
+                    "attempts": 0,
+                    "updated_at": now,
+                }
+                for stage in stages
+            ]
+        )
+        await self.db.execute(
+            query.on_conflict_do_update(
+                index_elements=[ProjectStage.project_id, ProjectStage.stage],
+                set_={
+                    "status": StageStatus.PENDING,
+                    "error": None,
+                    "started_at": None,
+                    "finished_at": None,
+                    "updated_at": now,
+                },
+                where=ProjectStage.status.not_in(
+                    [StageStatus.COMPLETED, StageStatus.RUNNING]
+                ),
+            )
+        )
+
+    async def set_status(
+        self,
+        project_id: UUID,
+        stage: PipelineStage,
+        status: StageStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a stage starting (RUNNING) or finishing."""
+        now = datetime.now(timezone.utc)
+        values: Dict[str, Any] = {"status": status, "error": error, "updated_at": now}
+        if status == StageStatus.RUNNING:
+            values.update(
+                started_at=now, finished_at=None, attempts=ProjectStage.attempts + 1
+            )
+        else:
+            values["finished_at"] = now
+        await self.db.execute(
+            update(ProjectStage)
+            .where(
+                ProjectStage.project_id == project_id,
+                ProjectStage.stage == stage.value,
+            )
+            .values(values)
+        )
+
+    async def outputs(self, stage: ProjectStage) -> List[Asset]:
+        """Get the assets a stage produced, as far as they still exist."""
+        if not stage.output_asset_ids:
+            return []
+        result = await self.db.execute(
+            select(Asset)
+            .where(Asset.id.in_(stage.output_asset_ids))
+            .order_by(Asset.created_at, Asset.id)
+        )
+        return list(result.scalars())
+
+    async def is_fresh(self, stage: ProjectStage, input_hash: str) -> bool:
+        """Whether a stage completed with these inputs and its outputs remain."""
+        if stage.status != StageStatus.COMPLETED or stage.input_hash != input_hash:
+            return False
+        if not stage.output_asset_ids:
+            return True
+        remaining = await self.db.scalar(
+            select(func.count()).where(Asset.id.in_(stage.output_asset_ids))
+        )
+        return remaining == len(stage.output_asset_ids)
+
+    async def complete(
+        self,
+        stage: ProjectStage,
+        input_hash: str,
+        outputs: Sequence[Tuple[AssetType, str]],
+    ) -> List[UUID]:
+        """
+        Mark a stage COMPLETED with its checkpoint, recording its outputs as
+        assets in place of those of its previous run.
+
+        Args:
+            stage: The stage's row
+            input_hash: Hash of the inputs the stage ran with
+            outputs: (asset_type, path) of every output
+        """
+        if stage.output_asset_ids:
+            await self.db.execute(
+                delete(Asset).where(Asset.id.in_(stage.output_asset_ids))
+            )
+        now = datetime.now(timezone.utc)
+        output_ids = [uuid.uuid4() for _ in outputs]
+        if outputs:
+            await self.db.execute(
+                insert(Asset).values(
+                    [
+                        {
+                            "id": asset_id,
+                            "project_id": stage.project_id,
+                            "asset_type": asset_type,
+                            "path": path,
+                            "approved": False,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for asset_id, (asset_type, path) in zip(output_ids, outputs)
+                    ]
+                )
+            )
+        await self.db.execute(
+            update(ProjectStage)
+            .where(
+                ProjectStage.project_id == stage.project_id,
+                ProjectStage.stage == stage.stage,
+            )
+            .values(
+                status=StageStatus.COMPLETED,
+                error=None,
+                input_hash=input_hash,
+                output_asset_ids=output_ids,
+                finished_at=now,
+                updated_at=now,
+            )
+        )
+        return output_ids
+
+
+def get_read_project_stage_repository(
+    db: AsyncSession = Depends(get_read_db),
+) -> ProjectStageRepository:
+    return ProjectStageRepository(db)
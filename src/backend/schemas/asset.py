@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import UUID4, BaseModel
 
+AssetType = Literal["script", "narration", "video", "image", "slide"]
+
 
 class AssetBase(BaseModel):
     asset_type: str
@@ -22,3 +24,12 @@ class Asset(AssetBase):
 
     class Config:
         from_attributes = True
+
+
+class AssetPage(BaseModel):
+    items: List[Asset]
+    next_cursor: Optional[str] = None  # None when there are no more pages
+
+
+class AssetCounts(BaseModel):
+    counts: Dict[str, int]  # Assets per asset_type; types never created are absent
@@ -1,8 +1,14 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import UUID4, BaseModel
+from pydantic import UUID4, BaseModel, Field, field_validator
+from typing_extensions import TypedDict
+
+from .asset import Asset
+
+MAX_BATCH_SIZE = 1000
+MAX_STATUS_LOOKUP = 500
 
 
 class ProjectStatus(str, Enum):
@@ -32,11 +38,127 @@ class ProjectRead(ProjectBase):
         from_attributes = True
 
 
+class ProjectView(BaseModel):
+    """
+    A project restricted to the fields the caller asked for with `fields=`,
+    optionally with its assets. Responses leave out fields that were not set.
+    """
+
+    id: Optional[UUID4] = None
+    topic: Optional[str] = None
+    notes: Optional[str] = None
+    name: Optional[str] = None
+    status: Optional[ProjectStatus] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    assets: Optional[List[Asset]] = None
+
+
+class ProjectPage(BaseModel):
+    items: List[ProjectView]
+    next_cursor: Optional[str] = None  # None when there are no more pages
+
+
+# Plain-dict forms of ProjectView and ProjectPage. Routes build these from ORM
+# rows and serialize them with a TypeAdapter, which skips constructing and
+# re-validating a model per item; absent keys are simply not rendered.
+class ProjectViewData(TypedDict, total=False):
+    id: UUID4
+    topic: str
+    notes: Optional[str]
+    name: Optional[str]
+    status: ProjectStatus
+    created_at: datetime
+    updated_at: datetime
+    assets: List[Asset]
+
+
+class ProjectPageData(TypedDict):
+    items: List[ProjectViewData]
+    next_cursor: Optional[str]
+
+
+class ProjectSearchResult(ProjectRead):
+    rank: float  # Higher is a better match
+
+
+class ProjectSearchPage(BaseModel):
+    items: List[ProjectSearchResult]
+    next_cursor: Optional[str] = None  # None when there are no more pages
+
+
+class ProjectImportReject(BaseModel):
+    line: int  # Line of the file the rejected row ends on
+    error: str
+
+
+class ProjectImportResponse(BaseModel):
+    imported: int
+    rejected: int
+    rejects: List[ProjectImportReject]  # The first rejects, in file order
+
+
 class ProjectStatusResponse(BaseModel):
     status: ProjectStatus
 
 
+class ProjectStatusLookup(BaseModel):
+    ids: List[UUID4] = Field(min_length=1, max_length=MAX_STATUS_LOOKUP)
+
+
+class ProjectStatusLookupResponse(BaseModel):
+    statuses: Dict[UUID4, ProjectStatus]
+    missing: List[UUID4]  # Requested IDs that do not exist
+
+
+class ProjectStatusEvent(BaseModel):
+    """A status transition, as published to status stream subscribers."""
+
+    project_id: UUID4
+    status: ProjectStatus
+    updated_at: datetime
+
+
 class ProjectUpdate(BaseModel):
     topic: Optional[str] = None
     notes: Optional[str] = None
     status: Optional[ProjectStatus] = None
+
+
+class ProjectBatchUpdateItem(BaseModel):
+    id: UUID4
+    status: Optional[ProjectStatus] = None
+    notes: Optional[str] = None
+
+    @field_validator("status")
+    @classmethod
+    def status_not_null(cls, value: Optional[ProjectStatus]) -> ProjectStatus:
+        # May be left out, but projects.status is NOT NULL
+        if value is None:
+            raise ValueError("status may not be null")
+        return value
+
+
+# Batch items are validated one by one so a bad item is reported in its result
+# instead of rejecting the whole batch.
+class ProjectBatchCreate(BaseModel):
+    items: List[Dict[str, Any]] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+    enqueue: bool = False  # Queue process_project for every created project
+
+
+class ProjectBatchUpdate(BaseModel):
+    items: List[Dict[str, Any]] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class ProjectBatchItemResult(BaseModel):
+    index: int  # Position of the item in the request
+    project: Optional[ProjectRead] = None
+    error: Optional[str] = None
+
+
+class ProjectBatchResponse(BaseModel):
+    results: List[ProjectBatchItemResult]
+    succeeded: int
+    failed: int
+    task_group_id: Optional[str] = None  # Set when enqueue was requested
+    enqueue_error: Optional[str] = None
@@ -0,0 +1,48 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import UUID4, BaseModel
+
+
+class PipelineStage(str, Enum):
+    """Stages of a project's pipeline, in the order they are listed."""
+
+    SCRIPT = "script"
+    SCRIPT_PROCESSING = "script_processing"
+    SEGREGATION = "segregation"
+    NARRATION = "narration"
+    AVATAR = "avatar"
+    THUMBNAIL = "thumbnail"
+    IMAGES = "images"
+    SLIDES = "slides"
+    CLIPS = "clips"
+    COMPOSITION = "composition"
+
+
+class StageStatus(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class ProjectStageRead(BaseModel):
+    stage: PipelineStage
+    status: StageStatus
+    attempts: int  # Times the stage was started
+    error: Optional[str] = None  # Why the last attempt failed
+    output_asset_ids: List[UUID4] = []  # Assets produced by the last success
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectResumeResponse(BaseModel):
+    project_id: UUID4
+    task_id: str
+    # Completed stages, skipped unless their inputs changed since
+    completed_stages: List[PipelineStage]
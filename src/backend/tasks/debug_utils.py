@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, ParamSpec, TypeVar
 
@@ -12,9 +13,14 @@ from celery.signals import (
     task_postrun,
     task_prerun,
     worker_process_init,
+    worker_process_shutdown,
     worker_ready,
 )
 
+from src.backend.core.config import settings
+from src.backend.core.metrics import TASK_PREFLIGHT_DURATION
+from src.backend.core.query_timing import query_origin
+
 # Create a logger without handlers initially
 logger = logging.getLogger("celery.tasks.debug")
 logger.propagate = False  # Prevent duplicate logging
@@ -45,6 +51,88 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+class BrokerCircuitOpen(redis.ConnectionError):
+    """Raised without contacting the broker while its circuit is open."""
+
+
+class BrokerHealth:
+    """
+    Cached broker health check for the tasks of one worker process.
+    A successful PING is trusted for ttl seconds. A failed one opens the
+    circuit: for retry_interval seconds tasks fail straight away instead of
+    each waiting on its own connection attempt.
+    """
+
+    def __init__(
+        self, url: str, ttl: float, retry_interval: float, timeout: float = 2.0
+    ) -> None:
+        """
+        Args:
+            url: Broker URL; empty fails every check
+            ttl: Seconds a successful check is trusted
+            retry_interval: Seconds the circuit stays open after a failure
+            timeout: Seconds to wait for the broker to connect or answer
+        """
+        self.url = url
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self.timeout = timeout
+        self.pool: Optional[redis.ConnectionPool] = None
+        self._healthy_until = 0.0
+        self._open_until = 0.0
+
+    def connect(self) -> None:
+        """Create the connection pool; done after forking, as pools are not shared."""
+        self.close()
+        if self.url:
+            self.pool = redis.ConnectionPool.from_url(
+                self.url,
+                socket_timeout=self.timeout,
+                socket_connect_timeout=self.timeout,
+            )
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.disconnect()
+            self.pool = None
+        self._healthy_until = self._open_until = 0.0
+
+    def _ping(self) -> None:
+        if not self.url:
+            raise ValueError("CELERY_BROKER_URL not set")
+        if self.pool is None:
+            # Tasks run outside a worker process, e.g. eagerly
+            self.connect()
+        redis.Redis(connection_pool=self.pool).ping()
+
+    def check(self) -> str:
+        """
+        Make sure the broker is reachable, raising if it is not.
+        Returns whether that was known already (cached) or pinged.
+        """
+        now = time.monotonic()
+        if now < self._healthy_until:
+            return "cached"
+        if now < self._open_until:
+            raise BrokerCircuitOpen(
+                f"Broker unavailable, next check in {self._open_until - now:.1f}s"
+            )
+        try:
+            self._ping()
+        except Exception:
+            self._open_until = time.monotonic() + self.retry_interval
+            raise
+        self._healthy_until = time.monotonic() + self.ttl
+        return "pinged"
+
+
+broker_health = BrokerHealth(
+    os.getenv("CELERY_BROKER_URL", ""),
+    settings.CELERY_BROKER_HEALTH_TTL,
+    settings.CELERY_BROKER_RETRY_INTERVAL,
+)
+
+
 def debug_task(func: Callable[P, R]) -> Callable[P, R]:
     """Decorator to add debug logging to Celery tasks"""
 
@@ -63,22 +151,21 @@ def debug_task(func: Callable[P, R]) -> Callable[P, R]:
         )
         logger.debug(task_info)
 
+        started = time.perf_counter()
         try:
-            # Test Redis connection before task execution
-            redis_url = os.getenv("CELERY_BROKER_URL", "")  # Default to empty string
-            if not redis_url:
-                raise ValueError("CELERY_BROKER_URL not set")
-
-            redis_client = redis.from_url(redis_url)
-            redis_client.ping()
-            logger.debug(
-                "Redis connection test successful for task " + celery_task.name
-            )
+            # Check the broker before task execution
+            check = broker_health.check()
         except Exception as e:
+            check = "circuit_open" if isinstance(e, BrokerCircuitOpen) else "failed"
             logger.error(
                 f"Redis connection test failed for task {celery_task.name}: {str(e)}"
             )
             raise
+        finally:
+            TASK_PREFLIGHT_DURATION.labels(task=celery_task.name, check=check).observe(
+                time.perf_counter() - started
+            )
+        logger.debug(f"Redis connection test {check} for task {celery_task.name}")
 
         result = func(*args, **kwargs)
         logger.debug(
@@ -116,6 +203,13 @@ def on_worker_init(**kwargs: Any) -> None:
     broker_url = os.getenv("CELERY_BROKER_URL", "")
     logger.debug(f"Redis password length: {len(redis_password)}")
     logger.debug(f"Redis URL format check: {'redis://' in broker_url}")
+    # One pool per process: connections opened before the fork are not shared
+    broker_health.connect()
+
+
+@worker_process_shutdown.connect
+def on_worker_shutdown(**kwargs: Any) -> None:
+    broker_health.close()
 
 
 @task_failure.connect
@@ -149,6 +243,9 @@ def on_task_publish(
 def on_task_prerun(
     task_id: Optional[str] = None, task: Optional[Any] = None, *args: Any, **kwargs: Any
 ) -> None:
+    if task:
+        # Attributes SQL statement timings to the task that ran them
+        query_origin.set(task.name)
     if task and task_id:
         logger.debug(
             f"Task {task.name}[{task_id}] - "
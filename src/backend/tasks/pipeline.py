@@ -0,0 +1,283 @@
+"""
+Project pipeline as a DAG of stage tasks.
+PIPELINE lays the stages out: lists run in order, tuples run in parallel.
+build_pipeline turns it into a Celery canvas, where a list becomes a chain
+and a tuple a group, so each stage waits only for the stages it depends on
+(a group followed by a stage becomes a chord). A project's run then takes as
+long as its slowest path, not the sum of its stages.
+
+Every stage records its progress in project_stages. A failed stage marks
+the project ERROR and stops everything that depends on it. Stages already
+running in parallel finish and keep their results. Once every stage has
+succeeded, finish_pipeline marks the project COMPLETED.
+
+Stages are checkpointed: a stage's outputs are stored as Asset rows along
+with a hash of its inputs, which are the project's topic and notes and the
+assets of the stages it depends on. A run, such as one resumed after a
+failure, skips every stage whose inputs hash the same and whose assets still
+exist. Only the failed stages and those downstream of a changed output are
+paid for again.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+from celery import Task, chain, group
+from celery.canvas import Signature
+
+from src.backend.core.cache import ProjectCache
+from src.backend.core.config import settings
+from src.backend.core.events import publish_status
+from src.backend.core.metrics import PIPELINE_STAGES_SKIPPED
+from src.backend.models.asset import Asset
+from src.backend.models.project import Project
+from src.backend.repositories.project_stage import ProjectStageRepository
+from src.backend.schemas.asset import AssetType
+from src.backend.schemas.project import ProjectRead, ProjectStatus
+from src.backend.schemas.stage import PipelineStage, StageStatus
+from src.backend.tasks import celery_app
+from src.backend.tasks.debug_utils import debug_task
+from src.backend.tasks.runtime import async_task, get_runtime
+
+logger = logging.getLogger(__name__)
+
+Layout = Union[PipelineStage, List["Layout"], Tuple["Layout", ...]]
+
+PIPELINE: Layout = [
+    PipelineStage.SCRIPT,
+    PipelineStage.SCRIPT_PROCESSING,
+    PipelineStage.SEGREGATION,
+    (
+        [PipelineStage.NARRATION, PipelineStage.AVATAR],
+        PipelineStage.THUMBNAIL,
+        [(PipelineStage.IMAGES, PipelineStage.SLIDES), PipelineStage.CLIPS],
+    ),
+    PipelineStage.COMPOSITION,
+]
+
+
+@dataclass(frozen=True)
+class StageContext:
+    """What a stage is given to work from."""
+
+    project_id: UUID
+    stage: PipelineStage
+    topic: str
+    notes: Optional[str]
+    # Assets produced by each stage this one depends on
+    inputs: Dict[PipelineStage, List[Asset]]
+
+    def input_hash(self) -> str:
+        """Hash the inputs; a stage that ran with the same hash is not rerun."""
+        payload = {
+            "stage": self.stage.value,
+            "topic": self.topic,
+            "notes": self.notes,
+            "inputs": {
+                stage.value: [[str(asset.id), asset.path] for asset in assets]
+                for stage, assets in self.inputs.items()
+            },
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+# (asset_type, path) of an asset a stage produced
+StageOutput = Tuple[AssetType, str]
+StageHandler = Callable[[StageContext], Awaitable[List[StageOutput]]]
+
+# Stands in for stages whose modules are not written yet
+PLACEHOLDER_STAGE_SECONDS = 0.5
+PLACEHOLDER_ASSET_TYPES: Dict[PipelineStage, AssetType] = {
+    PipelineStage.SCRIPT: "script",
+    PipelineStage.SCRIPT_PROCESSING: "script",
+    PipelineStage.SEGREGATION: "script",
+    PipelineStage.NARRATION: "narration",
+    PipelineStage.AVATAR: "video",
+    PipelineStage.THUMBNAIL: "image",
+    PipelineStage.IMAGES: "image",
+    PipelineStage.SLIDES: "slide",
+    PipelineStage.CLIPS: "video",
+    PipelineStage.COMPOSITION: "video",
+}
+
+
+async def _placeholder(context: StageContext) -> List[StageOutput]:
+    await asyncio.sleep(PLACEHOLDER_STAGE_SECONDS)
+    return [
+        (
+            PLACEHOLDER_ASSET_TYPES[context.stage],
+            f"placeholder/{context.project_id}/{context.stage.value}",
+        )
+    ]
+
+
+STAGE_HANDLERS: Dict[PipelineStage, StageHandler] = {
+    stage: _placeholder for stage in PipelineStage
+}
+
+
+Dependencies = Dict[PipelineStage, FrozenSet[PipelineStage]]
+
+
+def _dependencies(
+    layout: Layout, after: FrozenSet[PipelineStage], into: Dependencies
+) -> FrozenSet[PipelineStage]:
+    """Record what each stage of layout waits for; returns its last stages."""
+    if isinstance(layout, PipelineStage):
+        into[layout] = after
+        return frozenset({layout})
+    if isinstance(layout, list):
+        for part in layout:
+            after = _dependencies(part, after, into)
+        return after
+    last: FrozenSet[PipelineStage] = frozenset()
+    for part in layout:
+        last |= _dependencies(part, after, into)
+    return last
+
+
+def stage_dependencies(layout: Layout = PIPELINE) -> Dependencies:
+    """Get the stages each stage directly depends on."""
+    dependencies: Dependencies = {}
+    _dependencies(layout, frozenset(), dependencies)
+    return dependencies
+
+
+def _canvas(layout: Layout, project_id: str) -> Signature:
+    if isinstance(layout, PipelineStage):
+        return run_stage.si(project_id, layout.value)
+    parts = [_canvas(part, project_id) for part in layout]
+    if len(parts) == 1:
+        return parts[0]
+    return chain(*parts) if isinstance(layout, list) else group(*parts)
+
+
+def build_pipeline(project_id: str, layout: Layout = PIPELINE) -> Signature:
+    """Build the canvas running a project's stages, then finish_pipeline."""
+    return chain(_canvas(layout, project_id), finish_pipeline.si(project_id))
+
+
+async def _announce_status(redis_client: Any, project: Project) -> None:
+    """Refresh the cached project and notify status stream subscribers."""
+    cache = ProjectCache(redis_client, settings.PROJECT_CACHE_TTL)
+    await cache.set_project(ProjectRead.model_validate(project))
+    await publish_status(redis_client, project.id, project.status, project.updated_at)
+
+
+async def _set_project_status(project_id: UUID, status: ProjectStatus) -> None:
+    runtime = get_runtime()
+    async with runtime.sessions() as db:
+        project = await db.get(Project, project_id)
+        if project is None:
+            # Deleted while running; drop what is still cached of it
+            cache = ProjectCache(runtime.redis, settings.PROJECT_CACHE_TTL)
+            await cache.invalidate(project_id)
+            return
+        project.status = status
+        await db.commit()
+        logger.info(f"Project {project_id} status updated to {status.value}")
+        await _announce_status(runtime.redis, project)
+
+
+@async_task
+async def start_pipeline(project_id: str, layout: Layout = PIPELINE) -> bool:
+    """
+    Mark a project PROCESSING and its stages PENDING, except for completed
+    stages, whose checkpoints may be reused. Returns False if there is no
+    such project.
+    """
+    runtime = get_runtime()
+    async with runtime.sessions() as db:
+        project = await db.get(Project, UUID(project_id))
+        if project is None:
+            logger.error(f"Project not found: {project_id}")
+            return False
+        project.status = ProjectStatus.PROCESSING
+        await ProjectStageRepository(db).reset(project.id, stage_dependencies(layout))
+        await db.commit()
+        logger.info(f"Project {project_id} status updated to PROCESSING")
+        await _announce_status(runtime.redis, project)
+    return True
+
+
+@celery_app.task(bind=True, name="run_stage")
+@debug_task
+@async_task
+async def run_stage(self: Task, project_id: str, stage: str) -> None:
+    """
+    Run one stage of a project's pipeline, recording its progress and
+    checkpoint. Skipped if the checkpoint of an earlier run still holds.
+
+    Args:
+        self: The Celery task instance
+        project_id: The UUID of the project
+        stage: The PipelineStage value to run
+    """
+    project_uuid = UUID(project_id)
+    pipeline_stage = PipelineStage(stage)
+    async with get_runtime().sessions() as db:
+        stages = ProjectStageRepository(db)
+        project = await db.get(Project, project_uuid)
+        rows = {row.stage: row for row in await stages.list(project_uuid)}
+        row = rows.get(stage)
+        if project is None or row is None:
+            logger.error(f"Stage {stage} not started for project {project_id}")
+            return
+        context = StageContext(
+            project_id=project_uuid,
+            stage=pipeline_stage,
+            topic=project.topic,
+            notes=project.notes,
+            inputs={
+                dependency: await stages.outputs(rows[dependency.value])
+                for dependency in stage_dependencies()[pipeline_stage]
+            },
+        )
+        input_hash = context.input_hash()
+        if await stages.is_fresh(row, input_hash):
+            logger.info(f"Skipping stage {stage} for project {project_id}: unchanged")
+            PIPELINE_STAGES_SKIPPED.labels(stage=stage).inc()
+            return
+
+        await stages.set_status(project_uuid, pipeline_stage, StageStatus.RUNNING)
+        await db.commit()
+        try:
+            outputs = await STAGE_HANDLERS[pipeline_stage](context)
+        except Exception as e:
+            logger.exception(f"Stage {stage} failed for project {project_id}")
+            await db.rollback()
+            try:
+                await stages.set_status(
+                    project_uuid, pipeline_stage, StageStatus.FAILED, error=str(e)
+                )
+                await db.commit()
+                await _set_project_status(project_uuid, ProjectStatus.ERROR)
+            except Exception as record_error:
+                logger.exception(f"Failed to record stage failure: {str(record_error)}")
+            # Re-raise the exception for Celery
+            raise
+        await stages.complete(row, input_hash, outputs)
+        await db.commit()
+
+
+@celery_app.task(name="finish_pipeline")
+@debug_task
+@async_task
+async def finish_pipeline(project_id: str) -> None:
+    """Mark a project COMPLETED once every stage has succeeded."""
+    await _set_project_status(UUID(project_id), ProjectStatus.COMPLETED)
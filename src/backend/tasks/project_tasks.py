@@ -1,5 +1,4 @@
 # mypy: disable-error-code="import-untyped"
-import asyncio
 import logging
 import os
 from datetime import datetime
@@ -7,14 +6,11 @@ from typing import Any, Dict, cast
 
 import redis
 from celery import Task
-from sqlalchemy import select
 from typing_extensions import ParamSpec
 
-from src.backend.core.database import AsyncSessionLocal
-from src.backend.models.project import Project
-from src.backend.schemas.project import ProjectStatus
 from src.backend.tasks import celery_app
 from src.backend.tasks.debug_utils import debug_task
+from src.backend.tasks.pipeline import build_pipeline, start_pipeline
 
 logger = logging.getLogger(__name__)
 P = ParamSpec("P")
@@ -206,59 +202,17 @@ def celery_debug_task(arg1: int, arg2: int) -> int:
 
 @celery_app.task(bind=True, name="process_project")
 @debug_task
-def process_project(self: Task, project_id: str) -> None:
+def process_project(self: Task, project_id: str) -> Any:
     """
-    Process a project with enhanced error handling and status updates.
+    Process a project by running its stage pipeline (see tasks/pipeline.py).
+    The task is replaced by the pipeline, so its result is that of the last
+    stage and waiting on it waits for the whole pipeline.
 
     Args:
         self: The Celery task instance
         project_id: The UUID of the project to process
     """
     logger.info(f"Starting process_project for project_id: {project_id}")
-
-    # Run the async parts in an event loop
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    try:
-        loop.run_until_complete(_process_project_async(project_id))
-    finally:
-        loop.close()
-
-
-async def _process_project_async(project_id: str) -> None:
-    """Async implementation of project processing"""
-    # Create a new database session for this task
-    async with AsyncSessionLocal() as db:
-        try:
-            # Get the project
-            result = await db.execute(select(Project).where(Project.id == project_id))
-            project = result.scalar_one_or_none()
-            if project is None:
-                logger.error(f"Project not found: {project_id}")
-                return
-            # Update to PROCESSING
-            project.status = ProjectStatus.PROCESSING
-            await db.commit()
-            await db.refresh(project)
-            logger.info(f"Project {project_id} status updated to PROCESSING")
-            # Simulate work (replace with actual processing)
-            await asyncio.sleep(5)
-            # Update to COMPLETED
-            project.status = ProjectStatus.COMPLETED
-            await db.commit()
-            logger.info(f"Project {project_id} status updated to COMPLETED")
-        except Exception as e:
-            logger.exception(f"Error processing project {project_id}: {str(e)}")
-            await db.rollback()
-            if project:
-                try:
-                    project.status = ProjectStatus.ERROR
-                    await db.commit()
-                    logger.info(f"Project {project_id} status updated to ERROR")
-                except Exception as commit_error:
-                    logger.exception(
-                        f"Failed to update project status to ERROR: {str(commit_error)}"
-                    )
-            # Re-raise the exception for Celery
-            raise
+    if not start_pipeline(project_id):
+        return None
+    return self.replace(build_pipeline(project_id))
@@ -0,0 +1,51 @@
+"""
+Awaiting Celery results from async code.
+AsyncResult.get() blocks the calling thread until the task finishes, which in
+an async route freezes the whole event loop. await_result polls the result
+backend from a worker thread instead and sleeps between polls on the loop.
+"""
+
+import asyncio
+from typing import Any
+
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from celery.result import AsyncResult
+
+
+async def await_result(
+    result: AsyncResult,
+    timeout: float = 10.0,
+    poll_interval: float = 0.05,
+    max_poll_interval: float = 0.5,
+    propagate: bool = True,
+) -> Any:
+    """
+    Wait for a task result without blocking the event loop.
+
+    Args:
+        result: The result handle returned by delay() or apply_async()
+        timeout: Seconds to wait before giving up
+        poll_interval: Initial delay between polls; doubles after each poll
+        max_poll_interval: Upper bound for the delay between polls
+        propagate: Re-raise the task's exception if it failed
+
+    Returns:
+        Any: The task's return value
+
+    Raises:
+        celery.exceptions.TimeoutError: If the task is not ready in time
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = poll_interval
+    # Each backend round trip is blocking I/O, so it runs in a thread
+    while not await asyncio.to_thread(result.ready):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise CeleryTimeoutError(
+                f"Task {result.id} not ready after {timeout} seconds"
+            )
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_poll_interval)
+    # ready() has fetched and cached the final state, so this returns at once
+    return result.get(propagate=propagate)
@@ -0,0 +1,171 @@
+"""
+Async runtime for Celery worker processes.
+asyncpg connections belong to the event loop that opened them, so async tasks
+cannot share the API's engine, nor open a fresh loop per run without also
+reconnecting every time. Instead each worker process gets one long-lived loop
+with its own engine, session factory and Redis client, created in
+worker_process_init and disposed on shutdown.
+
+Tasks declared with @async_task are coroutines run to completion on that loop:
+
+    @celery_app.task(name="example")
+    @async_task
+    async def example(project_id: str) -> None:
+        async with get_runtime().sessions() as db:
+            ...
+
+In asyncio worker mode (CELERY_WORKER_MODE=asyncio, see celeryconfig.py) the
+worker uses AsyncioTaskPool instead of prefork processes. The loop then runs
+in a thread of its own and the pool's threads only wait on it, so up to
+CELERY_ASYNC_CONCURRENCY tasks await I/O concurrently in a single process.
+Messages are still consumed, acknowledged late and retried by Celery itself.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Coroutine, Optional, ParamSpec, TypeVar
+
+from celery.concurrency.thread import TaskPool
+from celery.signals import worker_process_init, worker_process_shutdown
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.backend.core.database import create_engine_from_settings
+from src.backend.core.redis import aclose, create_redis
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class WorkerRuntime:
+    loop: asyncio.AbstractEventLoop
+    engine: AsyncEngine
+    sessions: async_sessionmaker[AsyncSession]
+    redis: Optional["Redis[Any]"]
+    # Runs the loop in asyncio worker mode; tasks then submit to it
+    thread: Optional[threading.Thread] = None
+
+    def close(self) -> None:
+        async def dispose() -> None:
+            await self.engine.dispose()
+            if self.redis is not None:
+                await aclose(self.redis)
+
+        if self.thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+        try:
+            self.loop.run_until_complete(dispose())
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            self.loop.close()
+
+
+_runtime: Optional[WorkerRuntime] = None
+
+
+def start_runtime(
+    loop: Optional[asyncio.AbstractEventLoop] = None, background: bool = False
+) -> WorkerRuntime:
+    """
+    Create the process's runtime, replacing any inherited from a parent.
+
+    Args:
+        loop: Loop to run tasks on; a new one by default
+        background: Run the loop in a thread of its own, so tasks from
+            several threads can share it
+    """
+    global _runtime
+    # A runtime copied from a forked parent is unusable in the child, and
+    # closing it would close the parent's connections
+    _runtime = None
+    loop = loop or asyncio.new_event_loop()
+    thread = None
+    if background:
+        thread = threading.Thread(
+            target=_run_forever, args=(loop,), name="async-tasks", daemon=True
+        )
+        thread.start()
+    # The loop is driven explicitly and is not made the thread's current
+    # loop, which belongs to whoever called us, e.g. a test runner
+    engine = create_engine_from_settings(name="worker")
+    _runtime = WorkerRuntime(
+        loop=loop,
+        engine=engine,
+        sessions=async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        ),
+        redis=create_redis(),
+        thread=thread,
+    )
+    return _runtime
+
+
+def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def get_runtime() -> WorkerRuntime:
+    """Get the process's runtime, starting it if tasks run outside a worker."""
+    return _runtime or start_runtime()
+
+
+def stop_runtime() -> None:
+    """Dispose of the engine and Redis client and close the loop."""
+    global _runtime
+    if _runtime is not None:
+        runtime, _runtime = _runtime, None
+        runtime.close()
+
+
+def async_task(func: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, R]:
+    """Run a coroutine function as a synchronous task on the process's loop."""
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        runtime = get_runtime()
+        coroutine = func(*args, **kwargs)
+        if runtime.thread is not None:
+            return asyncio.run_coroutine_threadsafe(coroutine, runtime.loop).result()
+        return runtime.loop.run_until_complete(coroutine)
+
+    return wrapper
+
+
+class AsyncioTaskPool(TaskPool):
+    """
+    Thread pool whose threads share the process's event loop.
+    Its concurrency bounds how many tasks run at once; a thread costs little
+    while its task's coroutine is awaiting.
+    """
+
+    def on_start(self) -> None:
+        start_runtime(background=True)
+        logger.info(f"Started async task runtime for {self.limit} concurrent tasks")
+        super().on_start()
+
+    def on_stop(self) -> None:
+        super().on_stop()
+        stop_runtime()
+
+
+@worker_process_init.connect
+def on_worker_process_init(**kwargs: Any) -> None:
+    start_runtime()
+    logger.info("Started async task runtime")
+
+
+@worker_process_shutdown.connect
+def on_worker_process_shutdown(**kwargs: Any) -> None:
+    stop_runtime()
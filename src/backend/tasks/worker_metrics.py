@@ -0,0 +1,65 @@
+"""
+Prometheus endpoint for Celery workers.
+Metrics recorded by tasks, such as broker preflight times, SQL statement
+timings and pool gauges, live in the worker's processes, which the API's
+/metrics never sees. With CELERY_METRICS_PORT set, the worker's main process
+serves them on that port for Prometheus to scrape.
+
+Prefork children each have registries of their own. For prefork workers set
+PROMETHEUS_MULTIPROC_DIR to a directory writable by the worker: every process
+then writes its samples there and the endpoint adds them up, keeping the
+counts of children that were replaced. Set it for workers only; the API
+serves its own registry.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from celery.signals import worker_init, worker_process_shutdown
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    multiprocess,
+    start_http_server,
+)
+
+from src.backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def multiprocess_dir() -> Optional[str]:
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def worker_registry() -> CollectorRegistry:
+    """Get the registry to export: the samples of every process, if shared."""
+    if multiprocess_dir() is None:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+@worker_init.connect
+def start_metrics_server(**kwargs: Any) -> None:
+    """Serve the worker's metrics; runs before the pool starts its processes."""
+    if settings.CELERY_METRICS_PORT is None:
+        return
+    directory = multiprocess_dir()
+    if directory is not None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        # Samples left by an earlier run would be added to this one's
+        for path in Path(directory).glob("*.db"):
+            path.unlink()
+    start_http_server(settings.CELERY_METRICS_PORT, registry=worker_registry())
+    logger.info(f"Serving worker metrics on port {settings.CELERY_METRICS_PORT}")
+
+
+@worker_process_shutdown.connect
+def on_worker_process_shutdown(pid: int, **kwargs: Any) -> None:
+    # Drop the gauges of a replaced child; its counters keep counting
+    if multiprocess_dir() is not None:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,168 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException, Response
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.backend.api.idempotency import REPLAYED_HEADER, Idempotency, record_key
+from src.backend.schemas.project import (
+    ProjectCreate,
+    ProjectStatus,
+    ProjectStatusResponse,
+)
+
+
+class FakeLock:
+    def __init__(self, lock: asyncio.Lock, blocking_timeout: float) -> None:
+        self.lock = lock
+        self.blocking_timeout = blocking_timeout
+
+    async def acquire(self) -> bool:
+        try:
+            await asyncio.wait_for(self.lock.acquire(), self.blocking_timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def release(self) -> None:
+        self.lock.release()
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for Idempotency."""
+
+    def __init__(self) -> None:
+        self.values: Dict[str, str] = {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+
+    async def get(self, name: str) -> Optional[str]:
+        return self.values.get(name)
+
+    async def set(self, name: str, value: str, ex: Optional[int] = None) -> None:
+        self.values[name] = value
+
+    def lock(self, name: str, timeout: float, blocking_timeout: float) -> FakeLock:
+        return FakeLock(self.locks.setdefault(name, asyncio.Lock()), blocking_timeout)
+
+
+def make_idempotency(
+    redis: Any, key: Optional[str] = "key-1", wait_timeout: float = 1
+) -> Idempotency:
+    return Idempotency(redis, key, ttl=60, lock_timeout=30, wait_timeout=wait_timeout)
+
+
+class Handler:
+    def __init__(self, delay: float = 0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self) -> ProjectStatusResponse:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return ProjectStatusResponse(status=ProjectStatus.CREATED)
+
+
+REQUEST = ProjectCreate(topic="Topic")
+
+
+@pytest.mark.asyncio
+async def test_repeat_replays_stored_response() -> None:
+    redis_client = FakeRedis()
+    handler = Handler()
+
+    first = await make_idempotency(redis_client).execute(
+        "create", REQUEST, handler, 201
+    )
+    repeat = await make_idempotency(redis_client).execute(
+        "create", REQUEST, handler, 201
+    )
+
+    assert first == ProjectStatusResponse(status=ProjectStatus.CREATED)
+    assert handler.calls == 1
+    assert isinstance(repeat, Response)
+    assert repeat.status_code == 201
+    assert json.loads(repeat.body) == {"status": "CREATED"}
+    assert repeat.headers[REPLAYED_HEADER] == "true"
+    assert record_key("create", "key-1") in redis_client.values
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_run_once() -> None:
+    redis_client = FakeRedis()
+    handler = Handler(delay=0.05)
+
+    results = await asyncio.gather(
+        *(
+            make_idempotency(redis_client).execute("create", REQUEST, handler)
+            for _ in range(3)
+        )
+    )
+
+    assert handler.calls == 1
+    assert sum(1 for r in results if isinstance(r, ProjectStatusResponse)) == 1
+
+
+@pytest.mark.asyncio
+async def test_in_progress_timeout_is_conflict() -> None:
+    redis_client = FakeRedis()
+    slow = asyncio.ensure_future(
+        make_idempotency(redis_client).execute("create", REQUEST, Handler(delay=0.2))
+    )
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await make_idempotency(redis_client, wait_timeout=0.01).execute(
+            "create", REQUEST, Handler()
+        )
+    assert exc_info.value.status_code == 409
+    await slow
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_different_request() -> None:
+    redis_client = FakeRedis()
+    await make_idempotency(redis_client).execute("create", REQUEST, Handler())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await make_idempotency(redis_client).execute(
+            "create", ProjectCreate(topic="Other"), Handler()
+        )
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_not_stored() -> None:
+    redis_client = FakeRedis()
+
+    async def failing() -> ProjectStatusResponse:
+        raise HTTPException(status_code=500, detail="Database connection error")
+
+    with pytest.raises(HTTPException):
+        await make_idempotency(redis_client).execute("create", REQUEST, failing)
+    handler = Handler()
+    await make_idempotency(redis_client).execute("create", REQUEST, handler)
+    assert handler.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_runs_without_key_or_redis() -> None:
+    handler = Handler()
+    await make_idempotency(FakeRedis(), key=None).execute("create", REQUEST, handler)
+    await make_idempotency(None).execute("create", REQUEST, handler)
+    assert handler.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_runs_request() -> None:
+    redis_client = FakeRedis()
+    handler = Handler()
+
+    async def acquire(self: FakeLock) -> bool:
+        raise RedisConnectionError("down")
+
+    with patch.object(FakeLock, "acquire", acquire):
+        await make_idempotency(redis_client).execute("create", REQUEST, handler)
+    assert handler.calls == 1
@@ -1,9 +1,26 @@
+import csv
+import io
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
 import pytest
 from httpx import AsyncClient
-from uuid import uuid4, UUID
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.backend.schemas.project import ProjectCreate, ProjectStatus
+
+from src.backend.core.cache import CachedProjectStatus, ProjectCache, get_project_cache
+from src.backend.core.redis import get_redis
+from src.backend.main import app
+from src.backend.models.asset import Asset
 from src.backend.models.project import Project
+from src.backend.repositories.project_stage import ProjectStageRepository
+from src.backend.schemas.project import ProjectCreate, ProjectRead, ProjectStatus
+from src.backend.schemas.stage import PipelineStage, StageStatus
+from src.backend.tests.test_api.test_idempotency import FakeRedis
 
 # No autouse fixture needed here.
 
@@ -31,6 +48,27 @@ async def test_create_project(client: AsyncClient, db_session: AsyncSession, set
     assert retrieved_project.name == "Test Name"
 
 
+@pytest.mark.asyncio
+async def test_create_project_idempotency_key(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that a retried create with the same Idempotency-Key creates one project"""
+    redis_client = FakeRedis()
+    app.dependency_overrides[get_redis] = lambda: redis_client
+    headers = {"Idempotency-Key": "create-once"}
+    project_data = {"topic": "Idempotent Topic"}
+
+    first = await client.post("/api/v1/projects/", json=project_data, headers=headers)
+    repeat = await client.post("/api/v1/projects/", json=project_data, headers=headers)
+    assert first.status_code == repeat.status_code == 201
+    assert repeat.json() == first.json()
+    assert repeat.headers["idempotent-replayed"] == "true"
+
+    result = await db_session.execute(select(Project).filter(Project.topic == "Idempotent Topic"))
+    assert len(result.scalars().all()) == 1
+
+    response = await client.post("/api/v1/projects/", json={"topic": "Different"}, headers=headers)
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_create_project_missing_topic(client: AsyncClient, db_session: AsyncSession, setup_database):
     """Test project creation with missing required field"""
@@ -94,6 +132,204 @@ async def test_get_project(client: AsyncClient, db_session: AsyncSession, setup_
     assert project_data["status"] == "CREATED"
 
 
+@pytest.mark.asyncio
+async def test_get_project_sparse_fields(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test returning only the requested fields, with assets on request"""
+    project = Project(id=uuid4(), topic="Sparse Topic", notes="Test Notes", status="CREATED")
+    db_session.add(project)
+    await db_session.flush()
+    db_session.add(Asset(id=uuid4(), project_id=project.id, asset_type="script", path="/tmp/script.txt"))
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/projects/{project.id}", params={"fields": "id,status,topic"})
+    assert response.status_code == 200
+    assert response.json() == {"id": str(project.id), "status": "CREATED", "topic": "Sparse Topic"}
+
+    response = await client.get(f"/api/v1/projects/{project.id}", params={"fields": "id", "include": "assets"})
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"id", "assets"}
+    assert [asset["asset_type"] for asset in data["assets"]] == ["script"]
+
+    # Assets are only loaded when asked for
+    response = await client.get(f"/api/v1/projects/{project.id}")
+    assert "assets" not in response.json()
+
+    response = await client.get(f"/api/v1/projects/{project.id}", params={"fields": "id,owner"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_project_assets(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test paginating and filtering a project's assets"""
+    project = Project(id=uuid4(), topic="Many Assets", status="PROCESSING")
+    db_session.add(project)
+    await db_session.flush()
+    start = datetime.now(timezone.utc)
+    for i, (asset_type, approved) in enumerate([("script", True), ("slide", False), ("slide", True)]):
+        db_session.add(
+            Asset(
+                id=uuid4(),
+                project_id=project.id,
+                asset_type=asset_type,
+                path=f"/tmp/{i}",
+                approved=approved,
+                created_at=start + timedelta(seconds=i),
+            )
+        )
+    await db_session.commit()
+    url = f"/api/v1/projects/{project.id}/assets"
+
+    response = await client.get(url, params={"limit": 2})
+    assert response.status_code == 200
+    page = response.json()
+    assert [asset["path"] for asset in page["items"]] == ["/tmp/0", "/tmp/1"]
+    assert page["next_cursor"] is not None
+
+    response = await client.get(url, params={"limit": 2, "cursor": page["next_cursor"]})
+    assert [asset["path"] for asset in response.json()["items"]] == ["/tmp/2"]
+    assert response.json()["next_cursor"] is None
+
+    response = await client.get(url, params={"asset_type": "slide", "approved": "true"})
+    assert [asset["path"] for asset in response.json()["items"]] == ["/tmp/2"]
+
+    response = await client.get(url, params={"asset_type": "video"})
+    assert response.json() == {"items": [], "next_cursor": None}
+
+    response = await client.get(url, params={"asset_type": "podcast"})
+    assert response.status_code == 422
+    response = await client.get(url, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
+    response = await client.get(f"/api/v1/projects/{uuid4()}/assets")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_asset_counts(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that per-type asset counts follow inserts, updates and deletes"""
+    project = Project(id=uuid4(), topic="Counted", status="PROCESSING")
+    db_session.add(project)
+    await db_session.flush()
+    assets = [
+        Asset(id=uuid4(), project_id=project.id, asset_type=asset_type, path=f"/tmp/{i}")
+        for i, asset_type in enumerate(["slide", "slide", "image"])
+    ]
+    db_session.add_all(assets)
+    await db_session.commit()
+    url = f"/api/v1/projects/{project.id}/assets/counts"
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.json() == {"counts": {"slide": 2, "image": 1}}
+
+    assets[0].asset_type = "video"
+    await db_session.delete(assets[2])
+    await db_session.commit()
+    response = await client.get(url)
+    assert response.json() == {"counts": {"slide": 1, "image": 0, "video": 1}}
+
+    with count_statements(db_session) as statements:
+        await client.get(url)
+        await client.get(f"/api/v1/projects/{project.id}/status")
+    assert not any("FROM assets" in statement for statement in statements)
+
+    response = await client.get(f"/api/v1/projects/{uuid4()}/assets/counts")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_projects_sparse_fields(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test sparse fieldsets on the project listing"""
+    for i in range(3):
+        await client.post("/api/v1/projects/", json={"topic": f"Topic {i}"})
+
+    response = await client.get("/api/v1/projects/", params={"fields": "topic", "limit": 2})
+    assert response.status_code == 200
+    page = response.json()
+    assert page["items"] == [{"topic": "Topic 2"}, {"topic": "Topic 1"}]
+    assert page["next_cursor"] is not None
+
+    response = await client.get("/api/v1/projects/", params={"fields": "topic", "cursor": page["next_cursor"]})
+    assert response.json() == {"items": [{"topic": "Topic 0"}], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_get_project_from_cache(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that a cached project is served without a database row"""
+    now = datetime.now(timezone.utc)
+    cached = ProjectRead(
+        id=uuid4(), topic="Cached Topic", status=ProjectStatus.PROCESSING, created_at=now, updated_at=now
+    )
+    cache = ProjectCache(None, ttl=60)
+    cache.get_project = AsyncMock(return_value=cached)  # type: ignore[method-assign]
+    cache.get_status = AsyncMock(  # type: ignore[method-assign]
+        return_value=CachedProjectStatus.of(cached)
+    )
+    app.dependency_overrides[get_project_cache] = lambda: cache
+
+    response = await client.get(f"/api/v1/projects/{cached.id}")
+    assert response.status_code == 200
+    assert response.json()["topic"] == "Cached Topic"
+
+    response = await client.get(f"/api/v1/projects/{cached.id}/status")
+    assert response.status_code == 200
+    assert response.json() == {"status": "PROCESSING"}
+
+    # Revalidation is answered from the cached version stamp as well
+    response = await client.get(
+        f"/api/v1/projects/{cached.id}/status", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_get_project_conditional(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test ETag and Last-Modified revalidation of a project"""
+    response = await client.post("/api/v1/projects/", json={"topic": "Conditional Topic"})
+    project_id = response.json()["id"]
+
+    response = await client.get(f"/api/v1/projects/{project_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "no-cache"
+
+    response = await client.get(f"/api/v1/projects/{project_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await client.get(f"/api/v1/projects/{project_id}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    # A write changes the validator
+    await client.patch(f"/api/v1/projects/{project_id}", json={"notes": "changed"})
+    response = await client.get(f"/api/v1/projects/{project_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["notes"] == "changed"
+
+
+@pytest.mark.asyncio
+async def test_get_status_conditional(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test ETag revalidation of a project status"""
+    response = await client.post("/api/v1/projects/", json={"topic": "Conditional Topic"})
+    project_id = response.json()["id"]
+
+    response = await client.get(f"/api/v1/projects/{project_id}/status")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(f"/api/v1/projects/{project_id}/status", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.patch(f"/api/v1/projects/{project_id}", json={"status": "PROCESSING"})
+    response = await client.get(f"/api/v1/projects/{project_id}/status", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == {"status": "PROCESSING"}
+
+
 @pytest.mark.asyncio
 async def test_get_project_not_found(client: AsyncClient, db_session: AsyncSession, setup_database):
     """Test getting a non-existent project by ID"""
@@ -125,9 +361,11 @@ async def test_list_projects(client: AsyncClient, db_session: AsyncSession, setu
     # Get the list of projects via the API
     response = await client.get("/api/v1/projects/")
     assert response.status_code == 200
-    projects = response.json()
+    page = response.json()
+    projects = page["items"]
     assert isinstance(projects, list)
     assert len(projects) == 2
+    assert page["next_cursor"] is None
 
     # Check if the projects have expected data (optional, but good practice)
     topics = {project["topic"] for project in projects}
@@ -135,6 +373,278 @@ async def test_list_projects(client: AsyncClient, db_session: AsyncSession, setu
     assert "Topic 2" in topics
 
 
+@pytest.mark.asyncio
+async def test_list_projects_keyset_pagination(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test walking the project list page by page with next_cursor"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all(
+        [
+            Project(id=uuid4(), topic=f"Topic {i}", status="CREATED", created_at=base + timedelta(minutes=i))
+            for i in range(5)
+        ]
+    )
+    await db_session.commit()
+
+    seen: List[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/projects/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(project["topic"] for project in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    # Newest first, every project exactly once
+    assert seen == [f"Topic {i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_list_projects_filters(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test filtering the project list by status, topic prefix and created_at range"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all(
+        [
+            Project(id=uuid4(), topic="Cats 101", status="CREATED", created_at=base),
+            Project(id=uuid4(), topic="Cats_advanced", status="COMPLETED", created_at=base + timedelta(days=1)),
+            Project(id=uuid4(), topic="Dogs 101", status="CREATED", created_at=base + timedelta(days=2)),
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/v1/projects/", params={"status": "CREATED"})
+    assert {p["topic"] for p in response.json()["items"]} == {"Cats 101", "Dogs 101"}
+
+    response = await client.get("/api/v1/projects/", params={"topic_prefix": "Cats"})
+    assert {p["topic"] for p in response.json()["items"]} == {"Cats 101", "Cats_advanced"}
+
+    # LIKE wildcards in the prefix are matched literally
+    response = await client.get("/api/v1/projects/", params={"topic_prefix": "Cats_"})
+    assert [p["topic"] for p in response.json()["items"]] == ["Cats_advanced"]
+
+    response = await client.get(
+        "/api/v1/projects/",
+        params={
+            "created_after": (base + timedelta(hours=1)).isoformat(),
+            "created_before": (base + timedelta(days=2)).isoformat(),
+        },
+    )
+    assert [p["topic"] for p in response.json()["items"]] == ["Cats_advanced"]
+
+
+@pytest.mark.asyncio
+async def test_search_projects(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test ranked, paginated search over topic, name and notes"""
+    db_session.add_all(
+        [
+            Project(id=uuid4(), topic="Training cats", status="CREATED"),
+            Project(id=uuid4(), topic="Dog food", notes="Cats will not eat this", status="CREATED"),
+            Project(id=uuid4(), topic="Gardening", status="CREATED"),
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/v1/projects/search", params={"q": "cats", "limit": 1})
+    assert response.status_code == 200
+    first = response.json()
+    # A topic match outranks a notes match
+    assert [p["topic"] for p in first["items"]] == ["Training cats"]
+    response = await client.get("/api/v1/projects/search", params={"q": "cats", "cursor": first["next_cursor"]})
+    second = response.json()
+    assert [p["topic"] for p in second["items"]] == ["Dog food"]
+    assert second["next_cursor"] is None
+    assert first["items"][0]["rank"] > second["items"][0]["rank"]
+
+    # Typos still find the topic through trigram similarity
+    response = await client.get("/api/v1/projects/search", params={"q": "Gardenign"})
+    assert [p["topic"] for p in response.json()["items"]] == ["Gardening"]
+
+    response = await client.get("/api/v1/projects/search", params={"q": "cats", "cursor": "not-a-cursor"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_projects_invalid_cursor(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test listing projects with a malformed cursor"""
+    response = await client.get("/api/v1/projects/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+@pytest.mark.asyncio
+async def test_export_projects_ndjson(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test streaming an NDJSON export, filtered like the listing"""
+    for topic in ["Export A", "Export B", "Other"]:
+        await client.post("/api/v1/projects/", json={"topic": topic})
+
+    response = await client.get(
+        "/api/v1/projects/export", params={"topic_prefix": "Export"}, headers={"Accept-Encoding": "identity"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    rows = [ProjectRead.model_validate_json(line) for line in response.text.splitlines()]
+    assert [row.topic for row in rows] == ["Export A", "Export B"]
+
+
+@pytest.mark.asyncio
+async def test_export_projects_csv_gzip(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test a gzip-compressed CSV export"""
+    await client.post("/api/v1/projects/", json={"topic": "Export, quoted", "notes": "line"})
+
+    response = await client.get("/api/v1/projects/export", params={"format": "csv"}, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/csv")
+    # httpx has already decompressed the body
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["topic"] == "Export, quoted"
+    assert rows[0]["name"] == ""
+
+
+@pytest.mark.asyncio
+async def test_export_assets(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test exporting the assets of matching projects"""
+    project = Project(id=uuid4(), topic="With Assets", status="COMPLETED")
+    other = Project(id=uuid4(), topic="Without", status="CREATED")
+    db_session.add_all([project, other])
+    await db_session.flush()
+    db_session.add(Asset(id=uuid4(), project_id=project.id, asset_type="video", path="/tmp/video.mp4"))
+    db_session.add(Asset(id=uuid4(), project_id=other.id, asset_type="script", path="/tmp/script.txt"))
+    await db_session.commit()
+
+    response = await client.get("/api/v1/projects/export", params={"resource": "assets", "status": "COMPLETED"})
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["path"] == "/tmp/video.mp4"
+
+
+@pytest.mark.asyncio
+async def test_status_stream_requires_redis(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that the status stream reports unavailable when Redis is not configured"""
+    app.dependency_overrides[get_redis] = lambda: None
+    response = await client.get(
+        "/api/v1/projects/status/stream", params={"ids": str(uuid4())}
+    )
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_create_projects_batch(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test batch creation with per-item error reporting"""
+    data = {
+        "items": [
+            {"topic": "Batch 1", "notes": "First"},
+            {"notes": "Missing topic"},
+            {"topic": "Batch 3", "name": "Third"},
+        ]
+    }
+    response = await client.post("/api/v1/projects:batch", json=data)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 2
+    assert body["failed"] == 1
+    assert [r["index"] for r in body["results"]] == [0, 1, 2]
+    assert body["results"][0]["project"]["topic"] == "Batch 1"
+    assert body["results"][1]["project"] is None
+    assert "topic" in body["results"][1]["error"]
+    assert body["results"][2]["project"]["name"] == "Third"
+    assert body["task_group_id"] is None
+
+    for result in (body["results"][0], body["results"][2]):
+        project = await db_session.get(Project, UUID(result["project"]["id"]))
+        assert project is not None
+        assert project.status == ProjectStatus.CREATED
+
+
+@pytest.mark.asyncio
+async def test_create_projects_batch_enqueue(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that batch creation can enqueue processing for every created project"""
+    with patch(
+        "src.backend.api.routers.project_batch._enqueue_processing", return_value="group-id"
+    ) as enqueue:
+        response = await client.post(
+            "/api/v1/projects:batch",
+            json={"items": [{"topic": "A"}, {"topic": "B"}], "enqueue": True},
+        )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["task_group_id"] == "group-id"
+    (project_ids,) = enqueue.call_args.args
+    assert {str(project_id) for project_id in project_ids} == {
+        r["project"]["id"] for r in body["results"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_projects_batch(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test batch status/notes updates with per-item error reporting"""
+    project1 = Project(id=uuid4(), topic="Topic 1", status="CREATED")
+    project2 = Project(id=uuid4(), topic="Topic 2", status="CREATED")
+    db_session.add_all([project1, project2])
+    await db_session.commit()
+
+    data = {
+        "items": [
+            {"id": str(project1.id), "status": "PROCESSING"},
+            {"id": str(project2.id), "notes": "Reviewed", "status": "COMPLETED"},
+            {"id": str(uuid4()), "status": "COMPLETED"},
+            {"id": str(project1.id), "status": "INVALID_STATUS"},
+            {"id": str(project2.id), "status": None},
+        ]
+    }
+    response = await client.patch("/api/v1/projects:batch", json=data)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 2
+    assert body["failed"] == 3
+    results = body["results"]
+    assert results[0]["project"]["status"] == "PROCESSING"
+    assert results[1]["project"]["status"] == "COMPLETED"
+    assert results[1]["project"]["notes"] == "Reviewed"
+    assert results[2]["error"] == "Project not found"
+    assert "status" in results[3]["error"]
+    assert "status may not be null" in results[4]["error"]
+
+    await db_session.refresh(project1)
+    await db_session.refresh(project2)
+    assert project1.status == ProjectStatus.PROCESSING
+    assert project2.notes == "Reviewed"
+
+
+@pytest.mark.asyncio
+async def test_lookup_statuses(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test looking up many statuses at once"""
+    project1 = Project(id=uuid4(), topic="Topic 1", status="CREATED")
+    project2 = Project(id=uuid4(), topic="Topic 2", status="COMPLETED")
+    db_session.add_all([project1, project2])
+    await db_session.commit()
+    missing_id = str(uuid4())
+
+    response = await client.post(
+        "/api/v1/projects/status:lookup",
+        json={"ids": [str(project1.id), str(project2.id), missing_id]},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "statuses": {str(project1.id): "CREATED", str(project2.id): "COMPLETED"},
+        "missing": [missing_id],
+    }
+
+
+@pytest.mark.asyncio
+async def test_lookup_statuses_invalid_id(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test status lookup with an invalid ID"""
+    response = await client.post("/api/v1/projects/status:lookup", json={"ids": ["not-a-uuid"]})
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_update_project(client: AsyncClient, db_session: AsyncSession, setup_database):
     """Test updating a project's fields."""
@@ -165,6 +675,54 @@ async def test_update_project(client: AsyncClient, db_session: AsyncSession, set
     assert retrieved_project.status == "CREATED"  # type: ignore
 
 
+@contextmanager
+def count_statements(db_session: AsyncSession) -> Iterator[List[str]]:
+    """Collect the SQL statements executed through the session's engine."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_writes_use_single_statement(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that create and update each run one INSERT/UPDATE ... RETURNING"""
+    with count_statements(db_session) as statements:
+        response = await client.post("/api/v1/projects/", json={"topic": "One Trip"})
+    assert response.status_code == 201
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO projects")
+
+    project_id = response.json()["id"]
+    with count_statements(db_session) as statements:
+        response = await client.patch(f"/api/v1/projects/{project_id}", json={"notes": "Updated"})
+    assert response.status_code == 200
+    assert response.json()["notes"] == "Updated"
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE projects")
+
+
+@pytest.mark.asyncio
+async def test_update_project_empty_patch(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that an empty update leaves the project, including updated_at, untouched"""
+    project = Project(id=uuid4(), topic="Untouched", status="CREATED")
+    db_session.add(project)
+    await db_session.commit()
+    await db_session.refresh(project)
+
+    response = await client.patch(f"/api/v1/projects/{project.id}", json={})
+    assert response.status_code == 200
+    assert response.json()["topic"] == "Untouched"
+    assert datetime.fromisoformat(response.json()["updated_at"]) == project.updated_at
+
+
 @pytest.mark.asyncio
 async def test_update_project_status(client: AsyncClient, db_session: AsyncSession, setup_database):
     """Test updating a project's status."""
@@ -223,3 +781,68 @@ async def test_update_project_invalid_status(client: AsyncClient, db_session: As
     update_data = {"status": "INVALID_STATUS"}
     response = await client.patch(f"/api/v1/projects/{project.id}", json=update_data)
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_resume_project(client: AsyncClient, db_session: AsyncSession, setup_database):
+    """Test that only failed projects are resumed, keeping their completed stages"""
+    failed = Project(id=uuid4(), topic="Failed", status=ProjectStatus.ERROR)
+    running = Project(id=uuid4(), topic="Running", status=ProjectStatus.PROCESSING)
+    db_session.add_all([failed, running])
+    await db_session.commit()
+    stages = ProjectStageRepository(db_session)
+    await stages.reset(failed.id, [PipelineStage.SCRIPT, PipelineStage.COMPOSITION])
+    await stages.set_status(failed.id, PipelineStage.SCRIPT, StageStatus.COMPLETED)
+    await stages.set_status(failed.id, PipelineStage.COMPOSITION, StageStatus.FAILED)
+    await db_session.commit()
+
+    with patch("src.backend.api.routers.project_stages.process_project") as task:
+        task.delay.return_value.id = "task-id"
+        response = await client.post(f"/api/v1/projects/{failed.id}/resume")
+        repeat = await client.post(f"/api/v1/projects/{failed.id}/resume")
+        conflict = await client.post(f"/api/v1/projects/{running.id}/resume")
+        missing = await client.post(f"/api/v1/projects/{uuid4()}/resume")
+
+    assert response.status_code == 202
+    assert response.json() == {"project_id": str(failed.id), "task_id": "task-id", "completed_stages": ["script"]}
+    task.delay.assert_called_once_with(str(failed.id))
+    # Already resumed
+    assert repeat.status_code == 409
+    assert conflict.status_code == 409
+    assert missing.status_code == 404
+    await db_session.refresh(failed)
+    assert failed.status == ProjectStatus.PROCESSING
+
+    listed = await client.get(f"/api/v1/projects/{failed.id}/stages")
+    assert [(s["stage"], s["status"]) for s in listed.json()] == [("script", "COMPLETED"), ("composition", "FAILED")]
+
+
+@pytest.mark.asyncio
+async def test_resume_project_waits_for_running_stages(
+    client: AsyncClient, db_session: AsyncSession, setup_database
+):
+    """Test that a project is not resumed while stages of its failed run still run"""
+    failed = Project(id=uuid4(), topic="Failed", status=ProjectStatus.ERROR)
+    db_session.add(failed)
+    await db_session.commit()
+    stages = ProjectStageRepository(db_session)
+    await stages.reset(failed.id, [PipelineStage.NARRATION, PipelineStage.THUMBNAIL])
+    await stages.set_status(failed.id, PipelineStage.NARRATION, StageStatus.RUNNING)
+    await stages.set_status(failed.id, PipelineStage.THUMBNAIL, StageStatus.FAILED)
+    await db_session.commit()
+
+    with patch("src.backend.api.routers.project_stages.process_project") as task:
+        task.delay.return_value.id = "task-id"
+        running = await client.post(f"/api/v1/projects/{failed.id}/resume")
+        assert running.status_code == 409
+        assert running.json() == {
+            "detail": "Stages of the failed run are still running"
+        }
+        task.delay.assert_not_called()
+
+        await stages.set_status(failed.id, PipelineStage.NARRATION, StageStatus.FAILED)
+        await db_session.commit()
+        response = await client.post(f"/api/v1/projects/{failed.id}/resume")
+
+    assert response.status_code == 202
+    task.delay.assert_called_once_with(str(failed.id))
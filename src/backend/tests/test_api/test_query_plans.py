@@ -0,0 +1,169 @@
+"""
+Query plan regression tests.
+Runs the projects endpoints against a seeded dataset, then EXPLAINs every
+statement they issued and fails if one sequentially scans a large table.
+"""
+
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import Enum, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.core.cache import ProjectCache, get_project_cache
+from src.backend.main import app
+from src.backend.models.project import Project
+
+# Tables that grow with usage and must always be reached through an index
+LARGE_TABLES = {"projects", "assets"}
+SEED_PROJECTS = 20000
+ASSETS_PER_PROJECT = 2
+
+
+async def seed(db_session: AsyncSession) -> None:
+    """Insert a production-shaped dataset: most projects are finished."""
+    status_type = cast(Enum, Project.__table__.c.status.type).name
+    await db_session.execute(
+        text(
+            f"""
+            INSERT INTO projects (id, topic, status, created_at, updated_at)
+            SELECT
+                gen_random_uuid(),
+                'topic ' || i,
+                (CASE i % 50
+                    WHEN 0 THEN 'CREATED'
+                    WHEN 1 THEN 'PROCESSING'
+                    WHEN 2 THEN 'ERROR'
+                    ELSE 'COMPLETED'
+                END)::{status_type},
+                now() - i * interval '1 minute',
+                now() - i * interval '1 minute'
+            FROM generate_series(1, :count) AS i
+            """
+        ),
+        {"count": SEED_PROJECTS},
+    )
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO assets
+                (id, project_id, asset_type, path, approved, created_at, updated_at)
+            SELECT
+                gen_random_uuid(), projects.id, 'script', '/tmp/' || projects.id,
+                false, now(), now()
+            FROM projects, generate_series(1, :count)
+            """
+        ),
+        {"count": ASSETS_PER_PROJECT},
+    )
+    await db_session.execute(text("ANALYZE projects"))
+    await db_session.execute(text("ANALYZE assets"))
+    await db_session.commit()
+
+
+@contextmanager
+def capture_statements(db_session: AsyncSession) -> Iterator[List[Tuple[str, Any]]]:
+    """Collect the SQL statements, with their parameters, run through the session."""
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.append((statement, parameters))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def sequential_scans(plan: Dict[str, Any]) -> List[str]:
+    """Get the large tables a plan node or its children scan sequentially."""
+    scans = []
+    if plan["Node Type"] == "Seq Scan" and plan.get("Relation Name") in LARGE_TABLES:
+        scans.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        scans.extend(sequential_scans(child))
+    return scans
+
+
+async def explain(
+    db_session: AsyncSession, statement: str, parameters: Any
+) -> Dict[str, Any]:
+    connection = await db_session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    output = result.scalar_one()
+    if isinstance(output, str):
+        output = json.loads(output)
+    await db_session.rollback()  # Don't hold locks taken while planning
+    return output[0]["Plan"]
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_project_queries_use_indexes(
+    client: AsyncClient, db_session: AsyncSession, setup_database
+):
+    """Test that no projects endpoint sequentially scans projects or assets"""
+    await seed(db_session)
+    # Without a cache every read reaches Postgres
+    app.dependency_overrides[get_project_cache] = lambda: ProjectCache(None, ttl=60)
+    project_id = (
+        await db_session.execute(text("SELECT id FROM projects LIMIT 1"))
+    ).scalar_one()
+    await db_session.rollback()
+
+    first_page = await client.get("/api/v1/projects/")
+    assert first_page.status_code == 200
+    requests: List[
+        Tuple[str, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+    ] = [
+        ("GET", f"/api/v1/projects/{project_id}", None, None),
+        ("GET", f"/api/v1/projects/{project_id}", {"include": "assets"}, None),
+        ("GET", f"/api/v1/projects/{project_id}/status", None, None),
+        ("GET", f"/api/v1/projects/{project_id}/assets", None, None),
+        (
+            "GET",
+            f"/api/v1/projects/{project_id}/assets",
+            {"asset_type": "script", "approved": "false"},
+            None,
+        ),
+        ("GET", f"/api/v1/projects/{project_id}/assets/counts", None, None),
+        ("GET", "/api/v1/projects/", None, None),
+        (
+            "GET",
+            "/api/v1/projects/",
+            {"cursor": first_page.json()["next_cursor"]},
+            None,
+        ),
+        ("GET", "/api/v1/projects/", {"status": ["CREATED", "PROCESSING"]}, None),
+        ("GET", "/api/v1/projects/", {"status": "ERROR"}, None),
+        ("GET", "/api/v1/projects/", {"created_after": "2000-01-01T00:00:00Z"}, None),
+        ("GET", "/api/v1/projects/", {"topic_prefix": "topic 1234"}, None),
+        ("GET", "/api/v1/projects/", {"include": "assets", "limit": 10}, None),
+        ("GET", "/api/v1/projects/search", {"q": "topic 1234"}, None),
+        ("POST", "/api/v1/projects/status:lookup", None, {"ids": [str(project_id)]}),
+        ("PATCH", f"/api/v1/projects/{project_id}", None, {"notes": "Explained"}),
+    ]
+
+    failures = []
+    for method, url, params, body in requests:
+        with capture_statements(db_session) as statements:
+            response = await client.request(method, url, params=params, json=body)
+        assert response.status_code == 200, f"{method} {url} {params}: {response.text}"
+        assert statements, f"{method} {url} {params} ran no SQL"
+        for statement, parameters in statements:
+            scans = sequential_scans(await explain(db_session, statement, parameters))
+            if scans:
+                failures.append(
+                    f"{method} {url} {params}: Seq Scan on {', '.join(scans)}\n{statement}"
+                )
+
+    assert not failures, "\n\n".join(failures)
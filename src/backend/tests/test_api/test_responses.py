@@ -0,0 +1,59 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from src.backend.api.responses import PydanticJSONResponse, type_adapter
+from src.backend.models.project import Project
+from src.backend.repositories.project import FULL, LoadProfile
+from src.backend.schemas.project import (
+    ProjectPageData,
+    ProjectRead,
+    ProjectStatus,
+    ProjectViewData,
+)
+
+
+def make_project() -> Project:
+    now = datetime.now(timezone.utc)
+    return Project(
+        id=uuid.uuid4(),
+        topic="Topic",
+        notes=None,
+        name=None,
+        status=ProjectStatus.COMPLETED,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_schema_rendering_matches_model_json() -> None:
+    project = make_project()
+    page = ProjectPageData(items=[FULL.render(project)], next_cursor=None)
+
+    body = PydanticJSONResponse(page, schema=ProjectPageData).body
+
+    expected = ProjectRead.model_validate(project).model_dump(mode="json")
+    assert json.loads(body) == {"items": [expected], "next_cursor": None}
+
+
+def test_sparse_profile_renders_only_selected_fields() -> None:
+    project = make_project()
+    data = LoadProfile.parse("status,id", None).render(project)
+
+    body = PydanticJSONResponse(data, schema=ProjectViewData).body
+
+    assert json.loads(body) == {"id": str(project.id), "status": "COMPLETED"}
+
+
+def test_model_and_plain_content() -> None:
+    project = ProjectRead.model_validate(make_project())
+
+    assert json.loads(PydanticJSONResponse(project).body) == jsonable_encoder(project)
+    assert PydanticJSONResponse({"a": [1, None]}).body == b'{"a":[1,null]}'
+    assert PydanticJSONResponse(project).headers["content-type"] == "application/json"
+
+
+def test_type_adapters_are_cached() -> None:
+    assert type_adapter(ProjectPageData) is type_adapter(ProjectPageData)
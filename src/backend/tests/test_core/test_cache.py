@@ -0,0 +1,147 @@
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.backend.core.cache import (
+    CachedProjectStatus,
+    ProjectCache,
+    project_key,
+    status_key,
+)
+from src.backend.core.metrics import (
+    PROJECT_CACHE_EVICTIONS,
+    PROJECT_CACHE_HITS,
+    PROJECT_CACHE_MISSES,
+)
+from src.backend.schemas.project import ProjectRead, ProjectStatus
+
+
+def make_project() -> ProjectRead:
+    now = datetime.now(timezone.utc)
+    return ProjectRead(
+        id=uuid.uuid4(),
+        topic="Test Topic",
+        status=ProjectStatus.CREATED,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def make_redis() -> MagicMock:
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(return_value=None)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 1])
+    redis_client.pipeline.return_value.__aenter__.return_value = pipe
+    return redis_client
+
+
+@pytest.mark.asyncio
+async def test_get_project_hit_and_miss() -> None:
+    project = make_project()
+    redis_client = make_redis()
+    cache = ProjectCache(redis_client, ttl=60)
+    hits = PROJECT_CACHE_HITS.labels(kind="project")._value.get()
+    misses = PROJECT_CACHE_MISSES.labels(kind="project")._value.get()
+
+    assert await cache.get_project(project.id) is None
+    redis_client.get.return_value = project.model_dump_json()
+    assert await cache.get_project(project.id) == project
+
+    redis_client.get.assert_awaited_with(project_key(project.id))
+    assert PROJECT_CACHE_HITS.labels(kind="project")._value.get() == hits + 1
+    assert PROJECT_CACHE_MISSES.labels(kind="project")._value.get() == misses + 1
+
+
+@pytest.mark.asyncio
+async def test_set_project_stores_project_and_status() -> None:
+    project = make_project()
+    redis_client = make_redis()
+    cache = ProjectCache(redis_client, ttl=60)
+
+    await cache.set_project(project, only_if_missing=True)
+
+    pipe = redis_client.pipeline.return_value.__aenter__.return_value
+    keys = [c.args[0] for c in pipe.set.call_args_list]
+    assert keys == [project_key(project.id), status_key(project.id)]
+    assert all(c.kwargs == {"ex": 60, "nx": True} for c in pipe.set.call_args_list)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_statuses_uses_single_mget() -> None:
+    cached_id, missing_id = uuid.uuid4(), uuid.uuid4()
+    entry = CachedProjectStatus(
+        status=ProjectStatus.COMPLETED, updated_at=datetime.now(timezone.utc)
+    )
+    redis_client = make_redis()
+    redis_client.mget = AsyncMock(return_value=[entry.model_dump_json(), None])
+    cache = ProjectCache(redis_client, ttl=60)
+
+    statuses = await cache.get_statuses([cached_id, missing_id])
+
+    assert statuses == {cached_id: entry}
+    redis_client.mget.assert_awaited_once_with(
+        [status_key(cached_id), status_key(missing_id)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_outdated_entries_are_misses() -> None:
+    redis_client = make_redis()
+    # Status entries cached before they carried updated_at
+    redis_client.get.return_value = '{"status":"COMPLETED"}'
+    cache = ProjectCache(redis_client, ttl=60)
+
+    assert await cache.get_status(uuid.uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_projects_counts_evictions() -> None:
+    first, second = make_project(), make_project()
+    redis_client = make_redis()
+    pipe = redis_client.pipeline.return_value.__aenter__.return_value
+    # Only the first project had a status entry cached
+    pipe.execute.return_value = [1, 1, 1, 0]
+    cache = ProjectCache(redis_client, ttl=60)
+    projects = PROJECT_CACHE_EVICTIONS.labels(kind="project")._value.get()
+    statuses = PROJECT_CACHE_EVICTIONS.labels(kind="status")._value.get()
+
+    await cache.invalidate_projects([first.id, second.id])
+
+    assert [c.args[0] for c in pipe.delete.call_args_list] == [
+        project_key(first.id),
+        status_key(first.id),
+        project_key(second.id),
+        status_key(second.id),
+    ]
+    assert PROJECT_CACHE_EVICTIONS.labels(kind="project")._value.get() == projects + 2
+    assert PROJECT_CACHE_EVICTIONS.labels(kind="status")._value.get() == statuses + 1
+
+
+@pytest.mark.asyncio
+async def test_cache_treats_redis_errors_as_misses() -> None:
+    project = make_project()
+    redis_client = make_redis()
+    redis_client.get.side_effect = RedisConnectionError("down")
+    redis_client.pipeline.return_value.__aenter__.side_effect = RedisConnectionError(
+        "down"
+    )
+    cache = ProjectCache(redis_client, ttl=60)
+
+    assert await cache.get_status(project.id) is None
+    await cache.set_project(project)
+    await cache.invalidate(project.id)
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache() -> None:
+    project = make_project()
+    cache = ProjectCache(None, ttl=60)
+
+    assert not cache.enabled
+    await cache.set_project(project)
+    assert await cache.get_project(project.id) is None
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from starlette.requests import Request
+
+from src.backend.api.conditional import is_not_modified, not_modified, weak_etag
+
+
+def make_request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()
+            ],
+        }
+    )
+
+
+UPDATED_AT = datetime(2026, 10, 16, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def test_weak_etag_tracks_version() -> None:
+    etag = weak_etag(UPDATED_AT)
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert weak_etag(UPDATED_AT) == etag
+    assert weak_etag(UPDATED_AT + timedelta(microseconds=1)) != etag
+    # Naive timestamps are treated as UTC
+    assert weak_etag(UPDATED_AT.replace(tzinfo=None)) == etag
+
+
+def test_weak_etag_parts_are_order_independent() -> None:
+    assert weak_etag(UPDATED_AT, ["a", "b"]) == weak_etag(UPDATED_AT, ["b", "a"])
+    assert weak_etag(UPDATED_AT, ["a"]) != weak_etag(UPDATED_AT, ["a", "b"])
+    assert weak_etag(UPDATED_AT, []) != weak_etag(UPDATED_AT)
+
+
+def test_if_none_match() -> None:
+    etag = weak_etag(UPDATED_AT)
+    strong = etag.removeprefix("W/")
+
+    assert is_not_modified(make_request(if_none_match=etag), etag, UPDATED_AT)
+    assert is_not_modified(
+        make_request(if_none_match=f'"other", {strong}'), etag, UPDATED_AT
+    )
+    assert is_not_modified(make_request(if_none_match="*"), etag, UPDATED_AT)
+    assert not is_not_modified(
+        make_request(if_none_match='W/"other"'), etag, UPDATED_AT
+    )
+    assert not is_not_modified(make_request(), etag, UPDATED_AT)
+
+
+def test_if_modified_since() -> None:
+    etag = weak_etag(UPDATED_AT)
+    same_second = format_datetime(UPDATED_AT.replace(microsecond=0), usegmt=True)
+    earlier = format_datetime(UPDATED_AT - timedelta(seconds=1), usegmt=True)
+
+    assert is_not_modified(
+        make_request(if_modified_since=same_second), etag, UPDATED_AT
+    )
+    assert not is_not_modified(
+        make_request(if_modified_since=earlier), etag, UPDATED_AT
+    )
+    assert not is_not_modified(
+        make_request(if_modified_since="garbage"), etag, UPDATED_AT
+    )
+    # If-None-Match takes precedence
+    assert not is_not_modified(
+        make_request(if_none_match='W/"other"', if_modified_since=same_second),
+        etag,
+        UPDATED_AT,
+    )
+
+
+def test_not_modified_response() -> None:
+    etag = weak_etag(UPDATED_AT)
+    response = not_modified(etag, UPDATED_AT)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["last-modified"] == "Fri, 16 Oct 2026 09:30:15 GMT"
@@ -0,0 +1,92 @@
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.backend.core.events import (
+    publish_status,
+    status_channel,
+    subscribe_status_events,
+)
+from src.backend.schemas.project import ProjectStatus, ProjectStatusEvent
+
+
+def make_redis() -> MagicMock:
+    redis_client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_client.pipeline.return_value.__aenter__.return_value = pipe
+    return redis_client
+
+
+@pytest.mark.asyncio
+async def test_publish_status() -> None:
+    redis_client = make_redis()
+    project_id = uuid.uuid4()
+    updated_at = datetime.now(timezone.utc)
+
+    await publish_status(redis_client, project_id, ProjectStatus.PROCESSING, updated_at)
+
+    pipe = redis_client.pipeline.return_value.__aenter__.return_value
+    pipe.execute.assert_awaited_once()
+    channel, payload = pipe.publish.call_args.args
+    assert channel == status_channel(project_id)
+    event = ProjectStatusEvent.model_validate_json(payload)
+    assert event.project_id == project_id
+    assert event.status == ProjectStatus.PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_publish_status_swallows_redis_errors() -> None:
+    redis_client = make_redis()
+    redis_client.pipeline.return_value.__aenter__.return_value.execute.side_effect = (
+        RedisConnectionError("down")
+    )
+
+    # Must not raise: the status write already succeeded
+    await publish_status(
+        redis_client, uuid.uuid4(), ProjectStatus.ERROR, datetime.now(timezone.utc)
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_status_without_redis() -> None:
+    await publish_status(
+        None, uuid.uuid4(), ProjectStatus.ERROR, datetime.now(timezone.utc)
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscribe_status_events() -> None:
+    project_id = uuid.uuid4()
+    event = ProjectStatusEvent(
+        project_id=project_id,
+        status=ProjectStatus.COMPLETED,
+        updated_at=datetime.now(timezone.utc),
+    )
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.aclose = AsyncMock()
+    pubsub.get_message = AsyncMock(
+        side_effect=[
+            {"type": "message", "data": event.model_dump_json()},
+            None,
+        ]
+    )
+    redis_client = MagicMock()
+    redis_client.pubsub.return_value = pubsub
+
+    subscription = subscribe_status_events(
+        redis_client, [project_id], heartbeat_interval=0
+    )
+    async with subscription as events:
+        # Subscribed before the first event is asked for
+        pubsub.subscribe.assert_awaited_once_with(status_channel(project_id))
+        assert await events.__anext__() == event
+        assert await events.__anext__() is None  # Heartbeat
+
+    pubsub.unsubscribe.assert_awaited_once()
+    pubsub.aclose.assert_awaited_once()
@@ -0,0 +1,43 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.backend.core.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2025, 2, 18, 16, 50, 40, 912000, tzinfo=timezone.utc)
+    project_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, project_id)
+
+    assert "=" not in cursor  # URL-safe without padding
+    assert decode_cursor(cursor) == (created_at, project_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WyJ4IiwieSJd"])
+def test_decode_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_rank_cursor_round_trip() -> None:
+    project_id = uuid.uuid4()
+
+    # Ranks are reals; they must come back exactly to resume after the same row
+    assert decode_rank_cursor(encode_rank_cursor(0.1 + 0.2, project_id)) == (
+        0.1 + 0.2,
+        project_id,
+    )
+
+
+def test_decode_invalid_rank_cursor() -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_rank_cursor(encode_cursor(datetime.now(timezone.utc), uuid.uuid4()))
@@ -0,0 +1,80 @@
+import logging
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.backend.core.query_timing import fingerprint, instrument_queries, query_origin
+
+
+def test_fingerprint_ignores_values_and_list_lengths() -> None:
+    one, normalized = fingerprint(
+        "SELECT * FROM projects WHERE id IN ($1::UUID) AND topic = 'a'  LIMIT 10"
+    )
+    three, _ = fingerprint(
+        "SELECT * FROM projects WHERE id IN ($1::UUID, $2::UUID, $3::UUID) AND topic = 'it''s' LIMIT 20"
+    )
+    other, _ = fingerprint("SELECT * FROM assets WHERE id IN ($1::UUID)")
+
+    assert (
+        normalized
+        == "SELECT * FROM projects WHERE id IN (?::UUID, ...) AND topic = ? LIMIT ?"
+    )
+    assert one == three
+    assert one != other
+    assert (
+        fingerprint("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4), ($5, $6)")[1]
+        == "INSERT INTO t (a, b) VALUES (?, ?), ..."
+    )
+
+
+def test_statements_are_timed_by_origin(caplog: pytest.LogCaptureFixture) -> None:
+    engine = create_engine("sqlite://")
+    instrument_queries(engine, "timing-test", histogram=True, slow_threshold=0)
+    fingerprint_id, _ = fingerprint("SELECT 1")
+    query_origin.set("/api/v1/projects/")
+
+    with (
+        caplog.at_level(logging.WARNING, logger="sql.slow"),
+        engine.connect() as connection,
+    ):
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing"))
+        # A failed statement does not leave its start time behind
+        assert connection.info["query_timing_start"] == []
+
+    labels = {
+        "engine": "timing-test",
+        "fingerprint": fingerprint_id,
+        "origin": "/api/v1/projects/",
+    }
+    assert (
+        REGISTRY.get_sample_value("sql_statement_duration_seconds_count", labels) == 1
+    )
+    record = next(r for r in caplog.records if r.name == "sql.slow")
+    assert record.fingerprint == fingerprint_id  # type: ignore[attr-defined]
+    assert record.origin == "/api/v1/projects/"  # type: ignore[attr-defined]
+
+
+def test_slow_query_log_threshold(caplog: pytest.LogCaptureFixture) -> None:
+    engine = create_engine("sqlite://")
+    instrument_queries(engine, "untimed-test", histogram=False, slow_threshold=60)
+
+    with (
+        caplog.at_level(logging.WARNING, logger="sql.slow"),
+        engine.connect() as connection,
+    ):
+        connection.execute(text("SELECT 1"))
+
+    assert not caplog.records
+    labels = {
+        "engine": "untimed-test",
+        "fingerprint": fingerprint("SELECT 1")[0],
+        "origin": "unknown",
+    }
+    assert (
+        REGISTRY.get_sample_value("sql_statement_duration_seconds_count", labels)
+        is None
+    )
@@ -0,0 +1,188 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.core.cache import CachedProjectStatus
+from src.backend.core.config import Settings
+from src.backend.core.status_listener import StatusListener, listener_url
+from src.backend.models.project import Project
+from src.backend.schemas.project import ProjectStatus, ProjectStatusEvent
+
+
+def make_listener(**kwargs) -> StatusListener:
+    listener = StatusListener(
+        "postgresql+asyncpg://user@127.0.0.1:1/db", max_entries=2, **kwargs
+    )
+    listener.connected = True
+    return listener
+
+
+def notify(listener: StatusListener, event: ProjectStatusEvent) -> None:
+    listener._on_notification(None, 0, "project_status", event.model_dump_json())
+
+
+def test_dsn_drops_driver() -> None:
+    assert make_listener().dsn == "postgresql://user@127.0.0.1:1/db"
+
+
+def test_listener_url_avoids_pgbouncer() -> None:
+    direct = "postgresql+asyncpg://user@db:5432/app"
+    pooled = "postgresql+asyncpg://user@pgbouncer:6432/app"
+
+    assert listener_url(Settings(DATABASE_URL=direct, STATUS_LISTENER_URL="")) == direct
+    assert (
+        listener_url(
+            Settings(
+                DATABASE_URL=pooled, DB_PROFILE="pgbouncer", STATUS_LISTENER_URL=""
+            )
+        )
+        is None
+    )
+    assert (
+        listener_url(
+            Settings(
+                DATABASE_URL=pooled, DB_PROFILE="pgbouncer", STATUS_LISTENER_URL=direct
+            )
+        )
+        == direct
+    )
+    assert StatusListener(None, max_entries=1).dsn is None
+
+
+def test_notifications_update_statuses() -> None:
+    listener = make_listener()
+    project_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+
+    notify(
+        listener,
+        ProjectStatusEvent(
+            project_id=project_id, status=ProjectStatus.PROCESSING, updated_at=now
+        ),
+    )
+    assert listener.get(project_id) == CachedProjectStatus(
+        status=ProjectStatus.PROCESSING, updated_at=now
+    )
+
+    # An older read must not overwrite a newer notification
+    listener.remember(
+        project_id,
+        CachedProjectStatus(
+            status=ProjectStatus.CREATED, updated_at=now - timedelta(seconds=1)
+        ),
+    )
+    assert listener.get(project_id).status == ProjectStatus.PROCESSING  # type: ignore[union-attr]
+
+    listener._on_notification(None, 0, "project_status", "not json")
+    assert listener.get(project_id).status == ProjectStatus.PROCESSING  # type: ignore[union-attr]
+
+
+def test_statuses_are_bounded() -> None:
+    listener = make_listener()
+    now = datetime.now(timezone.utc)
+    ids = [uuid.uuid4() for _ in range(3)]
+
+    for project_id in ids:
+        listener.remember(
+            project_id,
+            CachedProjectStatus(status=ProjectStatus.CREATED, updated_at=now),
+        )
+
+    assert listener.get(ids[0]) is None
+    assert listener.get(ids[2]) is not None
+
+
+def test_statuses_expire() -> None:
+    listener = make_listener(ttl=0)
+    project_id = uuid.uuid4()
+    listener.remember(
+        project_id,
+        CachedProjectStatus(
+            status=ProjectStatus.CREATED, updated_at=datetime.now(timezone.utc)
+        ),
+    )
+
+    assert listener.get(project_id) is None
+
+
+def test_statuses_are_untrusted_while_disconnected() -> None:
+    listener = make_listener()
+    project_id = uuid.uuid4()
+    listener.remember(
+        project_id,
+        CachedProjectStatus(
+            status=ProjectStatus.CREATED, updated_at=datetime.now(timezone.utc)
+        ),
+    )
+
+    listener._disconnected()
+
+    assert listener.get(project_id) is None
+    listener.connected = True
+    assert listener.get(project_id) is None  # Cleared, not just hidden
+
+
+@pytest.mark.asyncio
+async def test_events_fan_out_until_disconnect() -> None:
+    listener = make_listener()
+    project_id = uuid.uuid4()
+    event = ProjectStatusEvent(
+        project_id=project_id,
+        status=ProjectStatus.COMPLETED,
+        updated_at=datetime.now(timezone.utc),
+    )
+
+    async with listener.subscribe([project_id], heartbeat_interval=0.05) as first:
+        async with listener.subscribe(
+            [project_id, uuid.uuid4()], heartbeat_interval=0.05
+        ) as second:
+            # Registered on entry, before anything is iterated
+            notify(listener, event)
+            assert await first.__anext__() == event
+            assert await second.__anext__() == event
+            # Idle subscriptions get heartbeats
+            assert await first.__anext__() is None
+
+            listener._disconnected()
+            with pytest.raises(StopAsyncIteration):
+                await first.__anext__()
+            with pytest.raises(StopAsyncIteration):
+                await second.__anext__()
+    assert listener._subscribers == {}
+
+
+async def wait_until_connected(listener: StatusListener) -> None:
+    while not listener.connected:
+        await asyncio.sleep(0.05)
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_trigger_notifies_status_changes(db_session: AsyncSession) -> None:
+    listener = StatusListener(
+        Settings().TEST_DATABASE_URL, max_entries=10, retry_interval=0.1
+    )
+    running = asyncio.create_task(listener.run())
+    try:
+        await asyncio.wait_for(wait_until_connected(listener), timeout=10)
+        project = Project(
+            id=uuid.uuid4(), topic="Notified", status=ProjectStatus.CREATED
+        )
+        async with listener.subscribe([project.id], heartbeat_interval=5) as events:
+            db_session.add(project)
+            await db_session.commit()
+            created = await asyncio.wait_for(events.__anext__(), timeout=10)
+            project.notes = "Not a status change"
+            await db_session.commit()
+            project.status = ProjectStatus.PROCESSING
+            await db_session.commit()
+            processing = await asyncio.wait_for(events.__anext__(), timeout=10)
+
+        assert created is not None and created.status == ProjectStatus.CREATED
+        assert processing is not None and processing.status == ProjectStatus.PROCESSING
+        assert listener.get(project.id).status == ProjectStatus.PROCESSING  # type: ignore[union-attr]
+    finally:
+        running.cancel()
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -87,6 +88,22 @@ async def test_project_asset_relationship(db_session: AsyncSession) -> None:
     assert any(asset.asset_type == "script" for asset in saved_project.assets)
     assert any(asset.asset_type == "video" for asset in saved_project.assets)
 
+@pytest.mark.asyncio
+async def test_project_assets_are_opt_in(db_session: AsyncSession) -> None:
+    project = Project(id=uuid.uuid4(), topic="Test Topic", status=ProjectStatus.CREATED)
+    db_session.add(project)
+    await db_session.flush()
+    db_session.add(Asset(id=uuid.uuid4(), project_id=project.id, asset_type="slide", path="/p"))
+    await db_session.commit()
+    db_session.expunge_all()
+
+    result = await db_session.execute(select(Project).filter_by(id=project.id))
+    saved_project = result.scalar_one()
+
+    with pytest.raises(InvalidRequestError):
+        saved_project.assets
+    assert saved_project.asset_counts == {"slide": 1}
+
 @pytest.mark.asyncio
 async def test_project_cascade_delete(db_session: AsyncSession) -> None:
     project = Project(
@@ -0,0 +1,148 @@
+import io
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.models.project import Project
+from src.backend.repositories.project_import import (
+    COPY_COLUMNS,
+    ImportFileError,
+    ImportFormat,
+    ProjectImporter,
+    iter_rows,
+    validate_row,
+)
+from src.backend.schemas.project import ProjectStatus
+
+CSV_FILE = "topic,name,notes\nCats,,Fluffy\n,Missing topic,\nDogs,Rex,\n"
+JSONL_FILE = '{"topic": "Cats"}\n\nnot json\n{"topic": "Dogs", "notes": "Loud"}\n{"name": "No topic"}\n'
+
+
+def make_db() -> MagicMock:
+    copy = AsyncMock()
+    db = MagicMock()
+    db.connection = AsyncMock()
+    db.connection.return_value.get_raw_connection = AsyncMock()
+    db.connection.return_value.get_raw_connection.return_value.driver_connection.copy_records_to_table = (
+        copy
+    )
+    db.execute = AsyncMock()
+    db.commit = AsyncMock()
+    return db
+
+
+def copied_batches(db: MagicMock) -> list:
+    copy = (
+        db.connection.return_value.get_raw_connection.return_value.driver_connection.copy_records_to_table
+    )
+    return [call.kwargs["records"] for call in copy.call_args_list]
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("ideas.csv", ImportFormat.CSV),
+        ("ideas.JSONL", ImportFormat.JSONL),
+        ("ideas.ndjson", ImportFormat.JSONL),
+        ("ideas.txt", None),
+        (None, None),
+    ],
+)
+def test_format_from_filename(filename, expected) -> None:
+    assert ImportFormat.from_filename(filename) == expected
+
+
+def test_csv_rows_skip_empty_cells() -> None:
+    rows = list(iter_rows(io.StringIO(CSV_FILE), ImportFormat.CSV))
+
+    assert rows == [
+        (2, {"topic": "Cats", "notes": "Fluffy"}),
+        (3, {"name": "Missing topic"}),
+        (4, {"topic": "Dogs", "name": "Rex"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_reports_rejects_and_loads_the_rest() -> None:
+    db = make_db()
+
+    result = await ProjectImporter(db, batch_size=1).run(
+        io.StringIO(JSONL_FILE), ImportFormat.JSONL
+    )
+
+    assert result.imported == 2
+    assert result.rejected == 2
+    assert [reject.line for reject in result.rejects] == [3, 5]
+    assert "Invalid JSON" in result.rejects[0].error
+    assert "topic: Field required" in result.rejects[1].error
+    # One COPY and commit per full batch
+    batches = copied_batches(db)
+    assert [
+        [record[COPY_COLUMNS.index("topic")] for record in batch] for batch in batches
+    ] == [["Cats"], ["Dogs"]]
+    assert batches[1][0][COPY_COLUMNS.index("notes")] == "Loud"
+    assert batches[1][0][COPY_COLUMNS.index("status")] == ProjectStatus.CREATED.value
+    assert db.commit.await_count == 2
+    # Every batch's transaction skips the per-row status notification
+    assert db.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_import_reads_rows_off_the_event_loop() -> None:
+    threads = []
+
+    def validate(row):
+        threads.append(threading.current_thread())
+        return validate_row(row)
+
+    with patch("src.backend.repositories.project_import.validate_row", validate):
+        result = await ProjectImporter(make_db(), batch_size=2).run(
+            io.StringIO(JSONL_FILE), ImportFormat.JSONL
+        )
+
+    assert result.imported == 2
+    assert threads and threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unreadable_csv() -> None:
+    stream = io.TextIOWrapper(io.BytesIO(b"topic\n\xff\xfe\n"), encoding="utf-8")
+
+    with pytest.raises(ImportFileError):
+        await ProjectImporter(make_db()).run(stream, ImportFormat.CSV)
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_import_endpoint_copies_rows(
+    client: AsyncClient, db_session: AsyncSession, setup_database
+):
+    """Test uploading a CSV file of ideas"""
+    response = await client.post(
+        "/api/v1/projects:import",
+        files={"file": ("ideas.csv", CSV_FILE.encode(), "text/csv")},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["imported"] == 2
+    assert body["rejected"] == 1
+    assert body["rejects"][0]["line"] == 3
+    projects = (
+        (await db_session.execute(select(Project).order_by(Project.topic)))
+        .scalars()
+        .all()
+    )
+    assert [(p.topic, p.name, p.notes, p.status) for p in projects] == [
+        ("Cats", None, "Fluffy", ProjectStatus.CREATED),
+        ("Dogs", "Rex", None, ProjectStatus.CREATED),
+    ]
+
+    response = await client.post(
+        "/api/v1/projects:import", files={"file": ("ideas.txt", b"", "text/plain")}
+    )
+    assert response.status_code == 422
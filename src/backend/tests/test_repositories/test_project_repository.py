@@ -0,0 +1,69 @@
+import re
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.backend.models.project import Project
+from src.backend.repositories.project import (
+    FULL,
+    PROJECT_FIELDS,
+    LoadProfile,
+    ProjectFilters,
+)
+from src.backend.schemas.project import ProjectStatus
+
+
+def compile_sql(load: LoadProfile) -> str:
+    query = select(Project).options(*load.options())
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_parse_defaults_to_every_field_without_assets() -> None:
+    load = LoadProfile.parse(None, None)
+
+    assert load == FULL
+    assert load.fields == frozenset(PROJECT_FIELDS)
+    assert not load.assets
+
+
+def test_parse_fields_and_include() -> None:
+    load = LoadProfile.parse("id, status,topic", "assets")
+
+    assert load.fields == {"id", "status", "topic"}
+    assert load.assets
+
+
+@pytest.mark.parametrize(
+    "fields, include, message",
+    [
+        ("id,secret", None, "Unknown field(s): secret"),
+        (None, "owner", "Unknown include(s): owner"),
+    ],
+)
+def test_parse_rejects_unknown_names(fields, include, message) -> None:
+    with pytest.raises(ValueError, match=re.escape(message)):
+        LoadProfile.parse(fields, include)
+
+
+def test_options_select_only_requested_columns() -> None:
+    sql = compile_sql(LoadProfile.parse("id,status", None))
+
+    assert sql.startswith("SELECT projects.id, projects.status \nFROM projects")
+    assert "topic" not in sql
+
+
+def test_with_fields_keeps_assets() -> None:
+    load = LoadProfile.parse("status", "assets").with_fields("updated_at")
+
+    assert load.fields == {"status", "updated_at"}
+    assert load.assets
+
+
+def test_filters() -> None:
+    filters = ProjectFilters(statuses=[ProjectStatus.ERROR], topic_prefix="50%")
+    sql = str(filters.apply(select(Project.id)).compile(dialect=postgresql.dialect()))
+
+    assert "projects.status IN" in sql
+    assert "projects.topic LIKE" in sql
+    assert "created_at" not in sql
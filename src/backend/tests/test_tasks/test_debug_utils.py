@@ -0,0 +1,50 @@
+from typing import List
+
+import pytest
+import redis
+
+from src.backend.tasks.debug_utils import BrokerCircuitOpen, BrokerHealth
+
+
+def make_health(pings: List[bool], **kwargs) -> BrokerHealth:
+    """A health check whose PINGs succeed or fail in the given order."""
+    health = BrokerHealth("redis://127.0.0.1:1/0", **kwargs)
+
+    def ping() -> None:
+        if not pings.pop(0):
+            raise redis.ConnectionError("Connection refused")
+
+    health._ping = ping  # type: ignore[method-assign]
+    return health
+
+
+def test_successful_check_is_cached() -> None:
+    pings = [True, True]
+    health = make_health(pings, ttl=60, retry_interval=60)
+
+    assert health.check() == "pinged"
+    assert health.check() == "cached"
+    assert pings == [True]
+
+
+def test_failed_check_opens_circuit() -> None:
+    pings = [False, True]
+    health = make_health(pings, ttl=60, retry_interval=60)
+
+    with pytest.raises(redis.ConnectionError):
+        health.check()
+    # Fails fast without contacting the broker
+    with pytest.raises(BrokerCircuitOpen):
+        health.check()
+    assert pings == [True]
+
+
+def test_circuit_closes_after_retry_interval() -> None:
+    pings = [False, True, True]
+    health = make_health(pings, ttl=0, retry_interval=0)
+
+    with pytest.raises(redis.ConnectionError):
+        health.check()
+    assert health.check() == "pinged"
+    assert health.check() == "pinged"  # Not cached with a zero ttl
+    assert pings == []
@@ -0,0 +1,159 @@
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.backend.models.asset import Asset
+from src.backend.models.project import Project
+from src.backend.repositories.project_stage import ProjectStageRepository
+from src.backend.schemas.project import ProjectStatus
+from src.backend.schemas.stage import PipelineStage, StageStatus
+from src.backend.tasks.pipeline import StageContext, build_pipeline, stage_dependencies
+
+
+def test_stage_dependencies() -> None:
+    dependencies = stage_dependencies()
+
+    assert set(dependencies) == set(PipelineStage)
+    assert dependencies[PipelineStage.SCRIPT] == frozenset()
+    assert dependencies[PipelineStage.THUMBNAIL] == {PipelineStage.SEGREGATION}
+    assert dependencies[PipelineStage.IMAGES] == {PipelineStage.SEGREGATION}
+    assert dependencies[PipelineStage.AVATAR] == {PipelineStage.NARRATION}
+    assert dependencies[PipelineStage.CLIPS] == {
+        PipelineStage.IMAGES,
+        PipelineStage.SLIDES,
+    }
+    assert dependencies[PipelineStage.COMPOSITION] == {
+        PipelineStage.AVATAR,
+        PipelineStage.THUMBNAIL,
+        PipelineStage.CLIPS,
+    }
+
+
+def make_context(topic: str = "Topic", inputs=None) -> StageContext:
+    return StageContext(
+        project_id=uuid.UUID(int=1),
+        stage=PipelineStage.COMPOSITION,
+        topic=topic,
+        notes=None,
+        inputs=inputs or {},
+    )
+
+
+def test_input_hash_tracks_project_and_dependency_outputs() -> None:
+    avatar = Asset(id=uuid.UUID(int=2), asset_type="video", path="avatar.mp4")
+    clips = Asset(id=uuid.UUID(int=3), asset_type="video", path="clips.mp4")
+    inputs = {PipelineStage.AVATAR: [avatar], PipelineStage.CLIPS: [clips]}
+
+    checkpoint = make_context(inputs=inputs).input_hash()
+    assert (
+        make_context(inputs=dict(reversed(list(inputs.items())))).input_hash()
+        == checkpoint
+    )
+    assert make_context(topic="Other", inputs=inputs).input_hash() != checkpoint
+    # A rerun dependency produces new assets
+    rerun = Asset(id=uuid.UUID(int=4), asset_type="video", path="avatar.mp4")
+    assert (
+        make_context(inputs={**inputs, PipelineStage.AVATAR: [rerun]}).input_hash()
+        != checkpoint
+    )
+
+
+@pytest.mark.celery
+def test_build_pipeline_runs_independent_stages_in_parallel() -> None:
+    pipeline: Any = build_pipeline("project-id")
+
+    *serial, fan_out = pipeline.tasks
+    assert [task.args[1] for task in serial] == [
+        "script",
+        "script_processing",
+        "segregation",
+    ]
+    # The independent branches are the header of a chord whose body composes
+    branches = fan_out.tasks
+    assert len(branches) == 3
+    assert fan_out.body.tasks[0].args[1] == "composition"
+    assert fan_out.body.tasks[-1].name == "finish_pipeline"
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_stage_progress_is_recorded(db_session: AsyncSession) -> None:
+    project = Project(id=uuid.uuid4(), topic="Staged", status=ProjectStatus.CREATED)
+    db_session.add(project)
+    await db_session.commit()
+    stages = ProjectStageRepository(db_session)
+
+    await stages.reset(project.id, [PipelineStage.SCRIPT, PipelineStage.NARRATION])
+    await stages.set_status(project.id, PipelineStage.SCRIPT, StageStatus.RUNNING)
+    await stages.set_status(
+        project.id, PipelineStage.SCRIPT, StageStatus.FAILED, error="Timed out"
+    )
+    await db_session.commit()
+
+    script, narration = await stages.list(project.id)
+    assert (script.stage, script.status, script.attempts, script.error) == (
+        "script",
+        StageStatus.FAILED,
+        1,
+        "Timed out",
+    )
+    assert script.finished_at is not None
+    assert (narration.stage, narration.status) == ("narration", StageStatus.PENDING)
+
+    # Restarting the pipeline resets progress but keeps the attempt count
+    await stages.reset(project.id, [PipelineStage.SCRIPT])
+    await db_session.commit()
+    db_session.expire_all()
+    script, _ = await stages.list(project.id)
+    assert (script.status, script.attempts, script.error) == (
+        StageStatus.PENDING,
+        1,
+        None,
+    )
+
+    # A stage still running from an earlier run is left to finish
+    await stages.set_status(project.id, PipelineStage.NARRATION, StageStatus.RUNNING)
+    await stages.reset(project.id, [PipelineStage.SCRIPT, PipelineStage.NARRATION])
+    await db_session.commit()
+    db_session.expire_all()
+    _, narration = await stages.list(project.id)
+    assert narration.status == StageStatus.RUNNING
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_checkpoint_holds_while_inputs_and_outputs_do(
+    db_session: AsyncSession,
+) -> None:
+    project = Project(
+        id=uuid.uuid4(), topic="Checkpointed", status=ProjectStatus.CREATED
+    )
+    db_session.add(project)
+    await db_session.commit()
+    stages = ProjectStageRepository(db_session)
+    await stages.reset(project.id, [PipelineStage.NARRATION])
+    await db_session.commit()
+    (row,) = await stages.list(project.id)
+
+    output_ids = await stages.complete(row, "hash", [("narration", "narration.mp3")])
+    await db_session.commit()
+    db_session.expire_all()
+    (row,) = await stages.list(project.id)
+    assert row.status == StageStatus.COMPLETED and row.output_asset_ids == output_ids
+    assert [asset.path for asset in await stages.outputs(row)] == ["narration.mp3"]
+    assert await stages.is_fresh(row, "hash")
+    assert not await stages.is_fresh(row, "changed")
+
+    # Restarting the pipeline keeps the checkpoint
+    await stages.reset(project.id, [PipelineStage.NARRATION])
+    await db_session.commit()
+    db_session.expire_all()
+    (row,) = await stages.list(project.id)
+    assert await stages.is_fresh(row, "hash")
+
+    # Until an output disappears
+    await db_session.delete(await db_session.get(Asset, output_ids[0]))
+    await db_session.commit()
+    assert not await stages.is_fresh(row, "hash")
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+
+from src.backend.tasks.results import await_result
+
+
+def make_result(ready_after: int, value: object = "done") -> MagicMock:
+    """A fake AsyncResult that becomes ready on the given poll."""
+    result = MagicMock()
+    result.id = "task-id"
+    result.ready.side_effect = [False] * ready_after + [True]
+    result.get.return_value = value
+    return result
+
+
+@pytest.mark.asyncio
+async def test_await_result_polls_until_ready() -> None:
+    result = make_result(ready_after=3, value={"status": "ok"})
+
+    assert await await_result(result, timeout=1, poll_interval=0.001) == {
+        "status": "ok"
+    }
+    assert result.ready.call_count == 4
+    result.get.assert_called_once_with(propagate=True)
+
+
+@pytest.mark.asyncio
+async def test_await_result_times_out() -> None:
+    result = MagicMock()
+    result.ready.return_value = False
+
+    with pytest.raises(CeleryTimeoutError):
+        await await_result(result, timeout=0.05, poll_interval=0.01)
+    result.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_await_result_does_not_block_event_loop() -> None:
+    """Backend polls run off the loop, so other coroutines keep running."""
+    loop_thread = threading.get_ident()
+    poll_threads = []
+
+    def ready() -> bool:
+        poll_threads.append(threading.get_ident())
+        return len(poll_threads) > 2
+
+    result = MagicMock()
+    result.ready.side_effect = ready
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    await await_result(result, timeout=1, poll_interval=0.01)
+    task.cancel()
+
+    assert ticks > 0
+    assert loop_thread not in poll_threads
@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.backend.core.query_timing import query_origin
+from src.backend.tasks import runtime as task_runtime
+from src.backend.tasks.runtime import (
+    async_task,
+    get_runtime,
+    start_runtime,
+    stop_runtime,
+)
+
+
+@async_task
+async def running_loop(value: int) -> tuple[int, asyncio.AbstractEventLoop]:
+    await asyncio.sleep(0)
+    return value, asyncio.get_running_loop()
+
+
+@pytest.fixture(autouse=True)
+def isolated_runtime():
+    """Leave no runtime behind, including ones started on demand."""
+    yield
+    stop_runtime()
+
+
+@pytest.fixture
+def worker_runtime():
+    # A loop of its own, so closing it never touches the test runner's
+    return start_runtime(loop=asyncio.new_event_loop())
+
+
+def test_start_leaves_the_current_loop_alone() -> None:
+    def start_and_stop() -> tuple[bool, bool]:
+        # The current loop is per thread, so the test runner's is not touched
+        current = asyncio.new_event_loop()
+        asyncio.set_event_loop(current)
+        try:
+            start_runtime()
+            stop_runtime()
+            return asyncio.get_event_loop() is current, current.is_closed()
+        finally:
+            current.close()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        still_current, closed = pool.submit(start_and_stop).result(timeout=5)
+
+    assert still_current
+    assert not closed
+
+
+def test_tasks_share_the_process_loop(worker_runtime) -> None:
+    first, loop = running_loop(1)
+    second, same_loop = running_loop(2)
+
+    assert (first, second) == (1, 2)
+    assert loop is same_loop is worker_runtime.loop
+    assert get_runtime() is worker_runtime
+
+
+def test_stop_closes_the_loop(worker_runtime) -> None:
+    stop_runtime()
+
+    assert worker_runtime.loop.is_closed()
+    assert task_runtime._runtime is None
+    # Started again on demand, e.g. for eager tasks
+    assert running_loop(3)[1] is not worker_runtime.loop
+
+
+def test_background_loop_runs_tasks_concurrently() -> None:
+    runtime = start_runtime(background=True)
+    waiting = []
+
+    @async_task
+    async def wait_for_all(count: int) -> asyncio.AbstractEventLoop:
+        # Only finishes once every task is awaiting at the same time
+        waiting.append(count)
+        while len(waiting) < count:
+            await asyncio.sleep(0.01)
+        return asyncio.get_running_loop()
+
+    try:
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            loops = list(pool.map(wait_for_all, [5] * 5, timeout=5))
+    finally:
+        stop_runtime()
+
+    assert set(loops) == {runtime.loop}
+    assert runtime.loop.is_closed()
+
+
+def test_background_tasks_see_the_callers_context() -> None:
+    start_runtime(background=True)
+
+    @async_task
+    async def origin() -> str:
+        return query_origin.get()
+
+    token = query_origin.set("process_project")
+    try:
+        assert origin() == "process_project"
+    finally:
+        query_origin.reset(token)
@@ -0,0 +1,47 @@
+from prometheus_client import REGISTRY
+
+from src.backend.core.config import settings
+from src.backend.tasks import worker_metrics
+
+
+def test_worker_registry_is_the_default_without_multiprocess_dir(
+    monkeypatch,
+) -> None:
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+    assert worker_metrics.worker_registry() is REGISTRY
+
+
+def test_metrics_server_starts_on_a_clean_multiprocess_dir(
+    monkeypatch, tmp_path
+) -> None:
+    directory = tmp_path / "prometheus"
+    directory.mkdir()
+    (directory / "counter_1234.db").write_bytes(b"stale")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(directory))
+    monkeypatch.setattr(settings, "CELERY_METRICS_PORT", 9808)
+    started = []
+    monkeypatch.setattr(
+        worker_metrics,
+        "start_http_server",
+        lambda port, registry: started.append((port, registry)),
+    )
+
+    worker_metrics.start_metrics_server()
+
+    assert list(directory.iterdir()) == []
+    ((port, registry),) = started
+    assert port == 9808
+    assert registry is not REGISTRY
+
+
+def test_metrics_server_is_off_by_default(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "CELERY_METRICS_PORT", None)
+    started = []
+    monkeypatch.setattr(
+        worker_metrics, "start_http_server", lambda *args, **kwargs: started.append(1)
+    )
+
+    worker_metrics.start_metrics_server()
+
+    assert started == []
@@ -1,6 +1,6 @@
 // src/frontend/lib/api.ts
 import axios from 'axios';
-import type { Project, ProjectCreate, ProjectStatus } from "../types";
+import type { Project, ProjectCreate, ProjectStatus, ProjectStatusEvent } from "../types";
 
 const getApiUrl = () => {
   if (typeof window === 'undefined') {
@@ -26,7 +26,20 @@ export const projectsApi = {
     getProject: async (projectId: string): Promise<Project> => {
         const response = await api.get(`/projects/${projectId}`);
         return response.data;
+    },
+    // Push-based alternative to polling getStatus; returns an unsubscribe function
+    subscribeStatus: (
+        projectIds: string[],
+        onStatus: (event: ProjectStatusEvent) => void,
+    ): (() => void) => {
+        const params = new URLSearchParams();
+        projectIds.forEach((id) => params.append('ids', id));
+        const source = new EventSource(`${getApiUrl()}/projects/status/stream?${params}`);
+        source.addEventListener('status', (event) => {
+            onStatus(JSON.parse((event as MessageEvent).data));
+        });
+        return () => source.close();
     }
 };
 
-export type { Project as ProjectSchema, ProjectCreate, ProjectStatus };
+export type { Project as ProjectSchema, ProjectCreate, ProjectStatus, ProjectStatusEvent };
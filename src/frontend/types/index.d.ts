@@ -17,3 +17,9 @@ export interface Project {
   export interface ProjectStatus {
       status: string;
   }
+
+  export interface ProjectStatusEvent {
+      project_id: string;
+      status: string;
+      updated_at: string;
+  }